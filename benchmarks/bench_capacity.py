@@ -0,0 +1,225 @@
+#!/usr/bin/env python3
+# SPDX-License-Identifier: MIT
+"""
+bench_capacity.py
+-----------------
+Timing benchmarks for the capacity solvers, at several problem sizes:
+- calculate_rebar_forces   : layers per section (linear and Brent solvers)
+- calculate_rebar_forces_batch : sections per batch
+- points_on_pm_diagram / compute_pm_curve : layers per section, points per curve
+- compute_rebar_coordinates : bars per side
+- process_rebar_data        : layers per call (eager and deferred report)
+- manders.solver            : points per call
+
+Results are written as JSON so runs can be compared across commits:
+
+    python benchmarks/bench_capacity.py                    # -> benchmarks/results/<commit>.json
+    python benchmarks/bench_capacity.py --quick -o new.json
+    python benchmarks/bench_capacity.py --compare benchmarks/results/abc1234.json
+
+This code is open-source and licensed under the MIT License.
+"""
+
+import argparse
+import json
+import os
+import platform
+import subprocess
+import sys
+import time
+import timeit
+
+import numpy as np
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+
+from concretedesignpy.beam.moment_capacity import (  # noqa: E402
+    calculate_rebar_forces,
+    calculate_rebar_forces_batch,
+    process_rebar_data,
+)
+from concretedesignpy.section.geometry import (  # noqa: E402
+    compute_pm_curve,
+    compute_rebar_coordinates,
+    points_on_pm_diagram,
+)
+from concretedesignpy.stress_strain.manders import solver  # noqa: E402
+
+RESULTS_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "results")
+
+
+# -----------------------------
+# Problem generators
+# -----------------------------
+def _beam_layers(n_layers, height=600.0):
+    """Rebar list with one compression layer and n_layers - 1 tension layers
+    spread between d = height - 60 and mid-depth, so every size is a real section."""
+    depths = np.linspace(height - 60.0, height / 2.0, n_layers - 1)
+    rebar = [{"d": 60.0, "as": 402.0}]
+    rebar += [{"d": float(d), "as": 2400.0 / (n_layers - 1)} for d in depths]
+    return rebar
+
+
+def _column_layers(n_layers, h=600.0):
+    d_list = list(np.linspace(75.0, h - 75.0, n_layers))
+    as_list = [7740.0 / n_layers] * n_layers
+    return as_list, d_list
+
+
+# -----------------------------
+# Cases: (name, parameter, size, callable)
+# -----------------------------
+def build_cases(quick=False):
+    layer_sizes = (2, 8) if quick else (2, 8, 32)
+    batch_sizes = (100, 1000) if quick else (100, 1000, 10000)
+    curve_sizes = (100, 1000) if quick else (100, 1000, 10000)
+    bar_sizes = (3, 10) if quick else (3, 10, 50)
+    rebar_sizes = (4, 64) if quick else (4, 64, 1024)
+    point_sizes = (1, 1000) if quick else (1, 1000, 100000)
+
+    cases = []
+
+    for n in layer_sizes:
+        rebar = _beam_layers(max(n, 2))
+        for mode in ("linear", "brent"):
+            cases.append((
+                "calculate_rebar_forces", f"solver={mode}", n,
+                lambda rebar=rebar, mode=mode: calculate_rebar_forces(
+                    rebar, 600.0, 300.0, 28.0, 420.0, 200000.0, 0.003, 0.85,
+                    solver=mode, trace="off"),
+            ))
+
+    rng = np.random.default_rng(0)
+    for n in batch_sizes:
+        depths = np.column_stack((np.full(n, 60.0), rng.uniform(440.0, 840.0, n)))
+        areas = np.column_stack((np.full(n, 402.0), rng.uniform(800.0, 3000.0, n)))
+        heights = depths[:, 1] + 60.0
+        cases.append((
+            "calculate_rebar_forces_batch", "layers=2", n,
+            lambda d=depths, a=areas, h=heights: calculate_rebar_forces_batch(
+                d, a, h, 300.0, 28.0, 420.0, 200000.0, 0.003, 0.85),
+        ))
+
+    for n in layer_sizes:
+        as_list, d_list = _column_layers(max(n, 2))
+        cases.append((
+            "points_on_pm_diagram", "layers", n,
+            lambda a=as_list, d=d_list: points_on_pm_diagram(
+                30.0, 420.0, 600.0, 600.0, 0.85, 0.0021, 200000.0, a, d),
+        ))
+
+    as_list, d_list = _column_layers(4)
+    for n in curve_sizes:
+        cases.append((
+            "compute_pm_curve", "points", n,
+            lambda n=n: compute_pm_curve(
+                30.0, 420.0, 600.0, 600.0, 0.85, 200000.0, as_list, d_list, n_points=n),
+        ))
+
+    for n in bar_sizes:
+        cases.append((
+            "compute_rebar_coordinates", "nx=ny", n,
+            lambda n=n: compute_rebar_coordinates(600.0, 600.0, 40.0, 10.0, 25.0, n, n),
+        ))
+
+    for n in rebar_sizes:
+        rebar = [{"d": 50.0 + i, "diam": 20.0, "num": 3} for i in range(n)]
+        for report in (True, False):
+            cases.append((
+                "process_rebar_data", f"report={report}", n,
+                lambda rebar=rebar, report=report: process_rebar_data(rebar, report=report),
+            ))
+
+    for n in point_sizes:
+        xi = np.linspace(0.0, 0.3, n)
+        if n == 1:
+            fn = lambda: solver(0.1, 0.15)  # noqa: E731
+        else:
+            fn = lambda xi=xi: solver(0.1, xi)  # noqa: E731
+        cases.append(("manders.solver", "points", n, fn))
+
+    return cases
+
+
+# -----------------------------
+# Runner
+# -----------------------------
+def time_case(fn, repeat):
+    """Best and median seconds per call, using timeit's autorange loop count."""
+    timer = timeit.Timer(fn)
+    number, _ = timer.autorange()
+    runs = np.array(timer.repeat(repeat=repeat, number=number)) / number
+    return {"best": float(runs.min()), "median": float(np.median(runs)), "number": number}
+
+
+def _git_commit():
+    try:
+        out = subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"],
+            capture_output=True, text=True, check=True,
+            cwd=os.path.dirname(os.path.abspath(__file__)),
+        )
+        return out.stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return "unknown"
+
+
+def run(quick=False, repeat=5, only=None):
+    results = []
+    for name, param, size, fn in build_cases(quick):
+        if only and only not in name:
+            continue
+        timing = time_case(fn, repeat)
+        results.append({"name": name, "param": param, "size": size, **timing})
+        print(f"{name:30s} {param:14s} {size:>7d}  {timing['best'] * 1e6:12.2f} us")
+    return {
+        "meta": {
+            "commit": _git_commit(),
+            "timestamp": time.strftime("%Y-%m-%dT%H:%M:%S"),
+            "python": platform.python_version(),
+            "numpy": np.__version__,
+            "machine": platform.machine(),
+            "platform": platform.platform(),
+            "quick": quick,
+            "repeat": repeat,
+        },
+        "results": results,
+    }
+
+
+def compare(current, baseline):
+    """Print best-time ratios (current / baseline) for matching cases."""
+    base = {(r["name"], r["param"], r["size"]): r for r in baseline["results"]}
+    print(f"\nvs {baseline['meta']['commit']} (ratio < 1 is faster)")
+    for r in current["results"]:
+        key = (r["name"], r["param"], r["size"])
+        if key in base:
+            ratio = r["best"] / base[key]["best"]
+            print(f"{r['name']:30s} {r['param']:14s} {r['size']:>7d}  x{ratio:6.2f}")
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("-o", "--output", help="JSON output path "
+                        "(default: benchmarks/results/<commit>.json)")
+    parser.add_argument("--compare", help="baseline JSON to compare against")
+    parser.add_argument("--quick", action="store_true", help="smaller sizes only")
+    parser.add_argument("--repeat", type=int, default=5, help="timing repeats per case")
+    parser.add_argument("--only", help="run only cases whose name contains this text")
+    args = parser.parse_args(argv)
+
+    current = run(quick=args.quick, repeat=args.repeat, only=args.only)
+
+    output = args.output or os.path.join(RESULTS_DIR, f"{current['meta']['commit']}.json")
+    os.makedirs(os.path.dirname(os.path.abspath(output)), exist_ok=True)
+    with open(output, "w", encoding="utf-8") as fh:
+        json.dump(current, fh, indent=2)
+    print(f"\nwrote {output}")
+
+    if args.compare:
+        with open(args.compare, encoding="utf-8") as fh:
+            compare(current, json.load(fh))
+
+
+if __name__ == "__main__":
+    main()
@@ -1 +1,22 @@
-from .general import area_diam, steel_area, area_ratio
\ No newline at end of file
+import importlib
+import os
+
+from .general import area_diam, steel_area, area_ratio
+
+# Submodules are imported on first attribute access, so `import concretedesignpy`
+# stays cheap and plotting (matplotlib) is only loaded when it is used.
+_SUBMODULES = (
+    "beam", "crfp", "section", "stress_strain",
+    "provision", "report", "plotting", "profiling",
+)
+
+
+def __getattr__(name):
+    if name in _SUBMODULES:
+        return importlib.import_module(f".{name}", __name__)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+# CONCRETEDESIGNPY_PROFILE=1 instruments the hot paths for the whole run.
+if os.environ.get("CONCRETEDESIGNPY_PROFILE"):
+    importlib.import_module(".profiling", __name__)
@@ -0,0 +1,265 @@
+# SPDX-License-Identifier: MIT
+"""
+deflection.py
+-------------
+Cracked transformed section and effective moment of inertia (Ie) of
+rectangular beams, vectorized over many beams and service moments:
+- cracked_section_batch   : kd and Icr of the cracked transformed section
+- effective_inertia_batch : Ig, Mcr, Icr and Ie (Branson or Bischoff) for
+                            every beam and load case, with the long-term
+                            multiplier lambda_delta
+- long_term_factor        : time-dependent factor xi for sustained loads
+- modular_ratio           : n = Es / Ec, rounded up with a minimum of 6
+
+Rebar layers use the padded (N x max_layers) depth/area matrices of
+`pack_rebar_layers`, so the rebar lists of `process_rebar_data` can be used
+directly.
+
+References:
+- NSCP 2015 / ACI 318: Eq. 424.2.3.5a (Ie, Branson), Table 424.2.4.1.3
+  (time-dependent factor), ACI 318-19 Table 24.2.3.5 (Ie, Bischoff).
+
+This code is open-source and licensed under the MIT License.
+"""
+
+import numpy as np
+
+from concretedesignpy.section.geometry import compute_section_properties_rect
+
+# NSCP 2015 Table 424.2.4.1.3, sustained load duration (months) -> xi
+_LONG_TERM_MONTHS = np.array([3.0, 6.0, 12.0, 60.0])
+_LONG_TERM_XI = np.array([1.0, 1.2, 1.4, 2.0])
+
+
+def modular_ratio(es, ec, minimum=6):
+    """
+    Modular ratio n = Es / Ec rounded up to a whole number, not less than `minimum`.
+
+    Parameters
+    ----------
+    es, ec : float or array_like
+        Moduli of elasticity of steel and concrete (MPa).
+    minimum : int, optional
+        Lower limit of n. Default=6.
+
+    Returns
+    -------
+    float or ndarray
+    """
+    return np.maximum(np.ceil(np.asarray(es, dtype=float) / ec), minimum)
+
+
+def long_term_factor(months):
+    """
+    Time-dependent factor xi for sustained loads (NSCP 2015 Table 424.2.4.1.3).
+
+    Parameters
+    ----------
+    months : float or array_like
+        Duration of the sustained load in months (>= 3). Values between the
+        tabulated 3, 6, 12 and 60 months are interpolated linearly; 60 months
+        or more gives 2.0.
+
+    Returns
+    -------
+    float or ndarray
+    """
+    months = np.asarray(months, dtype=float)
+    if np.any(months < 3):
+        raise ValueError("Sustained load duration must be at least 3 months.")
+    xi = np.interp(months, _LONG_TERM_MONTHS, _LONG_TERM_XI)
+    return float(xi) if xi.ndim == 0 else xi
+
+
+def cracked_section_batch(depths, areas, beam_width, n, max_iterations=None):
+    """
+    Neutral axis depth kd and cracked moment of inertia Icr of N rectangular beams.
+
+    Layers below the neutral axis are transformed with n * As, layers above it
+    with (n - 1) * As (displaced concrete deducted). Because that split depends
+    on kd, the quadratic for kd is re-solved until no layer changes side.
+
+    Parameters
+    ----------
+    depths : array_like, shape (N, max_layers)
+        Rebar layer depths from the top of each beam (mm).
+    areas : array_like, shape (N, max_layers)
+        Rebar layer areas (mm²). Pad unused layers with 0 (or NaN).
+    beam_width : float or array_like, shape (N,)
+        Beam width b (mm).
+    n : float or array_like, shape (N,)
+        Modular ratio Es / Ec.
+    max_iterations : int, optional
+        Cap on the re-classification passes. Default: max_layers + 1.
+
+    Returns
+    -------
+    dict
+        {
+            "kd": (N,) cracked neutral axis depth from the top (mm),
+            "icr": (N,) cracked transformed moment of inertia (mm^4),
+            "compression": (N, max_layers) bool, layers above kd,
+            "iterations": int, passes taken
+        }
+    """
+    areas = np.nan_to_num(np.atleast_2d(np.asarray(areas, dtype=float)))
+    depths = np.nan_to_num(np.atleast_2d(np.asarray(depths, dtype=float)))
+    if depths.shape != areas.shape:
+        raise ValueError("depths and areas must have the same (N, max_layers) shape.")
+    n_beams = depths.shape[0]
+    beam_width, n = (
+        np.broadcast_to(np.asarray(v, dtype=float), (n_beams,)) for v in (beam_width, n)
+    )
+    if np.any(beam_width <= 0):
+        raise ValueError("beam_width must be positive.")
+    if np.any(n <= 1):
+        raise ValueError("Modular ratio n must be greater than 1.")
+    if max_iterations is None:
+        max_iterations = depths.shape[1] + 1
+
+    # b kd² / 2 + Σ nA (kd - d) = 0, starting with every layer in tension
+    compression = np.zeros(depths.shape, dtype=bool)
+    iterations = 0
+    while True:
+        n_layer = np.where(compression, n[:, None] - 1.0, n[:, None]) * areas
+        sum_a = n_layer.sum(axis=1)
+        sum_ad = (n_layer * depths).sum(axis=1)
+        kd = (-sum_a + np.sqrt(sum_a ** 2 + 2.0 * beam_width * sum_ad)) / beam_width
+        iterations += 1
+        updated = (depths < kd[:, None]) & (areas > 0)
+        if np.array_equal(updated, compression) or iterations >= max_iterations:
+            break
+        compression = updated
+
+    icr = beam_width * kd ** 3 / 3.0 + (n_layer * (depths - kd[:, None]) ** 2).sum(axis=1)
+    return {
+        "kd": kd,
+        "icr": icr,
+        "compression": compression,
+        "iterations": iterations,
+    }
+
+
+def effective_inertia_batch(
+    depths,
+    areas,
+    beam_width,
+    beam_height,
+    fc,
+    ma,
+    es=200000.0,
+    ec=None,
+    n=None,
+    lam=1.0,
+    method="branson",
+    sustained_months=None
+):
+    """
+    Effective moment of inertia of N rectangular beams under service moments.
+
+    Parameters
+    ----------
+    depths, areas : array_like, shape (N, max_layers)
+        Rebar layers as in `cracked_section_batch` (see `pack_rebar_layers`).
+    beam_width, beam_height : float or array_like, shape (N,)
+        Beam width b and total height h (mm).
+    fc : float or array_like, shape (N,)
+        Concrete compressive strength (MPa).
+    ma : array_like, shape (N,) or (N, n_cases)
+        Service moments (N·mm), one column per load case. The sign is ignored.
+    es : float or array_like, optional
+        Steel modulus of elasticity (MPa). Default=200000.
+    ec : float or array_like, optional
+        Concrete modulus of elasticity (MPa). Default: 4700 * sqrt(fc).
+    n : float or array_like, optional
+        Modular ratio. Default: es / ec (use `modular_ratio` for the rounded value).
+    lam : float or array_like, optional
+        Lightweight concrete factor lambda for fr = 0.62 * lam * sqrt(fc). Default=1.0.
+    method : str, optional
+        "branson" : Ie = (Mcr/Ma)³ Ig + [1 - (Mcr/Ma)³] Icr <= Ig (Eq. 424.2.3.5a).
+        "bischoff": Ie = Icr / {1 - [(2/3) Mcr / Ma]² (1 - Icr/Ig)} <= Ig
+                    (ACI 318-19). Default="branson".
+    sustained_months : float or array_like, optional
+        Sustained load duration; if given, the long-term multiplier
+        lambda_delta = xi / (1 + 50 rho') is returned, with rho' = As' / (b d)
+        from the layers above kd and d the depth of the deepest layer.
+
+    Returns
+    -------
+    dict
+        {
+            "ig": (N,) gross moment of inertia (mm^4),
+            "mcr": (N,) cracking moment (N·mm),
+            "kd": (N,) cracked neutral axis depth (mm),
+            "icr": (N,) cracked moment of inertia (mm^4),
+            "n": (N,) modular ratio used,
+            "ie": shape of `ma`, effective moment of inertia (mm^4),
+            "cracked": shape of `ma`, bool, True where Ie < Ig: |Ma| > Mcr
+                       ("branson") or |Ma| > (2/3) Mcr ("bischoff"),
+            "rho_prime": (N,) compression steel ratio,
+            "lambda_delta": (N,) long-term multiplier, or None
+        }
+    """
+    if method not in ("branson", "bischoff"):
+        raise ValueError("method must be 'branson' or 'bischoff'.")
+
+    depths = np.nan_to_num(np.atleast_2d(np.asarray(depths, dtype=float)))
+    areas = np.nan_to_num(np.atleast_2d(np.asarray(areas, dtype=float)))
+    n_beams = depths.shape[0]
+    beam_width, beam_height, fc, es, lam = (
+        np.broadcast_to(np.asarray(v, dtype=float), (n_beams,))
+        for v in (beam_width, beam_height, fc, es, lam)
+    )
+    if np.any(fc <= 0):
+        raise ValueError("fc must be positive.")
+    if np.any(beam_height <= 0):
+        raise ValueError("beam_height must be positive.")
+    ec = 4700.0 * np.sqrt(fc) if ec is None else np.broadcast_to(ec, (n_beams,))
+    n = es / ec if n is None else np.broadcast_to(np.asarray(n, dtype=float), (n_beams,))
+
+    # --- 1) Gross section and cracking moment ---
+    gross = compute_section_properties_rect(beam_width, beam_height)
+    ig = gross["moment_interia"]["x"]
+    fr = 0.62 * lam * np.sqrt(fc)
+    mcr = fr * ig / (beam_height / 2.0)
+
+    # --- 2) Cracked transformed section ---
+    cracked = cracked_section_batch(depths, areas, beam_width, n)
+    kd, icr = cracked["kd"], cracked["icr"]
+
+    # --- 3) Effective inertia for every load case ---
+    ma = np.abs(np.asarray(ma, dtype=float))
+    if ma.shape[:1] != (n_beams,) or ma.ndim > 2:
+        raise ValueError("ma must have shape (N,) or (N, n_cases).")
+    col = (slice(None), None) if ma.ndim == 2 else slice(None)
+    ig_c, icr_c, mcr_c = ig[col], icr[col], mcr[col]
+
+    m_threshold = mcr_c if method == "branson" else (2.0 / 3.0) * mcr_c
+    with np.errstate(divide="ignore", invalid="ignore"):
+        if method == "branson":
+            ratio = np.minimum((mcr_c / ma) ** 3, 1.0)
+            ie = ratio * ig_c + (1.0 - ratio) * icr_c
+        else:
+            ratio = np.minimum((2.0 / 3.0) * mcr_c / ma, 1.0)
+            ie = icr_c / (1.0 - ratio ** 2 * (1.0 - icr_c / ig_c))
+    ie = np.where(ma > 0, np.minimum(ie, ig_c), ig_c)
+
+    # --- 4) Long-term multiplier ---
+    d = np.where(areas > 0, depths, 0.0).max(axis=1)
+    as_prime = np.where(cracked["compression"], areas, 0.0).sum(axis=1)
+    rho_prime = as_prime / (beam_width * d)
+    lambda_delta = None
+    if sustained_months is not None:
+        lambda_delta = long_term_factor(sustained_months) / (1.0 + 50.0 * rho_prime)
+
+    return {
+        "ig": ig,
+        "mcr": mcr,
+        "kd": kd,
+        "icr": icr,
+        "n": n,
+        "ie": ie,
+        "cracked": ma > m_threshold,
+        "rho_prime": rho_prime,
+        "lambda_delta": lambda_delta,
+    }
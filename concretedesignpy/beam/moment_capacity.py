@@ -29,9 +29,22 @@ its associated factors following (primarily) RC Concrete Moment Capacity.
 """
 
 import numpy as np
-import concretedesignpy as gen  
+from concretedesignpy import profiling
+from concretedesignpy.report import DeferredReport
 
-def process_rebar_data(rebar_list):
+def _rebar_data_report(ds, diams, nums, areas):
+    lines = ["rebar data (d, diam, num, as):"]
+    for i in range(len(ds)):
+        lines.append(
+            f"  d={ds[i]:7.2f}, "
+            f"diam={diams[i]:5.2f}, "
+            f"num={nums[i]:2d}, "
+            f"as={areas[i]:10.2f}"
+        )
+    return "\n".join(lines)
+
+
+def process_rebar_data(rebar_list, report=True, verbose=False):
     """
     Parameters
     ----------
@@ -46,6 +59,11 @@ def process_rebar_data(rebar_list):
                 {"d": 342, "diam": 16, "num": 3},
                 ...
             ]
+    report : bool, optional
+        If True (default), "report" is formatted immediately. If False, it is a
+        DeferredReport that is only formatted when converted to str.
+    verbose : bool, optional
+        If True, print the distance, diameter and count arrays. Default=False.
     
     Returns
     -------
@@ -56,46 +74,45 @@ def process_rebar_data(rebar_list):
             A list of dictionaries with the same fields as input plus an additional key:
                 - "as" (float): The computed cross-sectional area of the rebars.
             
-        "report" : str
+        "report" : str or DeferredReport
             A human-readable multi-line string summarizing the computed values for each entry.
+
+    Raises
+    ------
+    ValueError
+        If any diameter or bar count is not positive.
     """
     # Extract columns into NumPy arrays.
     ds    = np.array([r["d"]    for r in rebar_list], dtype=float)
     diams = np.array([r["diam"] for r in rebar_list], dtype=float)
     nums  = np.array([r["num"]  for r in rebar_list],  dtype=int)
 
-    print("Distances:", ds)
-    print("Diameters:", diams)
-    print("Counts:   ", nums)
+    if verbose:
+        print("Distances:", ds)
+        print("Diameters:", diams)
+        print("Counts:   ", nums)
 
-    area_diam_vectorized = np.vectorize(gen.area_diam)
-    steel_area_vectorized = np.vectorize(gen.steel_area)
-    
-    area_each = area_diam_vectorized(diams)
-    areas = steel_area_vectorized(area_each, nums)
+    # Same guard clauses as general.area_diam / general.steel_area, for all rows at once.
+    if np.any(diams <= 0):
+        raise ValueError("Diameter must be positive.")
+    if np.any(nums <= 0):
+        raise ValueError("Number of bars must be positive.")
 
-    # Build output list and report.
-    processed = []
-    lines = ["rebar data (d, diam, num, as):"]
+    areas = (np.pi / 4) * diams ** 2 * nums
 
-    for i in range(len(rebar_list)):
-        item = {
-            "d": ds[i],
-            "diam": diams[i],
-            "num": nums[i],
-            "as": areas[i]
-        }
-        processed.append(item)
-        lines.append(
-            f"  d={ds[i]:7.2f}, "
-            f"diam={diams[i]:5.2f}, "
-            f"num={nums[i]:2d}, "
-            f"as={areas[i]:10.2f}"
-        )
+    processed = [
+        {"d": ds[i], "diam": diams[i], "num": nums[i], "as": areas[i]}
+        for i in range(len(rebar_list))
+    ]
+
+    if report:
+        rep = _rebar_data_report(ds, diams, nums, areas)
+    else:
+        rep = DeferredReport(_rebar_data_report, ds, diams, nums, areas)
 
     return {
         "value": processed,
-        "report": "\n".join(lines)
+        "report": rep
     }
 
 
@@ -214,6 +231,114 @@ def process_rebar_data(rebar_list):
 #         "ratio": ratio_final
 #     }
 
+class SolverTrace:
+    """
+    Array-backed iteration record of the neutral-axis solver.
+
+    Rows are stored in preallocated NumPy arrays (forces in N) and are only
+    converted to the kN dict rows of `iteration_data` when read. Indexing,
+    slicing, iteration and len() behave like the former list of dicts, e.g.
+    ``trace[-5:]`` returns the last five rows as dicts.
+    """
+
+    __slots__ = ("_pass", "_iteration", "_x", "_fc_concrete", "_fc_rebar",
+                 "_fs_rebar", "_size")
+
+    def __init__(self, capacity=64):
+        capacity = max(int(capacity), 1)
+        self._pass = np.empty(capacity, dtype=np.int32)
+        self._iteration = np.empty(capacity, dtype=np.int32)
+        self._x = np.empty(capacity, dtype=float)
+        self._fc_concrete = np.empty(capacity, dtype=float)
+        self._fc_rebar = np.empty(capacity, dtype=float)
+        self._fs_rebar = np.empty(capacity, dtype=float)
+        self._size = 0
+
+    def append(self, pass_no, iteration, x, f_concrete, fc_rebar, fs_rebar):
+        """Record one force evaluation (forces in N)."""
+        if self._size == self._x.shape[0]:
+            for name in ("_pass", "_iteration", "_x", "_fc_concrete",
+                         "_fc_rebar", "_fs_rebar"):
+                old = getattr(self, name)
+                grown = np.empty(2 * old.shape[0], dtype=old.dtype)
+                grown[:self._size] = old
+                setattr(self, name, grown)
+        k = self._size
+        self._pass[k] = pass_no
+        self._iteration[k] = iteration
+        self._x[k] = x
+        self._fc_concrete[k] = f_concrete
+        self._fc_rebar[k] = fc_rebar
+        self._fs_rebar[k] = fs_rebar
+        self._size = k + 1
+
+    def __len__(self):
+        return self._size
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return [self._row(k) for k in range(*index.indices(self._size))]
+        if index < 0:
+            index += self._size
+        if not 0 <= index < self._size:
+            raise IndexError("SolverTrace index out of range")
+        return self._row(index)
+
+    def __iter__(self):
+        for k in range(self._size):
+            yield self._row(k)
+
+    def _row(self, k):
+        f_concrete = float(self._fc_concrete[k])
+        fc_rebar = float(self._fc_rebar[k])
+        f_tens = float(self._fs_rebar[k])
+        f_comp = f_concrete + fc_rebar
+        return {
+            "pass": int(self._pass[k]),
+            "iteration": int(self._iteration[k]),
+            "x": float(self._x[k]),
+            "fc_concrete_kN": f_concrete / 1000.0,
+            "fc_rebar_kN": fc_rebar / 1000.0,
+            "fs_rebar_kN": f_tens / 1000.0,
+            "fci_kN": f_comp / 1000.0,
+            "ratio": f_comp / f_tens if f_tens != 0 else float("inf")
+        }
+
+    def as_arrays(self):
+        """Return the recorded columns as NumPy arrays (forces in N)."""
+        n = self._size
+        return {
+            "pass": self._pass[:n].copy(),
+            "iteration": self._iteration[:n].copy(),
+            "x": self._x[:n].copy(),
+            "fc_concrete": self._fc_concrete[:n].copy(),
+            "fc_rebar": self._fc_rebar[:n].copy(),
+            "fs_rebar": self._fs_rebar[:n].copy()
+        }
+
+    def to_records(self):
+        """Return the trace as the list-of-dicts `iteration_data` format (kN)."""
+        return list(self)
+
+    def to_dataframe(self):
+        """Return the trace as a pandas DataFrame (kN). Requires pandas."""
+        import pandas as pd
+        return pd.DataFrame(self.to_records())
+
+
+def _trace_output(trace_level, trace, passes, evaluations, residual):
+    """Build the `iteration_data` entry for the requested trace level."""
+    if trace_level == "full":
+        return trace
+    if trace_level == "summary":
+        return {
+            "passes": passes,
+            "evaluations": evaluations,
+            "residual": residual
+        }
+    return None
+
+
 def calculate_rebar_forces(
     rebar_list,
     beam_height,
@@ -224,7 +349,10 @@ def calculate_rebar_forces(
     ecu,
     beta_one,
     alpha_2=0.85,
-    max_outer_iterations=50
+    max_outer_iterations=50,
+    solver="linear",
+    tol=0.1,
+    trace="full"
 ):
     """
     Calculate the neutral axis depth, concrete compressive force, steel compressive force,
@@ -258,19 +386,45 @@ def calculate_rebar_forces(
     alpha_2 : float, optional
         Factor for the equivalent concrete stress block (unitless). Default=0.85.
     max_outer_iterations : int, optional
-        Maximum number of outer iterations for refining the step size. Default=50.
+        Maximum number of outer iterations for refining the step size. Default=50;
+        must be at least 1.
+        For the bracketing solvers this is the iteration cap after bracketing.
+    solver : str, optional
+        Root-finding strategy for the neutral axis. Default="linear".
+          - "linear"    : the original step-down search from beam_height in
+                          beam_height / max_outer_iterations steps.
+          - "bisection" : brackets the sign change of (compression - tension)
+                          on (0, beam_height] and halves it down to `tol`.
+          - "brent"     : same bracket, converged with Brent's method
+                          (secant / inverse quadratic steps, bisection fallback).
+    tol : float, optional
+        Tolerance on the neutral-axis depth x (mm) for the bracketing solvers.
+        Default=0.1.
+    trace : str, optional
+        Level of iteration record kept in "iteration_data". Default="full".
+          - "full"    : a `SolverTrace` with one row per force evaluation.
+                        It behaves like a list of dicts (len, indexing,
+                        slicing, iteration); `as_arrays()` gives the columns
+                        as NumPy arrays and `to_records()` a plain list.
+          - "summary" : a dict with the number of passes and evaluations and
+                        the residual, compression - tension (N), at the
+                        returned neutral axis (None if none was found).
+          - "off"     : None; nothing is recorded.
 
     Returns
     -------
     dict
         {
-            "iteration_data": List of iteration records (each is a dict with pass, iteration,
-                              x, fc_concrete_kN, fc_rebar_kN, fs_rebar_kN, fci_kN, ratio),
+            "iteration_data": Iteration record according to `trace` (for "full", a
+                              `SolverTrace` whose rows are dicts with pass,
+                              iteration, x, fc_concrete_kN, fc_rebar_kN,
+                              fs_rebar_kN, fci_kN, ratio),
             "neutral_axis": float or None,
             "fc_concrete": float,
             "fc_rebar": float,
             "fs_rebar": float,
-            "ratio": float or None
+            "ratio": float or None,
+            "evaluations": int, number of force evaluations used
         }
 
     Notes
@@ -279,10 +433,24 @@ def calculate_rebar_forces(
     - The solver tries to find x such that total compression = total tension by
       iteratively decreasing x from beam_height down to near 0, then refining step
       when crossing from compression > tension to compression <= tension.
+    - The bracketing solvers use the fact that (compression - tension) increases
+      monotonically with x. If it does not change sign on (0, beam_height],
+      neutral_axis is returned as None, as with the linear search.
     - Because es, ecu, and beta_one are dimensionless, ensure es indeed produces
       stress in MPa when multiplied by strain.
     """
 
+    if solver not in ("linear", "bisection", "brent"):
+        raise ValueError("solver must be 'linear', 'bisection' or 'brent'.")
+    if solver != "linear" and tol <= 0:
+        raise ValueError("tol must be positive.")
+    if trace not in ("full", "summary", "off"):
+        raise ValueError("trace must be 'full', 'summary' or 'off'.")
+    if max_outer_iterations < 1:
+        raise ValueError("max_outer_iterations must be at least 1.")
+
+    evaluations = 0
+
     def _compute_forces_at_x(x):
         """
         Compute total compression (f_comp) and tension (f_tens) at a given neutral-axis depth x.
@@ -294,6 +462,9 @@ def calculate_rebar_forces(
         f_tens : float (N)
             Sum of tension steel.
         """
+        nonlocal evaluations
+        evaluations += 1
+
         # 1) Steel forces
         fcsi_rebar = 0.0  # compression steel
         fsi_rebar = 0.0   # tension steel
@@ -330,10 +501,22 @@ def calculate_rebar_forces(
 
         return f_comp, f_tens, f_concrete, fcsi_rebar, fsi_rebar
 
+    _compute_forces_at_x = profiling.wrap(
+        "moment_capacity.calculate_rebar_forces._compute_forces_at_x", _compute_forces_at_x
+    )
+
     # Initial setup
-    iteration_data = []
     pass_count = 1
 
+    if solver != "linear":
+        return _solve_bracketed(
+            _compute_forces_at_x, beam_height, solver, tol,
+            max_outer_iterations, trace
+        )
+
+    recorder = SolverTrace(max_outer_iterations) if trace == "full" else None
+    residual_final = None
+
     # We start from x close to the full beam height (dt)
     x_current = beam_height
     # We'll move in roughly equal steps
@@ -368,16 +551,9 @@ def calculate_rebar_forces(
 
         ratio = f_comp / f_tens if f_tens != 0 else float("inf")
 
-        iteration_data.append({
-            "pass": pass_count,
-            "iteration": i + 1,
-            "x": x_current,
-            "fc_concrete_kN": f_concrete / 1000.0,
-            "fc_rebar_kN": fc_rebar / 1000.0,
-            "fs_rebar_kN": fs_rebar / 1000.0,
-            "fci_kN": f_comp / 1000.0,  # total compression in kN
-            "ratio": ratio
-        })
+        if recorder is not None:
+            recorder.append(pass_count, i + 1, x_current,
+                            f_concrete, fc_rebar, fs_rebar)
 
         # If we're not refining the step anymore, check if we've found a solution
         if not update_step:
@@ -388,6 +564,7 @@ def calculate_rebar_forces(
                 fcsi_final = fc_rebar
                 fsi_final = fs_rebar
                 ratio_final = ratio
+                residual_final = f_comp - f_tens
                 break
         else:
             # If we are still coarse-searching...
@@ -399,6 +576,7 @@ def calculate_rebar_forces(
                 fcsi_final = fc_rebar
                 fsi_final = fs_rebar
                 ratio_final = ratio
+                residual_final = f_comp - f_tens
 
                 # Stop coarse searching; refine step
                 update_step = False
@@ -406,21 +584,335 @@ def calculate_rebar_forces(
                 # Revert x by adding step (go back to the last iteration's x)
                 x_current += step_size
 
-                # Now make step_size smaller (refinement)
+                # Now make step_size smaller (refinement); the refinement
+                # pass uses the remaining iterations of the same loop
                 step_size /= max_outer_iterations
-
-                # We'll start again from i = -1 so that next loop iteration is i=0
                 pass_count += 1
-                i = -1
-                continue  # jump to next iteration after resetting i
 
     return {
-        "iteration_data": iteration_data,
+        "iteration_data": _trace_output(
+            trace, recorder, pass_count, evaluations, residual_final
+        ),
         "neutral_axis": x_output,
         "fc_concrete": fcc_final,
         "fc_rebar": fcsi_final,
         "fs_rebar": fsi_final,
-        "ratio": ratio_final
+        "ratio": ratio_final,
+        "evaluations": evaluations
+    }
+
+
+def _solve_bracketed(compute_forces, beam_height, solver, tol, max_iterations,
+                     trace):
+    """
+    Bracketing neutral-axis search used by `calculate_rebar_forces`.
+
+    The residual g(x) = compression - tension is negative for a vanishing
+    x (the tension steel yields while the block has no depth) and positive at
+    x = beam_height for any under-reinforced section, so (0, beam_height]
+    brackets the root.
+    """
+    cache = {}
+    evaluations = 0
+    recorder = SolverTrace(max_iterations + 2) if trace == "full" else None
+
+    def residual(x):
+        nonlocal evaluations
+        evaluations += 1
+        forces = compute_forces(x)
+        cache[x] = forces
+        f_comp, f_tens, f_concrete, fc_rebar, fs_rebar = forces
+        if recorder is not None:
+            recorder.append(1, evaluations, x, f_concrete, fc_rebar, fs_rebar)
+        return f_comp - f_tens
+
+    x_lo = min(tol, beam_height) * 1e-3
+    x_hi = beam_height
+    g_lo = residual(x_lo)
+    g_hi = residual(x_hi)
+
+    x_output = None
+    if g_lo < 0 <= g_hi:
+        if solver == "bisection":
+            x_output = _bisect_root(residual, x_lo, x_hi, g_lo, tol, max_iterations)
+        else:
+            x_output = _brent_root(residual, x_lo, x_hi, g_lo, g_hi, tol, max_iterations)
+
+    if x_output is None:
+        return {
+            "iteration_data": _trace_output(
+                trace, recorder, 1, evaluations, None
+            ),
+            "neutral_axis": None,
+            "fc_concrete": 0.0,
+            "fc_rebar": 0.0,
+            "fs_rebar": 0.0,
+            "ratio": None,
+            "evaluations": evaluations
+        }
+
+    f_comp, f_tens, f_concrete, fc_rebar, fs_rebar = cache[x_output]
+
+    return {
+        "iteration_data": _trace_output(
+            trace, recorder, 1, evaluations, f_comp - f_tens
+        ),
+        "neutral_axis": x_output,
+        "fc_concrete": f_concrete,
+        "fc_rebar": fc_rebar,
+        "fs_rebar": fs_rebar,
+        "ratio": f_comp / f_tens if f_tens != 0 else float("inf"),
+        "evaluations": evaluations
+    }
+
+
+def _bisect_root(func, x_lo, x_hi, f_lo, tol, max_iterations):
+    """
+    Bisection on a bracket [x_lo, x_hi] with func(x_lo) < 0 <= func(x_hi).
+    Returns the midpoint of the final bracket, which is an evaluated point.
+    """
+    x_mid = 0.5 * (x_lo + x_hi)
+    for _ in range(max_iterations):
+        x_mid = 0.5 * (x_lo + x_hi)
+        f_mid = func(x_mid)
+        if f_mid == 0.0:
+            break
+        if (f_mid < 0) == (f_lo < 0):
+            x_lo, f_lo = x_mid, f_mid
+        else:
+            x_hi = x_mid
+        if (x_hi - x_lo) <= tol:
+            break
+    return x_mid
+
+
+def _brent_root(func, x_a, x_b, f_a, f_b, tol, max_iterations):
+    """
+    Brent's method (as in scipy.optimize.brentq) on a bracket with
+    func(x_a) and func(x_b) of opposite sign. Returns an evaluated point
+    within `tol` of the root.
+    """
+    x_pre, x_cur = x_a, x_b
+    f_pre, f_cur = f_a, f_b
+    x_blk, f_blk = 0.0, 0.0
+    s_pre = s_cur = 0.0
+
+    for _ in range(max_iterations):
+        if f_pre != 0 and f_cur != 0 and (f_pre < 0) != (f_cur < 0):
+            x_blk, f_blk = x_pre, f_pre
+            s_pre = s_cur = x_cur - x_pre
+        if abs(f_blk) < abs(f_cur):
+            x_pre, x_cur, x_blk = x_cur, x_blk, x_cur
+            f_pre, f_cur, f_blk = f_cur, f_blk, f_cur
+
+        delta = tol / 2.0
+        s_bis = (x_blk - x_cur) / 2.0
+        if f_cur == 0 or abs(s_bis) < delta:
+            break
+
+        if abs(s_pre) > delta and abs(f_cur) < abs(f_pre):
+            if x_pre == x_blk:
+                # secant step
+                s_try = -f_cur * (x_cur - x_pre) / (f_cur - f_pre)
+            else:
+                # inverse quadratic interpolation
+                d_pre = (f_pre - f_cur) / (x_pre - x_cur)
+                d_blk = (f_blk - f_cur) / (x_blk - x_cur)
+                s_try = -f_cur * (f_blk * d_blk - f_pre * d_pre) / (
+                    d_blk * d_pre * (f_blk - f_pre)
+                )
+            if 2.0 * abs(s_try) < min(abs(s_pre), 3.0 * abs(s_bis) - delta):
+                s_pre, s_cur = s_cur, s_try
+            else:
+                s_pre = s_cur = s_bis
+        else:
+            s_pre = s_cur = s_bis
+
+        x_pre, f_pre = x_cur, f_cur
+        if abs(s_cur) > delta:
+            x_cur += s_cur
+        else:
+            x_cur += delta if s_bis > 0 else -delta
+        f_cur = func(x_cur)
+
+    return x_cur
+
+
+def pack_rebar_layers(rebar_lists):
+    """
+    Pack per-beam rebar lists into padded (N x max_layers) depth/area matrices.
+
+    Parameters
+    ----------
+    rebar_lists : list of list of dict
+        One rebar list per beam, in the format used by `calculate_rebar_forces`
+        (each dict has "d" in mm and "as" in mm², e.g. the "value" list of
+        `process_rebar_data`).
+
+    Returns
+    -------
+    depths, areas : ndarray, ndarray
+        Arrays of shape (N, max_layers). Unused trailing slots have zero area
+        (and zero depth), so they contribute no force.
+    """
+    n_beams = len(rebar_lists)
+    max_layers = max((len(bars) for bars in rebar_lists), default=0)
+    depths = np.zeros((n_beams, max_layers), dtype=float)
+    areas = np.zeros((n_beams, max_layers), dtype=float)
+    for i, bars in enumerate(rebar_lists):
+        for j, bar in enumerate(bars):
+            depths[i, j] = bar["d"]
+            areas[i, j] = bar["as"]
+    return depths, areas
+
+
+def _layer_forces_batch(x, depths, areas, fy, es, ecu):
+    """
+    Steel layer forces (N, always positive) and a compression mask for a
+    vector of neutral-axis depths x, one per beam (row).
+    """
+    x_col = x[:, None]
+    compression = depths < x_col
+    strain_s = np.abs(x_col - depths) / x_col * ecu[:, None]
+    force_s = areas * np.minimum(strain_s * es[:, None], fy[:, None])
+    return compression, force_s
+
+
+def _compute_forces_batch(x, depths, areas, beam_width, fc, fy, es, ecu,
+                          beta_one, alpha_2):
+    """
+    Vectorized counterpart of the force evaluation in `calculate_rebar_forces`.
+    """
+    compression, force_s = _layer_forces_batch(x, depths, areas, fy, es, ecu)
+    fc_rebar = np.where(compression, force_s, 0.0).sum(axis=1)
+    fs_rebar = np.where(compression, 0.0, force_s).sum(axis=1)
+    f_concrete = alpha_2 * fc * beta_one * x * beam_width
+
+    return f_concrete + fc_rebar, fs_rebar, f_concrete, fc_rebar, fs_rebar
+
+
+def calculate_rebar_forces_batch(
+    depths,
+    areas,
+    beam_height,
+    beam_width,
+    fc,
+    fy,
+    es,
+    ecu,
+    beta_one,
+    alpha_2=0.85,
+    tol=0.1,
+    max_iterations=60
+):
+    """
+    Batch counterpart of `calculate_rebar_forces` for N rectangular beams.
+
+    All neutral axes are solved at once by vectorized bisection on the sign
+    change of (compression - tension) over (0, beam_height], using the same
+    force model as the scalar function (Whitney block, steel stress limited
+    to fy).
+
+    Parameters
+    ----------
+    depths : array_like, shape (N, max_layers)
+        Rebar layer depths from the top of each beam (mm).
+    areas : array_like, shape (N, max_layers)
+        Rebar layer areas (mm²). Pad unused layers with 0 (or NaN).
+    beam_height, beam_width, fc, fy, es, ecu, beta_one : array_like
+        Per-beam section and material data in the units of
+        `calculate_rebar_forces`, each of shape (N,) or scalar.
+    alpha_2 : float or array_like, optional
+        Factor for the equivalent concrete stress block. Default=0.85.
+    tol : float, optional
+        Tolerance on the neutral-axis depth x (mm). Default=0.1.
+    max_iterations : int, optional
+        Cap on the number of bisection steps. Default=60.
+
+    Returns
+    -------
+    dict
+        {
+            "neutral_axis": (N,) x in mm, NaN where no root is bracketed,
+            "fc_concrete": (N,) concrete compression (N),
+            "fc_rebar": (N,) steel compression (N),
+            "fs_rebar": (N,) steel tension (N),
+            "ratio": (N,) compression / tension,
+            "moment": (N,) nominal moment about the top fiber (N·mm),
+            "eps_t": (N,) net tensile strain at the deepest layer,
+            "converged": (N,) bool, True where a root was bracketed,
+            "iterations": int, bisection steps taken
+        }
+
+    Notes
+    -----
+    - Use `pack_rebar_layers` to build `depths` / `areas` from lists of
+      rebar dicts.
+    - Beams that do not bracket a root (e.g. no tension steel) are returned
+      with NaN neutral axis and converged=False, mirroring the scalar
+      function's None.
+    """
+    areas = np.nan_to_num(np.atleast_2d(np.asarray(areas, dtype=float)))
+    depths = np.nan_to_num(np.atleast_2d(np.asarray(depths, dtype=float)))
+    if depths.shape != areas.shape:
+        raise ValueError("depths and areas must have the same (N, max_layers) shape.")
+    if tol <= 0:
+        raise ValueError("tol must be positive.")
+
+    n_beams = depths.shape[0]
+    beam_height, beam_width, fc, fy, es, ecu, beta_one, alpha_2 = (
+        np.broadcast_to(np.asarray(v, dtype=float), (n_beams,))
+        for v in (beam_height, beam_width, fc, fy, es, ecu, beta_one, alpha_2)
+    )
+    if np.any(beam_height <= 0) or np.any(beam_width <= 0):
+        raise ValueError("beam_height and beam_width must be positive.")
+
+    def residual(x):
+        f_comp, f_tens = _compute_forces_batch(
+            x, depths, areas, beam_width, fc, fy, es, ecu, beta_one, alpha_2
+        )[:2]
+        return f_comp - f_tens
+
+    x_lo = np.full(n_beams, min(tol, beam_height.min()) * 1e-3)
+    x_hi = beam_height.copy()
+    converged = (residual(x_lo) < 0) & (residual(x_hi) >= 0)
+
+    iterations = 0
+    while iterations < max_iterations and np.any(x_hi - x_lo > tol):
+        x_mid = 0.5 * (x_lo + x_hi)
+        below = residual(x_mid) < 0
+        x_lo = np.where(below, x_mid, x_lo)
+        x_hi = np.where(below, x_hi, x_mid)
+        iterations += 1
+
+    x = 0.5 * (x_lo + x_hi)
+    f_comp, f_tens, f_concrete, fc_rebar, fs_rebar = _compute_forces_batch(
+        x, depths, areas, beam_width, fc, fy, es, ecu, beta_one, alpha_2
+    )
+
+    # Moment about the top fiber: tension steel minus compression resultants
+    compression, force_s = _layer_forces_batch(x, depths, areas, fy, es, ecu)
+    moment = (
+        np.where(compression, -force_s, force_s) * depths
+    ).sum(axis=1) - f_concrete * beta_one * x / 2.0
+
+    d_t = np.where(areas > 0, depths, -np.inf).max(axis=1, initial=-np.inf)
+    eps_t = ecu * (d_t - x) / x
+
+    with np.errstate(divide="ignore", invalid="ignore"):
+        ratio = np.where(f_tens != 0, f_comp / f_tens, np.inf)
+
+    nan = np.full(n_beams, np.nan)
+    return {
+        "neutral_axis": np.where(converged, x, nan),
+        "fc_concrete": np.where(converged, f_concrete, 0.0),
+        "fc_rebar": np.where(converged, fc_rebar, 0.0),
+        "fs_rebar": np.where(converged, fs_rebar, 0.0),
+        "ratio": np.where(converged, ratio, nan),
+        "moment": np.where(converged, moment, nan),
+        "eps_t": np.where(converged, eps_t, nan),
+        "converged": converged,
+        "iterations": iterations
     }
 
 
@@ -0,0 +1,221 @@
+# SPDX-License-Identifier: MIT
+"""
+optimizer.py
+------------
+Cost-minimizing tension reinforcement for rectangular beams.
+
+Candidate layouts are enumerated over section heights, bar diameters, bars
+per layer and number of layers. Candidates that break the spacing rules or
+fall outside the bounds below are dropped before any capacity is computed:
+- lower bound : phi * Mn <= 0.9 * As * fy * d, so As < Mu / (0.9 fy d) cannot
+                work,
+- upper bound : T > 0.85 f'c beta_1 b c_max cannot be a ductile beam, with
+                c_max = ecu / (ecu + 0.004) * d_t the depth giving
+                eps_t = 0.004 and T the steel tension at c_max, each layer
+                at its own stress min(Es eps, fy); inner layers that have not
+                yielded are not taken at fy, so no ductile layout is dropped,
+- minimum As  : max(0.25 sqrt(f'c), 1.4) / fy * b * d.
+The rest are sorted by cost and evaluated in chunks with
+`calculate_rebar_forces_batch` and the array form of
+`calculate_strength_reduction_factor`; the search stops at the first chunk
+holding a feasible layout, since every later chunk costs more.
+
+References:
+- NSCP 2015 / ACI 318: 409.3.3.1 (eps_t >= 0.004), 409.6.1.2 (As,min),
+  425.2.1 / 425.2.2 (clear spacing of bars and layers).
+
+This code is open-source and licensed under the MIT License.
+"""
+
+import numpy as np
+
+from concretedesignpy.beam.moment_capacity import calculate_rebar_forces_batch
+from concretedesignpy.provision import calculate_strength_reduction_factor
+from concretedesignpy.section.material import Concrete, Steel
+
+STEEL_DENSITY = 7.85e-6  # kg/mm³
+DEFAULT_DIAMETERS = (12.0, 16.0, 20.0, 25.0, 28.0, 32.0, 36.0)
+
+
+def _candidate_grid(beam_width, heights, diameters, max_layers, cover, ds,
+                    min_clear, aggregate):
+    """Every (height, diameter, bars per layer, layers) meeting the spacing rules."""
+    h, db, layers = np.meshgrid(heights, diameters, np.arange(1, max_layers + 1),
+                                indexing="ij")
+    h, db, layers = h.ravel(), db.ravel(), layers.ravel()
+
+    # Horizontal clear spacing >= max(25, db, 4/3 aggregate) (425.2.1)
+    clear = np.maximum(np.maximum(min_clear, db), 4.0 / 3.0 * aggregate)
+    usable = beam_width - 2.0 * (cover + ds) - db
+    n_max = np.floor(usable / (db + clear)).astype(int) + 1
+
+    n_top = int(n_max.max(initial=0))
+    counts = np.arange(2, max(n_top, 2) + 1)
+    idx = np.repeat(np.arange(h.size), counts.size)
+    n = np.tile(counts, h.size)
+    keep = n <= n_max[idx]
+    return h[idx][keep], db[idx][keep], n[keep], layers[idx][keep]
+
+
+def optimize_beam_reinforcement(
+    mu,
+    beam_width,
+    heights,
+    fc,
+    fy,
+    cover=40.0,
+    ds=10.0,
+    diameters=DEFAULT_DIAMETERS,
+    max_layers=2,
+    es=200000.0,
+    ecu=0.003,
+    steel_cost=1.0,
+    concrete_cost=0.0,
+    min_clear=25.0,
+    aggregate=20.0,
+    chunk_size=256
+):
+    """
+    Find the cheapest tension reinforcement layout with phi * Mn >= Mu.
+
+    Parameters
+    ----------
+    mu : float
+        Factored moment demand Mu (N·mm).
+    beam_width : float
+        Beam width b (mm).
+    heights : float or array_like
+        Candidate total heights h (mm).
+    fc, fy : float
+        Concrete strength and steel yield strength (MPa).
+    cover, ds : float, optional
+        Clear cover to the stirrups and stirrup diameter (mm). Defaults 40 and 10.
+    diameters : array_like, optional
+        Candidate bar diameters (mm).
+    max_layers : int, optional
+        Maximum number of tension layers, each with the same bar count. Default=2.
+    es, ecu : float, optional
+        Steel modulus (MPa) and ultimate concrete strain. Defaults 200000 and 0.003.
+    steel_cost : float, optional
+        Cost per kg of reinforcement. Default=1.0.
+    concrete_cost : float, optional
+        Cost per m³ of concrete; set it when several heights are tried, or the
+        deepest section always wins. Default=0.0.
+    min_clear : float, optional
+        Minimum clear spacing between bars and between layers (mm). Default=25.
+    aggregate : float, optional
+        Nominal maximum aggregate size (mm), for the 4/3 * aggregate spacing
+        rule. Default=20.
+    chunk_size : int, optional
+        Candidates evaluated per capacity batch. Default=256.
+
+    Returns
+    -------
+    dict
+        {
+            "ok": bool, True if a feasible layout was found,
+            "layout": dict or None, the cheapest layout with keys height,
+                      diameter, bars_per_layer, layers, as, d, phi_mn, phi,
+                      eps_t, cost and rebar (list of {"d", "diam", "num"} in
+                      the `process_rebar_data` format),
+            "candidates": int, layouts meeting the spacing rules,
+            "pruned": int, layouts removed by the bounds,
+            "evaluated": int, layouts whose capacity was computed
+        }
+        Costs are per metre of beam.
+    """
+    if mu <= 0:
+        raise ValueError("mu must be positive.")
+    if beam_width <= 0:
+        raise ValueError("beam_width must be positive.")
+    if max_layers < 1:
+        raise ValueError("max_layers must be at least 1.")
+    if chunk_size < 1:
+        raise ValueError("chunk_size must be at least 1.")
+
+    concrete = Concrete(fc, ecu=ecu)
+    steel = Steel(fy, es=es)
+    heights = np.atleast_1d(np.asarray(heights, dtype=float))
+    diameters = np.atleast_1d(np.asarray(diameters, dtype=float))
+
+    h, db, n, layers = _candidate_grid(beam_width, heights, diameters, max_layers,
+                                       cover, ds, min_clear, aggregate)
+    n_candidates = h.size
+
+    # --- 1) Geometry: layer k sits (db + max(25, db)) above layer k - 1 ---
+    d_t = h - cover - ds - 0.5 * db
+    pitch = db + np.maximum(min_clear, db)
+    d_centroid = d_t - 0.5 * (layers - 1) * pitch
+    bar_area = np.pi / 4.0 * db ** 2
+    total_as = bar_area * n * layers
+
+    # --- 2) Bounds: prune before any capacity evaluation ---
+    lower = mu / (0.9 * fy * d_centroid)
+    c_max = ecu / (ecu + 0.004) * d_t
+    tension_at_c_max = np.zeros_like(d_t)
+    for k in range(max_layers):
+        d_k = d_t - k * pitch
+        fs_k = np.clip(es * ecu * (d_k - c_max) / c_max, -fy, fy)
+        tension_at_c_max += np.where(k < layers, bar_area * n * fs_k, 0.0)
+    ductile = tension_at_c_max <= 0.85 * fc * concrete.beta_one * beam_width * c_max
+    as_min = max(0.25 * np.sqrt(fc), 1.4) / fy * beam_width * d_centroid
+    keep = (total_as >= lower) & ductile & (total_as >= as_min)
+    keep &= d_t - (layers - 1) * pitch > cover + ds + 0.5 * db
+    n_pruned = int(n_candidates - keep.sum())
+
+    h, db, n, layers = h[keep], db[keep], n[keep], layers[keep]
+    d_t, pitch, total_as = d_t[keep], pitch[keep], total_as[keep]
+    cost = (steel_cost * STEEL_DENSITY * total_as * 1000.0
+            + concrete_cost * beam_width * h * 1e-6)
+
+    # --- 3) Cheapest first, in chunks, stopping at the first feasible chunk ---
+    order = np.argsort(cost, kind="stable")
+    layer_k = np.arange(max_layers)
+    evaluated = 0
+    best = None
+    for start in range(0, order.size, chunk_size):
+        sel = order[start:start + chunk_size]
+        used = layer_k[None, :] < layers[sel, None]
+        depths = np.where(used, d_t[sel, None] - layer_k[None, :] * pitch[sel, None], 0.0)
+        areas = np.where(used, (np.pi / 4.0 * db[sel] ** 2 * n[sel])[:, None], 0.0)
+
+        result = calculate_rebar_forces_batch(
+            depths, areas, h[sel], beam_width, fc, fy, es, ecu, concrete.beta_one
+        )
+        evaluated += sel.size
+        eps_t = np.nan_to_num(result["eps_t"], nan=0.0)
+        phi = calculate_strength_reduction_factor(
+            np.maximum(eps_t, 0.0), steel.eps_y, "others"
+        )
+        phi_mn = phi * result["moment"]
+        ok = result["converged"] & (eps_t >= 0.004) & (phi_mn >= mu)
+        if np.any(ok):
+            i = np.flatnonzero(ok)[0]
+            k = sel[i]
+            best = {
+                "height": float(h[k]),
+                "diameter": float(db[k]),
+                "bars_per_layer": int(n[k]),
+                "layers": int(layers[k]),
+                "as": float(total_as[k]),
+                "d": float(
+                    (depths[i] * areas[i]).sum() / areas[i].sum()
+                ),
+                "phi_mn": float(phi_mn[i]),
+                "phi": float(phi[i]),
+                "eps_t": float(eps_t[i]),
+                "cost": float(cost[k]),
+                "rebar": [
+                    {"d": float(depths[i, j]), "diam": float(db[k]), "num": int(n[k])}
+                    for j in range(int(layers[k]))
+                ],
+            }
+            break
+
+    return {
+        "ok": best is not None,
+        "layout": best,
+        "candidates": int(n_candidates),
+        "pruned": n_pruned,
+        "evaluated": evaluated,
+    }
@@ -8,7 +8,33 @@ first hoop location, maximum allowable hoop spacing, and conditions where hoops
 are not required.
 """
 
-import math
+import numpy as np
+
+FIRST_HOOP_LIMIT = 50.0
+
+def max_hoop_spacing_limit(depth, db, ds):
+    """
+    Maximum hoop spacing, min(depth / 4, 6 * db, 24 * ds, 150 mm).
+
+    Works element-wise on arrays.
+    """
+    return np.minimum(np.minimum(depth / 4, 6 * db), np.minimum(24 * ds, 150))
+
+def hoops_not_required_limit(depth):
+    """
+    Maximum spacing where hoops are not required (Section 418.6.4.6), depth / 2.
+
+    Works element-wise on arrays.
+    """
+    return depth / 2
+
+def max_spacing_limit(db):
+    """
+    Maximum hoop spacing based on the bar diameter, min(6 * db, 150 mm).
+
+    Works element-wise on arrays.
+    """
+    return np.minimum(6 * db, 150)
 
 def validate_first_hoop(first_hoop_loc: float) -> bool:
     """
@@ -20,7 +46,7 @@ def validate_first_hoop(first_hoop_loc: float) -> bool:
     Returns:
         bool: True if the first hoop is within 50 mm, False otherwise.
     """
-    if first_hoop_loc > 50:
+    if first_hoop_loc > FIRST_HOOP_LIMIT:
         print("Warning: The first hoop should be within 50 mm of the face of the supporting member.")
         return False
     return True
@@ -44,7 +70,7 @@ def validate_max_hoop_spacing(depth: float, db: float, ds: float, hoop_spacing:
     Returns:
         bool: True if the hoop spacing is within the allowed limit, False otherwise.
     """
-    max_spacing = min(depth / 4, 6 * db, 24 * ds, 150)
+    max_spacing = max_hoop_spacing_limit(depth, db, ds)
     if hoop_spacing > max_spacing:
         print(f"Warning: Provided hoop spacing ({hoop_spacing:.2f} mm) exceeds the limit of {max_spacing:.2f} mm.")
         return False
@@ -64,7 +90,7 @@ def validate_hoops_not_required(depth: float, hoop_spacing: float) -> bool:
     Returns:
         bool: True if the spacing is within the allowed limit, False otherwise.
     """
-    max_spacing = depth / 2
+    max_spacing = hoops_not_required_limit(depth)
     if hoop_spacing > max_spacing:
         print(f"Warning: Provided hoop spacing ({hoop_spacing:.2f} mm) exceeds the limit of {max_spacing:.2f} mm.")
         return False
@@ -85,13 +111,88 @@ def validate_max_spacing(db: float, hoop_spacing: float) -> bool:
     Returns:
         bool: True if the hoop spacing is within the allowed limit, False otherwise.
     """
-    max_spacing = min(6 * db, 150)
+    max_spacing = max_spacing_limit(db)
     if hoop_spacing > max_spacing:
         print(f"Warning: Provided hoop spacing ({hoop_spacing:.2f} mm) exceeds the limit of {max_spacing:.2f} mm.")
         return False
     return True
 
 
+def check_hoops(first_hoop_loc, depth, db, ds, hoop_spacing):
+    """
+    Run the four hoop checks of Section 418.6.4 over arrays of members.
+
+    This is the batch, non-printing counterpart of `validate_first_hoop`,
+    `validate_max_hoop_spacing`, `validate_hoops_not_required` and
+    `validate_max_spacing`. Warnings are collected, not printed. The first
+    hoop distance is checked on its own; the governing rule is taken over the
+    three spacing limits only, since they all apply to the same spacing.
+
+    Parameters:
+        first_hoop_loc (array_like): Distance from the face to the first hoop (mm).
+        depth (array_like): Effective depth of each member (mm).
+        db (array_like): Diameter of the main bars (mm).
+        ds (array_like): Diameter of the stirrups (mm).
+        hoop_spacing (array_like): Provided hoop spacing (mm).
+
+    Returns:
+        dict: {
+            "<rule>": {"ok": bool array, "limit": array, "utilisation": array}
+                for each rule "first_hoop", "max_hoop_spacing",
+                "hoops_not_required" and "max_spacing"
+                (utilisation = provided / limit),
+            "ok": bool array, True where all four rules pass,
+            "governing_rule": array of the spacing rule with the smallest
+                limit (highest utilisation),
+            "governing_limit": that spacing limit (mm),
+            "utilisation": provided spacing / governing_limit,
+            "warnings": list of warning messages, one per failed check
+        }
+    """
+    first_hoop_loc, depth, db, ds, hoop_spacing = np.broadcast_arrays(
+        *(np.atleast_1d(np.asarray(v, dtype=float))
+          for v in (first_hoop_loc, depth, db, ds, hoop_spacing))
+    )
+
+    rules = (
+        ("first_hoop", first_hoop_loc, np.full(first_hoop_loc.shape, FIRST_HOOP_LIMIT)),
+        ("max_hoop_spacing", hoop_spacing, max_hoop_spacing_limit(depth, db, ds)),
+        ("hoops_not_required", hoop_spacing, hoops_not_required_limit(depth)),
+        ("max_spacing", hoop_spacing, max_spacing_limit(db)),
+    )
+
+    result = {}
+    utilisation = np.empty((len(rules),) + hoop_spacing.shape)
+    warnings = []
+    for k, (name, provided, limit) in enumerate(rules):
+        ok = provided <= limit
+        utilisation[k] = provided / limit
+        result[name] = {"ok": ok, "limit": limit, "utilisation": utilisation[k]}
+        for i in np.flatnonzero(~ok):
+            if name == "first_hoop":
+                warnings.append(
+                    f"Member {i}: The first hoop should be within {FIRST_HOOP_LIMIT:.0f} mm "
+                    f"of the face of the supporting member."
+                )
+            else:
+                warnings.append(
+                    f"Member {i}: Provided hoop spacing ({provided.flat[i]:.2f} mm) exceeds "
+                    f"the {name} limit of {limit.flat[i]:.2f} mm."
+                )
+
+    names = np.array([name for name, _, _ in rules])
+    result["ok"] = np.logical_and.reduce([result[name]["ok"] for name in names])
+
+    # Governing spacing limit, first hoop excluded (rules[0])
+    governing = np.argmax(utilisation[1:], axis=0) + 1
+    limits = np.stack([limit for _, _, limit in rules])
+    result["governing_rule"] = names[governing]
+    result["governing_limit"] = np.take_along_axis(limits, governing[None], axis=0)[0]
+    result["utilisation"] = np.take_along_axis(utilisation, governing[None], axis=0)[0]
+    result["warnings"] = warnings
+    return result
+
+
 def calculate_vc(fc: float, beam_width: float, eff_depth: float) -> float:
     """
     Calculate the concrete shear capacity (Vc) of a beam.
@@ -107,7 +208,7 @@ def calculate_vc(fc: float, beam_width: float, eff_depth: float) -> float:
     Returns:
         float: The concrete shear capacity.
     """
-    return (1 / 6) * math.sqrt(fc) * beam_width * eff_depth
+    return (1 / 6) * np.sqrt(fc) * beam_width * eff_depth
 
 def calculate_vs(av: float, fy: float, eff_depth: float, spacing: float) -> float:
     """
@@ -145,6 +246,139 @@ def calculate_ultimate_shear(phi: float, vc: float, vs: float) -> float:
     return phi * (vc + vs)
 
 
+def design_stirrup_spacing(beam_width, eff_depth, fc, fyt, vu, av, ds, db,
+                           hinge_zone=False, phi=0.75, spacings=None):
+    """
+    Select stirrup spacing for many beams at once.
+
+    For every beam, every candidate stirrup (Av, ds) and every candidate
+    spacing, phi * (Vc + Vs) is evaluated in one broadcast pass with
+    `calculate_vc`, `calculate_vs` and `calculate_ultimate_shear`. A spacing
+    is accepted when
+    - phi * (Vc + Vs) >= Vu, with Vs counted up to 0.66 sqrt(f'c) b d,
+    - it does not exceed the spacing limit: `max_hoop_spacing_limit` in
+      hinge zones, otherwise min(d / 2, 600 mm), halved to min(d / 4,
+      300 mm) where the candidate Vs exceeds 0.33 sqrt(f'c) b d
+      (Section 409.7.6.2.2),
+    - Av >= Av,min = max(0.062 sqrt(f'c), 0.35) b s / fyt where
+      Vu > 0.5 phi Vc (Section 409.6.3).
+    Beams needing Vs = Vu / phi - Vc > 0.66 sqrt(f'c) b d (Section
+    422.5.1.2) get no spacing: the section itself must be enlarged.
+
+    Parameters:
+        beam_width (array_like): Beam widths b, shape (N,) (mm).
+        eff_depth (array_like): Effective depths d, shape (N,) (mm).
+        fc (array_like): Concrete strengths (MPa), shape (N,) or scalar.
+        fyt (array_like): Stirrup yield strengths (MPa), shape (N,) or scalar.
+        vu (array_like): Factored shears Vu, shape (N,) (N).
+        av (array_like): Candidate stirrup areas Av (all legs), shape (K,)
+            or (N, K) (mm²), in order of preference (e.g. smallest first).
+        ds (array_like): Stirrup diameter of each candidate, shape (K,) or
+            (N, K) (mm).
+        db (array_like): Main bar diameters, shape (N,) or scalar (mm).
+        hinge_zone (array_like of bool): True where the hoop spacing limits
+            of Section 418.6.4 apply, shape (N,) or scalar.
+        phi (float): Strength reduction factor for shear. Default 0.75.
+        spacings (array_like): Practical spacings to choose from (mm).
+            Default 50 to 600 mm in 25 mm steps.
+
+    Returns:
+        dict: {
+            "spacing": (N,) largest acceptable spacing of the chosen candidate,
+                NaN where no candidate works,
+            "size_index": (N,) index of the first candidate with an
+                acceptable spacing, -1 where none,
+            "spacing_by_size": (N, K) largest acceptable spacing per candidate,
+            "limit": (N, K, S) spacing limit per candidate and spacing (mm),
+            "vc": (N,) concrete shear capacity (N),
+            "vs": (N,) stirrup shear capacity at the chosen spacing (N),
+            "phi_vn": (N,) phi * (Vc + min(Vs, Vs,max)) at the chosen spacing (N),
+            "vs_max": (N,) section limit 0.66 sqrt(f'c) b d (N),
+            "section_ok": (N,) bool, False where the section is too small,
+            "av_min_per_s": (N,) Av,min / s where minimum stirrups are
+                required, else 0 (mm²/mm),
+            "ok": (N,) bool, True where a spacing was found
+        }
+    """
+    if spacings is None:
+        spacings = np.arange(50.0, 601.0, 25.0)
+    s = np.sort(np.asarray(spacings, dtype=float).ravel())
+    if s.size == 0 or s[0] <= 0:
+        raise ValueError("spacings must be positive.")
+
+    per_beam = (beam_width, eff_depth, fc, fyt, vu, db, hinge_zone)
+    n_beams = np.broadcast_shapes(*(np.shape(v) for v in per_beam), (1,))[0]
+    b, d, fc, fyt, vu, db, hinge_zone = (
+        np.broadcast_to(np.asarray(v), (n_beams,)) for v in per_beam
+    )
+    b = b.astype(float)
+    av = np.atleast_1d(np.asarray(av, dtype=float))
+    av = np.broadcast_to(av, (n_beams, av.shape[-1]))
+    ds = np.broadcast_to(np.asarray(ds, dtype=float), av.shape)
+    if np.any(av <= 0) or np.any(b <= 0) or np.any(d <= 0):
+        raise ValueError("Beam width, effective depth and Av must be positive.")
+
+    # 1) Capacities over the (N, K, S) grid, Vs capped at the section limit
+    vc = calculate_vc(fc, b, d)
+    vs_max = 0.66 * np.sqrt(fc) * b * d
+    section_ok = vu / phi - vc <= vs_max
+    vs = calculate_vs(av[:, :, None], fyt[:, None, None], d[:, None, None], s)
+    phi_vn = calculate_ultimate_shear(phi, vc[:, None, None],
+                                      np.minimum(vs, vs_max[:, None, None]))
+
+    # Minimum shear reinforcement where Vu > 0.5 phi Vc
+    av_min_per_s = np.where(
+        vu > 0.5 * phi * vc,
+        np.maximum(0.062 * np.sqrt(fc), 0.35) * b / fyt,
+        0.0,
+    )
+
+    # 2) Spacing limits, (N, K, S); halved outside hinge zones where the
+    #    candidate Vs exceeds 0.33 sqrt(f'c) b d
+    d_col = d[:, None, None]
+    high_shear = vs > (0.33 * np.sqrt(fc) * b * d)[:, None, None]
+    limit = np.where(
+        hinge_zone[:, None, None].astype(bool),
+        max_hoop_spacing_limit(d_col, db[:, None, None], ds[:, :, None]),
+        np.where(high_shear,
+                 np.minimum(hoops_not_required_limit(d_col) / 2, 300.0),
+                 np.minimum(hoops_not_required_limit(d_col), 600.0)),
+    )
+    feasible = (
+        (phi_vn >= vu[:, None, None])
+        & (s <= limit)
+        & (av[:, :, None] >= av_min_per_s[:, None, None] * s)
+        & section_ok[:, None, None]
+    )
+
+    # 3) Largest feasible spacing per candidate, then the first workable candidate
+    has_spacing = feasible.any(axis=2)
+    spacing_by_size = np.where(
+        has_spacing, np.nanmax(np.where(feasible, s, -np.inf), axis=2), np.nan
+    )
+    ok = has_spacing.any(axis=1)
+    size_index = np.where(ok, np.argmax(has_spacing, axis=1), -1)
+
+    rows = np.arange(n_beams)
+    pick = np.maximum(size_index, 0)
+    spacing = np.where(ok, spacing_by_size[rows, pick], np.nan)
+    vs_chosen = np.where(ok, calculate_vs(av[rows, pick], fyt, d, np.where(ok, spacing, 1.0)), np.nan)
+
+    return {
+        "spacing": spacing,
+        "size_index": size_index,
+        "spacing_by_size": spacing_by_size,
+        "limit": limit,
+        "vc": vc,
+        "vs": vs_chosen,
+        "phi_vn": calculate_ultimate_shear(phi, vc, np.minimum(vs_chosen, vs_max)),
+        "vs_max": vs_max,
+        "section_ok": section_ok,
+        "av_min_per_s": av_min_per_s,
+        "ok": ok,
+    }
+
+
 def main():
     """
     Demonstrates example validations for transverse reinforcements.
@@ -3,6 +3,15 @@
 
 import numpy as np
 
+_PLOTTING = ("plot_backbone_curve",)
+
+
+def __getattr__(name):
+    if name in _PLOTTING:
+        from concretedesignpy import plotting
+        return getattr(plotting, name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
 def compute_modulus_of_elasticity(f_c):
     """
     Computes the modulus of elasticity of concrete based on compressive strength.
@@ -75,7 +84,6 @@ if __name__ == "__main__":
 # Computes and plots the force-displacement backbone curve for FRP-confined columns.
 
 import numpy as np
-import matplotlib.pyplot as plt
 
 def generate_backbone_curve(theta_a, theta_y, theta_u, cnl, Vy):
     """
@@ -104,21 +112,6 @@ def generate_backbone_curve(theta_a, theta_y, theta_u, cnl, Vy):
     
     return theta_values, v_values
 
-def plot_backbone_curve(theta_values, v_values):
-    """
-    Plots the backbone curve.
-    """
-    plt.figure(figsize=(8,6))
-    plt.plot(theta_values, v_values, marker='o', linestyle='-', color='b', label="Backbone Curve (Python)")
-    plt.axhline(0, color='black', linewidth=0.8)
-    plt.axvline(0, color='black', linewidth=0.8)
-    plt.xlabel(r'$\theta$ (radians)')
-    plt.ylabel(r'$V$ (kN)')  # Labeled in kip
-    plt.title('Backbone Curve (Matching Mathcad)')
-    plt.legend()
-    plt.grid(True)
-    plt.show()
-
 if __name__ == "__main__":
     # Given values from Mathcad (units in kip and radians)
     theta_a = 0.082   # Elastic limit rotation (radians)
@@ -131,4 +124,5 @@ if __name__ == "__main__":
     theta_values, v_values = generate_backbone_curve(theta_a, theta_y, theta_u, cnl, Vy)
 
     # Plot the backbone curve
+    from concretedesignpy.plotting import plot_backbone_curve
     plot_backbone_curve(theta_values, v_values)
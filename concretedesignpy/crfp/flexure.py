@@ -1,106 +1,250 @@
-import math
-import pandas as pd
-
-def eRF(exposure,type):
-    data = {
-        "interior" : {
-            "carbon" : 0.95,
-            "glass" : 0.75,
-            "aramid" : 0.85
-        },
-        "exterior" : {
-            "carbon" : 0.85,
-            "glass" : 0.65,
-            "aramid" : 0.75
-        },
-        "aggressive" : {
-            "carbon" : 0.85,
-            "glass" : 0.50,
-            "aramid" : 0.70
-            },
+# SPDX-License-Identifier: MIT
+"""
+flexure.py
+----------
+Flexural strength of rectangular beams strengthened with externally bonded
+FRP on the tension face (ACI 440.2R-17, Chapter 10).
+
+The neutral axis depth c is found from the fixed point of the ACI 440
+procedure: for a trial c, the FRP strain is limited by debonding (eps_fd),
+the concrete stress block follows the Todeschini parabola (alpha_1, beta_1
+from eps_c), the steel stress is capped at fy, and force equilibrium gives the
+next c. The iteration stops when |c_next - c| falls below the tolerance. Each
+trial also narrows a bracket [lo, hi] around the root; a step that leaves the
+bracket or does not halve the residual (the plain fixed point oscillates for
+stiff FRP) is replaced by bisection, so convergence is guaranteed.
+
+Everything is vectorized: `frp_flexure_batch` solves any number of beams and
+retrofit schemes (ply counts, widths, FRP products) at once, with all inputs
+broadcast together. The functions keep no state and read no globals, so they
+are safe to call in loops and threads.
+
+    >>> products = [FRP(3790, 0.0167, 227527, 0.165), FRP(1520, 0.021, 72400, 0.353)]
+    >>> out = frp_flexure_batch(300, 600, 540, 1530, 28, 420, products,
+    ...                         n_plies=np.arange(1, 5)[:, None], wf=300)
+    >>> out["phi_mn"].shape     # (ply counts, products)
+    (4, 2)
+
+References:
+- ACI 440.2R-17: Eq. 10.1.1 (eps_fd), 10.2.5 (alpha_1, beta_1), 10.2.7
+  (phi), 10.2.10 (psi_f = 0.85).
+
+This code is open-source and licensed under the MIT License.
+"""
+
+import numpy as np
+
+from concretedesignpy.section.material import FRP
+
+PSI_F = 0.85  # additional FRP strength reduction factor (10.2.10)
+
+
+def _frp_arrays(frp):
+    """Broadcastable (ef, tf, ffu, efu) arrays from one FRP or a sequence of them."""
+    if isinstance(frp, FRP):
+        return frp.ef, frp.tf, frp.ffu, frp.efu
+    frp = list(frp)
+    if not frp or not all(isinstance(f, FRP) for f in frp):
+        raise ValueError("frp must be an FRP object or a non-empty sequence of FRP objects.")
+    return tuple(np.array([getattr(f, name) for f in frp])
+                 for name in ("ef", "tf", "ffu", "efu"))
+
+
+def _state(c, d, df, as_, af, b, fc, fy, es, ef, ecu, ebi, efd, ec_prime):
+    """Strains, stresses, stress block and the next c for a trial neutral axis c."""
+    efe = np.minimum(ecu * (df - c) / c - ebi, efd)
+    eps_c = np.minimum((efe + ebi) * c / (df - c), ecu)
+    eps_s = (efe + ebi) * (d - c) / (df - c)
+    fs = np.clip(es * eps_s, -fy, fy)
+    ffe = ef * efe
+    beta = (4.0 * ec_prime - eps_c) / (6.0 * ec_prime - 2.0 * eps_c)
+    alpha = (3.0 * ec_prime * eps_c - eps_c ** 2) / (3.0 * beta * ec_prime ** 2)
+    c_next = (as_ * fs + af * ffe) / (alpha * fc * beta * b)
+    return c_next, efe, eps_c, eps_s, fs, ffe, alpha, beta
+
+
+def frp_flexure_batch(
+    beam_width,
+    beam_height,
+    d,
+    as_,
+    fc,
+    fy,
+    frp,
+    n_plies,
+    wf,
+    es=200000.0,
+    ecu=0.003,
+    ebi=0.0,
+    df=None,
+    psi_f=PSI_F,
+    tol=1e-9,
+    max_iterations=100
+):
+    """
+    Nominal and design moment of FRP-strengthened rectangular beams.
+
+    All array arguments are broadcast together, so one call can cover many
+    beams and many retrofit schemes.
+
+    Parameters
+    ----------
+    beam_width, beam_height : float or array_like
+        Beam width b and total height h (mm).
+    d : float or array_like
+        Depth of the tension steel (mm).
+    as_ : float or array_like
+        Tension steel area As (mm²).
+    fc, fy : float or array_like
+        Concrete strength and steel yield strength (MPa).
+    frp : FRP or sequence of FRP
+        FRP system (`concretedesignpy.section.material.FRP`); a sequence of
+        M products gives arrays of shape (M,) for broadcasting.
+    n_plies : int or array_like
+        Number of plies n.
+    wf : float or array_like
+        Width of the FRP sheet (mm). Af = n * tf * wf.
+    es, ecu : float or array_like, optional
+        Steel modulus (MPa) and ultimate concrete strain. Defaults 200000 and 0.003.
+    ebi : float or array_like, optional
+        Substrate strain at the FRP level when the FRP is installed, from the
+        cracked section under the existing load. Default=0.
+    df : float or array_like, optional
+        Depth of the FRP (mm). Default: beam_height.
+    psi_f : float, optional
+        Additional FRP strength reduction factor. Default=0.85.
+    tol : float, optional
+        Convergence tolerance on |c_next - c| relative to df. Default=1e-9.
+    max_iterations : int, optional
+        Iteration cap. Default=100.
+
+    Returns
+    -------
+    dict
+        {
+            "c": neutral axis depth (mm),
+            "eps_fd": debonding strain limit, min(0.41 sqrt(fc / (n Ef tf)), 0.9 efu),
+            "eps_fe": effective FRP strain,
+            "ffe": effective FRP stress (MPa),
+            "eps_c": concrete strain at the top fibre,
+            "eps_s": tension steel strain,
+            "fs": tension steel stress (MPa),
+            "alpha_one", "beta_one": stress block factors,
+            "mns", "mnf": steel and FRP moment contributions (N·mm),
+            "mn": Mns + psi_f * Mnf (N·mm),
+            "phi": strength reduction factor (Eq. 10.2.7),
+            "phi_mn": phi * Mn (N·mm),
+            "failure_mode": "concrete crushing" or "FRP debonding",
+            "converged": bool,
+            "iterations": iterations taken
+        }
+        Every entry has the broadcast shape of the inputs.
+    """
+    if max_iterations < 1:
+        raise ValueError("max_iterations must be at least 1.")
+    ef, tf, ffu, efu = _frp_arrays(frp)
+    df = beam_height if df is None else df
+    b, h, d, as_, fc, fy, n, wf, es, ecu, ebi, df, ef, tf, ffu, efu = np.broadcast_arrays(
+        *(np.asarray(v, dtype=float) for v in
+          (beam_width, beam_height, d, as_, fc, fy, n_plies, wf, es, ecu, ebi, df,
+           ef, tf, ffu, efu))
+    )
+    if np.any(b <= 0) or np.any(h <= 0):
+        raise ValueError("beam_width and beam_height must be positive.")
+    if np.any(fc <= 0) or np.any(fy <= 0):
+        raise ValueError("fc and fy must be positive.")
+    if np.any(n < 1) or np.any(wf <= 0):
+        raise ValueError("n_plies must be at least 1 and wf positive.")
+    if np.any(d <= 0) or np.any(d > df) or np.any(df > h):
+        raise ValueError("Need 0 < d <= df <= beam_height.")
+    if np.any(ebi < 0):
+        raise ValueError("ebi cannot be negative.")
+
+    # --- 1) FRP and concrete constants ---
+    af = n * tf * wf
+    efd = np.minimum(0.41 * np.sqrt(fc / (n * ef * tf)), 0.9 * efu)
+    ec_prime = 1.7 * fc / (4700.0 * np.sqrt(fc))
+    args = (d, df, as_, af, b, fc, fy, es, ef, ecu, ebi, efd, ec_prime)
+
+    # --- 2) Safeguarded fixed point on c ---
+    c = 0.2 * d
+    lo = np.zeros_like(c)
+    hi = df.copy()
+    r_prev = np.full_like(c, np.inf)
+    converged = np.zeros(c.shape, dtype=bool)
+    iterations = np.zeros(c.shape, dtype=int)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        for _ in range(max_iterations):
+            active = ~converged
+            c_next = _state(c, *args)[0]
+            r = c_next - c
+            iterations += active
+            converged |= np.abs(r) <= tol * df
+            if converged.all():
+                break
+            lo = np.where(r > 0, np.maximum(lo, c), lo)
+            hi = np.where(r < 0, np.minimum(hi, c), hi)
+            bisect = ((c_next <= lo) | (c_next >= hi) | ~np.isfinite(c_next)
+                      | (np.abs(r) > 0.5 * r_prev))
+            step = np.where(bisect, 0.5 * (lo + hi), c_next)
+            # A bracket narrower than the tolerance also ends the search,
+            # unless it collapsed onto df (no root inside the section)
+            converged |= (hi - lo <= tol * df) & (hi < df)
+            c = np.where(converged, c, step)
+            r_prev = np.where(active, np.abs(r), r_prev)
+
+        # --- 3) Forces and moments at the converged c ---
+        _, efe, eps_c, eps_s, fs, ffe, alpha, beta = _state(c, *args)
+    mns = as_ * fs * (d - beta * c / 2.0)
+    mnf = af * ffe * (df - beta * c / 2.0)
+    mn = mns + psi_f * mnf
+
+    eps_y = fy / es
+    phi = np.where(
+        eps_s >= 0.005, 0.90,
+        np.where(eps_s > eps_y, 0.65 + 0.25 * (eps_s - eps_y) / (0.005 - eps_y), 0.65),
+    )
+    debonding = ecu * (df - c) / c - ebi > efd
+    return {
+        "c": c,
+        "eps_fd": efd,
+        "eps_fe": efe,
+        "ffe": ffe,
+        "eps_c": eps_c,
+        "eps_s": eps_s,
+        "fs": fs,
+        "alpha_one": alpha,
+        "beta_one": beta,
+        "mns": mns,
+        "mnf": mnf,
+        "mn": mn,
+        "phi": phi,
+        "phi_mn": phi * mn,
+        "failure_mode": np.where(debonding, "FRP debonding", "concrete crushing"),
+        "converged": converged,
+        "iterations": iterations,
     }
-    results = data[exposure][type]
-    return results
-
-def beta_1(fc): 
-    ##NSCP 2015 422.2.2.4.3
-    value = 1.05 - 0.05*(fc/1000)
-    if(17 <= fc and fc <= 28):
-        value = 0.85
-    elif (28 <= fc and fc < 55):
-        value = 0.85 - ((0.05*(fc-28))/7)
-    else:
-        value = 0.65
-
-    return value
-    
-def areaCircle(db):
-    pi = math.pi
-    value = (pi/4)*(math.pow(db,2))
-    return value
-
-ebi = ( MDL * (df - (k*d)) )  /( Icr * ec_convert ) 
-
-def cSolver():## //Numerical Solver
-        
-    ##--> Data for the tabulations
-    epsilon_fe_arr = []
-    espilon_c_arr = []
-    eespilon_s_arr = []
-    e_c_prime_arr = []
-    beta_one_arr = []
-    alpha_one_arr = []
-    c_init_arr = []
-
-    c_init = 0.20*input['d'] ##initialize depth
-    i = 0
-    
-    while i <= 20:
-       
-        epsilon_fe = 0.003*( (input['h'] - c_init) /c_init) - ebi
-        espilon_c = (0.009 + ebi)*(c_init/(input['h'] - c_init))
-        espilon_s = (0.009 + ebi)*((input['d'] - c_init)/(input['h'] - c_init))
-
-        fs = input['Es']*espilon_s
-        fs = 414 ##TODO fix on the yields
-            
-        f_fe = input['frp']['Ef']*0.009
-            
-        e_c_prime = 1.7*input['fc']/ec
-        beta_one = ((4*e_c_prime )- espilon_c)/((6*e_c_prime)-(2*espilon_c))
-        alpha_one = ((3*e_c_prime*espilon_c) - math.pow(espilon_c,2))/(3*beta_one*math.pow(e_c_prime,2))    
-        c_init = (area_steel*fs + af*f_fe)/(alpha_one*input['fc']*beta_one*input['w'])
-
-        epsilon_fe_arr.append(epsilon_fe)
-        espilon_c_arr.append(espilon_c)
-        eespilon_s_arr.append(espilon_s)
-        e_c_prime_arr.append(e_c_prime)
-        beta_one_arr.append(beta_one)
-        alpha_one_arr.append(alpha_one)
-        c_init_arr.append(c_init)
-    
-        c = c_init
-        i += 1
-    results = {
-        "value" : c,
-        "epsilon_fe" : epsilon_fe_arr,
-        "espilon_c" : espilon_c_arr,
-        "espilon_s" : eespilon_s_arr,
-        "e_c_prime" : e_c_prime_arr,
-        "beta_one" : beta_one_arr,
-        "alpha_one" : alpha_one_arr,
-        "c_init" : c_init_arr,
+
+
+def frp_flexure(beam_width, beam_height, d, as_, fc, fy, frp, n_plies, wf, **kwargs):
+    """
+    Flexural strength of one FRP-strengthened rectangular beam.
+
+    Takes the arguments of `frp_flexure_batch` as scalars (`frp` a single FRP)
+    and returns the same keys as Python scalars.
+
+    Raises
+    ------
+    ValueError
+        If the neutral axis iteration does not converge.
+    """
+    if not isinstance(frp, FRP):
+        raise ValueError("frp must be an FRP object; use frp_flexure_batch for several.")
+    result = frp_flexure_batch(beam_width, beam_height, d, as_, fc, fy, frp,
+                               n_plies, wf, **kwargs)
+    if not result["converged"]:
+        raise ValueError("Neutral axis iteration did not converge.")
+    return {
+        key: value.item() if isinstance(value, np.ndarray) else value
+        for key, value in result.items()
     }
-        
-    return results
-
-c_data = cSolver()
-df = pd.DataFrame({
-      'c (mm)': c_data['c_init'],
-      'ε_fe': c_data['epsilon_fe'],    
-      'ε_c': c_data['espilon_c'],
-      'ε_s': c_data['espilon_s'],
-      'ε_c\'': c_data['e_c_prime'],
-      'β1': c_data['beta_one'],
-      'α': c_data['alpha_one'],
-      })
\ No newline at end of file
@@ -0,0 +1,239 @@
+# SPDX-License-Identifier: MIT
+"""
+ingest.py
+---------
+Streaming readers for member / demand tables exported by analysis software
+(ETABS, Midas, ...) as CSV or JSON Lines.
+
+Tables are read in fixed-size chunks and every chunk is returned as a dict of
+typed NumPy column arrays, so memory stays bounded by the chunk size whatever
+the file size. Columns can be renamed and scaled on the way in (e.g. "M3" in
+kN·m -> "mu" in N·mm), giving arrays the batch functions accept directly.
+
+    for batch in read_table_chunks("frame_forces.csv",
+                                   columns={"Frame": "str", "M3": "float"},
+                                   rename={"Frame": "member", "M3": "mu"},
+                                   scale={"mu": 1e6}, skip_after_header=1):
+        ...
+
+`envelope` reduces such a stream to one row per member (max |value| over all
+load combinations) without holding the table in memory.
+
+This code is open-source and licensed under the MIT License.
+"""
+
+import csv
+import itertools
+import json
+import operator
+import os
+
+import numpy as np
+
+DTYPES = {"float": float, "int": np.int64, "str": str, "bool": bool}
+
+# Accepted spellings of a boolean cell (compared case-insensitively)
+_BOOL_TEXT = {"true": True, "false": False, "1": True, "0": False,
+              "yes": True, "no": False}
+
+
+def _open(source):
+    """Return (file object, should_close) for a path or an open text file."""
+    if isinstance(source, (str, os.PathLike)):
+        return open(source, newline="", encoding="utf-8-sig"), True
+    return source, False
+
+
+def _detect_format(source, fmt):
+    if fmt is not None:
+        if fmt not in ("csv", "jsonl"):
+            raise ValueError("format must be 'csv' or 'jsonl'.")
+        return fmt
+    name = os.fspath(source) if isinstance(source, (str, os.PathLike)) else ""
+    return "jsonl" if name.lower().endswith((".jsonl", ".ndjson")) else "csv"
+
+
+def _to_bool(value):
+    """One boolean cell: JSON booleans as given, text parsed via `_BOOL_TEXT`."""
+    if isinstance(value, (bool, np.bool_)):
+        return bool(value)
+    try:
+        return _BOOL_TEXT[str(value).strip().lower()]
+    except KeyError:
+        raise ValueError(f"{value!r} is not a boolean.") from None
+
+
+def _to_array(values, dtype):
+    """Convert one column of raw values; empty cells become NaN for floats."""
+    if dtype is float:
+        try:
+            return np.array(values, dtype=float)
+        except (TypeError, ValueError):
+            return np.array([np.nan if v is None or v == "" else v for v in values], dtype=float)
+    if dtype is str:
+        return np.array(["" if v is None else str(v) for v in values], dtype=str)
+    if dtype is bool:
+        return np.array([_to_bool(v) for v in values], dtype=bool)
+    return np.array(values, dtype=dtype)
+
+
+def _infer_dtype(values):
+    """float if every non-empty value parses as a number, else str."""
+    try:
+        _to_array(values, float)
+        return float
+    except (TypeError, ValueError):
+        return str
+
+
+def _csv_rows(fh, delimiter, skip_after_header):
+    reader = csv.reader(fh, delimiter=delimiter)
+    header = [name.strip() for name in next(reader)]
+    for _ in range(skip_after_header):
+        next(reader, None)
+    return header, filter(None, reader), lambda: reader.line_num
+
+
+def _jsonl_rows(fh, names):
+    position = [0]
+
+    def rows():
+        for position[0], line in enumerate(fh, 1):
+            line = line.strip()
+            if line:
+                record = json.loads(line)
+                yield [record.get(name) for name in names]
+
+    return rows(), lambda: position[0]
+
+
+def read_table_chunks(source, columns=None, chunk_size=65536, format=None,
+                      delimiter=",", skip_after_header=0, rename=None, scale=None):
+    """
+    Read a CSV or JSONL table in chunks of typed column arrays.
+
+    Parameters:
+    source: Path or open text file.
+    columns (dict or list): Columns to keep. A dict maps column name to
+        "float", "int", "str" or "bool"; a list keeps those columns with the
+        type inferred from the first chunk; None keeps every CSV column (JSONL
+        needs explicit columns).
+    chunk_size (int): Rows per chunk. Default 65536.
+    format (str): "csv" or "jsonl"; default from the file extension (.jsonl /
+        .ndjson -> JSONL, otherwise CSV).
+    delimiter (str): CSV delimiter. Default ",".
+    skip_after_header (int): CSV rows to skip after the header, e.g. 1 for the
+        units row of ETABS exports. Default 0.
+    rename (dict): Output names for source columns.
+    scale (dict): Factors applied to numeric output columns (by output name),
+        e.g. {"mu": 1e6} for kN·m -> N·mm.
+
+    Yields:
+    dict: Output column name -> ndarray of length <= chunk_size.
+
+    Raises:
+    ValueError: For unknown column types, missing columns or a bad row.
+    """
+    if chunk_size < 1:
+        raise ValueError("chunk_size must be at least 1.")
+    fmt = _detect_format(source, format)
+    if isinstance(columns, dict):
+        unknown = set(columns.values()) - set(DTYPES)
+        if unknown:
+            raise ValueError(f"Unknown column types: {sorted(unknown)}.")
+    rename = rename or {}
+    scale = scale or {}
+
+    fh, close = _open(source)
+    try:
+        if fmt == "csv":
+            header, rows, line_num = _csv_rows(fh, delimiter, skip_after_header)
+            names = list(header if columns is None else columns)
+            missing = [name for name in names if name not in header]
+            if missing:
+                raise ValueError(f"Columns not found in the table: {missing}.")
+            positions = [header.index(name) for name in names]
+        else:
+            if columns is None:
+                raise ValueError("columns are required for JSONL input.")
+            names = list(columns)
+            positions = list(range(len(names)))
+            rows, line_num = _jsonl_rows(fh, names)
+
+        dtypes = None
+        if isinstance(columns, dict):
+            dtypes = {name: DTYPES[columns[name]] for name in names}
+        # Physical line numbers from the reader, so skipped blank rows count
+        line = line_num()
+        while True:
+            block = list(itertools.islice(rows, chunk_size))
+            if not block:
+                return
+            last = line_num()
+            try:
+                raw = [list(map(operator.itemgetter(p), block)) for p in positions]
+            except IndexError:
+                raise ValueError(
+                    f"Short row between lines {line + 1} and {last}."
+                ) from None
+            if dtypes is None:
+                dtypes = {name: _infer_dtype(values) for name, values in zip(names, raw)}
+
+            batch = {}
+            for name, values in zip(names, raw):
+                out = rename.get(name, name)
+                try:
+                    array = _to_array(values, dtypes[name])
+                except (TypeError, ValueError) as exc:
+                    raise ValueError(f"Column {name!r} near line {line + 1}: {exc}") from None
+                if out in scale:
+                    array = array * scale[out]
+                batch[out] = array
+            line = last
+            yield batch
+    finally:
+        if close:
+            fh.close()
+
+
+def envelope(batches, key, values):
+    """
+    Reduce a stream of batches to one row per key with the largest |value|.
+
+    Parameters:
+    batches (iterable): Dicts of column arrays, e.g. from `read_table_chunks`.
+    key (str): Column identifying the member (e.g. "member").
+    values (list): Numeric columns to envelope (e.g. ["mu", "vu"]).
+
+    Returns:
+    dict: {key: (n_keys,) sorted unique keys, value: (n_keys,) signed value
+    with the largest magnitude for every value column}. Memory grows with the
+    number of members, not with the number of rows.
+    """
+    keys = None
+    env = {name: None for name in values}
+    for batch in batches:
+        chunk_keys, inverse = np.unique(batch[key], return_inverse=True)
+        if keys is None:
+            merged = chunk_keys
+        else:
+            merged = np.union1d(keys, chunk_keys)
+        for name in values:
+            column = np.asarray(batch[name], dtype=float)
+            # Signed value of the largest magnitude per key within the chunk
+            magnitude = np.where(np.isnan(column), -1.0, np.abs(column))
+            order = np.lexsort((magnitude, inverse))
+            last = np.flatnonzero(np.r_[inverse[order][1:] != inverse[order][:-1], True])
+            chunk_env = np.full(merged.size, np.nan)
+            chunk_env[np.searchsorted(merged, chunk_keys)] = column[order][last]
+            if env[name] is not None:
+                previous = np.full(merged.size, np.nan)
+                previous[np.searchsorted(merged, keys)] = env[name]
+                take = np.isnan(chunk_env) | (np.abs(previous) > np.abs(chunk_env))
+                chunk_env = np.where(take, previous, chunk_env)
+            env[name] = chunk_env
+        keys = merged
+    if keys is None:
+        raise ValueError("No rows to envelope.")
+    return {key: keys, **env}
+
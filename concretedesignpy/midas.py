@@ -0,0 +1,266 @@
+# SPDX-License-Identifier: MIT
+"""
+midas.py
+--------
+Streaming, deduplicating writer for MGT-format text (Midas Gen / Civil input),
+with the data helpers for fiber sections and inelastic materials.
+
+Records are written straight to the file through a buffered text stream, so
+a whole tower is never held in memory as one string. Every definition goes
+through a hash index: a material, fiber section or other definition that is
+identical to one already written returns the existing id instead of being
+written again.
+
+The writer does not know any Midas command layout. Command names, their
+header comments and the order of the data fields differ between Midas
+versions, and the repository has no exported MGT file to check them against.
+Copy them from an MGT file exported by the target Midas version and pass
+them in; the helpers below only supply the values in the units of the
+`rebarInelasMat` notebook helper (kPa, m):
+
+    layout = {material_cmd: ("description", "field, field, ..."), ...}
+    with MGTWriter("tower.mgt", commands=layout) as mgt:
+        steel = mgt.define(material_cmd, "Gr60",
+                           (*steel_keywords, *rebar_material_data(414.0, 620.0)))
+        core = mgt.define(material_cmd, "C28-core",
+                          (*concrete_keywords, *mander_concrete_data(28.0, fpl=2.1)))
+        section = mgt.fiber_section(section_cmd, fiber_cmd, "1C1",
+                                    fiber_table(mesh, cover, core, steel))
+
+Each definition is written as "id, name, field, ..." under its command line
+("*COMMAND ; description"), followed by a "; fields" comment when the layout
+gives one; a command line is repeated only when the command changes.
+
+This code is open-source and licensed under the MIT License.
+"""
+
+import hashlib
+import os
+
+import numpy as np
+
+from concretedesignpy.section.fiber import CORE, COVER, STEEL
+from concretedesignpy.stress_strain.manders import (
+    compute_confined_strength,
+    compute_peak_strain,
+)
+
+MPA_TO_KPA = 1000.0
+MM_TO_M = 1e-3
+FIBER_BLOCK = 4096
+
+
+def _fmt(value):
+    """Compact, round-trip-stable text for one field."""
+    if isinstance(value, (float, np.floating)):
+        return format(float(value), ".10g")
+    return str(value)
+
+
+def rebar_material_data(fy, fu, es=200000.0, esh=0.015, esu=0.12, multiplier=1.0):
+    """
+    Inelastic reinforcing steel values, as `rebarInelasMat` in the notebooks.
+
+    Parameters:
+    fy, fu (float): Yield and ultimate strength [MPa].
+    es (float): Modulus of elasticity [MPa]. Default 200000.
+    esh (float): Strain at the onset of strain hardening. Default 0.015.
+    esu (float): Rupture strain. Default 0.12.
+    multiplier (float): Factor on fy, fu and Es (e.g. expected strength).
+
+    Returns:
+    tuple: (fy, fu, Es) in kPa, then esh, esu.
+    """
+    if fy <= 0 or fu < fy or es <= 0:
+        raise ValueError("Need fy > 0, fu >= fy and es > 0.")
+    scale = MPA_TO_KPA * multiplier
+    return fy * scale, fu * scale, es * scale, esh, esu
+
+
+def mander_concrete_data(fc, fpl=0.0, eco=0.002, ecu=0.004, ec=None):
+    """
+    Mander concrete values; fpl = 0 gives unconfined (cover) concrete.
+
+    Parameters:
+    fc (float): Unconfined strength f'co [MPa].
+    fpl (float): Effective lateral confining stress [MPa].
+    eco (float): Strain at peak unconfined stress.
+    ecu (float): Ultimate strain.
+    ec (float): Modulus [MPa]; default 5000 * sqrt(f'co).
+
+    Returns:
+    tuple: (f'co [kPa], eco, f'cc [kPa], ecc, ecu, Ec [kPa]).
+    """
+    if fc <= 0 or fpl < 0:
+        raise ValueError("Need fc > 0 and fpl >= 0.")
+    ec = 5000.0 * np.sqrt(fc) if ec is None else ec
+    fcc = compute_confined_strength(fc, fpl) if fpl > 0 else fc
+    ecc = compute_peak_strain(fc, fcc, eco)
+    return (fc * MPA_TO_KPA, eco, fcc * MPA_TO_KPA, ecc, ecu,
+            float(ec) * MPA_TO_KPA)
+
+
+def fiber_table(mesh, cover, core, steel):
+    """
+    Fiber rows of a `build_fiber_mesh` mesh.
+
+    Parameters:
+    mesh (dict): Fiber mesh (coordinates and areas in mm).
+    cover, core, steel (int): Material ids of the three fiber groups.
+
+    Returns:
+    ndarray: (n_fibers, 4) columns y, z, area, material id. Coordinates are
+    about the section centre, y horizontal, z vertical, in m; areas in m².
+    """
+    material_ids = np.zeros(3)
+    material_ids[[COVER, CORE, STEEL]] = (cover, core, steel)
+    return np.column_stack((
+        (mesh["x"] - mesh["width"] / 2.0) * MM_TO_M,
+        (mesh["y"] - mesh["height"] / 2.0) * MM_TO_M,
+        mesh["area"] * MM_TO_M ** 2,
+        material_ids[mesh["material"]],
+    ))
+
+
+class MGTWriter:
+    """
+    Buffered MGT writer with hash-indexed deduplication.
+
+    Parameters:
+    target: Path or open text file.
+    commands (dict): Command -> (description, field names) for the header
+        comments, copied from an export of the target Midas version.
+        Commands not listed get a bare command line.
+    buffer_size (int): Write buffer in bytes when a path is given. Default 1 MiB.
+
+    Attributes:
+    written (dict): Number of records written per command.
+    reused (int): Number of definitions answered from the hash index.
+    """
+
+    def __init__(self, target, commands=None, buffer_size=1 << 20):
+        if isinstance(target, (str, os.PathLike)):
+            self._fh = open(target, "w", encoding="utf-8", newline="\n",
+                            buffering=buffer_size)
+            self._close = True
+        else:
+            self._fh = target
+            self._close = False
+        self.commands = dict(commands or {})
+        self._command = None
+        self._index = {}
+        self._next_id = {}
+        self.written = {}
+        self.reused = 0
+
+    # --- context manager ---
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    def close(self):
+        """Flush and close (only closes files opened by the writer)."""
+        if self._fh is None:
+            return
+        self._fh.flush()
+        if self._close:
+            self._fh.close()
+        self._fh = None
+
+    # --- low level ---
+    def _enter(self, command):
+        if not command.startswith("*"):
+            raise ValueError("MGT commands start with '*'.")
+        if command != self._command:
+            description, fields = self.commands.get(command, (None, None))
+            self._fh.write(f"\n{command}" + (f"    ; {description}\n" if description else "\n"))
+            if fields:
+                self._fh.write(f"; {fields}\n")
+            self._command = command
+
+    def comment(self, text):
+        """Write a ';' comment line."""
+        self._fh.write(f"; {text}\n")
+
+    def raw(self, command, rows):
+        """Write rows (sequences of fields) under `command`, without deduplication."""
+        self._enter(command)
+        count = 0
+        for row in rows:
+            self._fh.write("   " + ", ".join(map(_fmt, row)) + "\n")
+            count += 1
+        self.written[command] = self.written.get(command, 0) + count
+
+    def _lookup(self, command, digest):
+        key = (command, digest)
+        if key in self._index:
+            self.reused += 1
+            return self._index[key], False
+        new_id = self._next_id.get(command, 1)
+        self._next_id[command] = new_id + 1
+        self._index[key] = new_id
+        return new_id, True
+
+    # --- definitions ---
+    def define(self, command, name, fields):
+        """
+        Write one "id, name, fields..." record unless an identical one exists.
+
+        Ids count from 1 per command. The hash index key is the command and
+        the formatted fields, so the name is not part of the identity: the
+        first name written is kept.
+
+        Returns:
+        int: Id of the (new or existing) definition.
+        """
+        text = ", ".join(map(_fmt, fields))
+        digest = hashlib.blake2b(text.encode(), digest_size=16).digest()
+        def_id, new = self._lookup(command, digest)
+        if new:
+            self.raw(command, [(def_id, name, *fields)])
+        return def_id
+
+    def fiber_section(self, section_command, fiber_command, name, fibers, fields=()):
+        """
+        Fiber section: one header record, then one row per fiber.
+
+        The header "id, name, n_fibers, fields..." goes under
+        `section_command`, the rows "id, fiber_no, columns..." under
+        `fiber_command`.
+
+        Parameters:
+        section_command, fiber_command (str): Command names of the target layout.
+        name (str): Section name.
+        fibers (array_like): (n_fibers, k) fiber columns, e.g. `fiber_table`.
+        fields (tuple): Further header fields, appended as given.
+
+        Returns:
+        int: Section id. Identical fiber tables with identical header fields
+        share one id.
+        """
+        fibers = np.ascontiguousarray(fibers, dtype=float)
+        if fibers.ndim != 2 or fibers.shape[0] == 0:
+            raise ValueError("fibers must be a non-empty (n_fibers, k) array.")
+        h = hashlib.blake2b(fibers.tobytes(), digest_size=16)
+        h.update(repr((fibers.shape, tuple(map(_fmt, fields)))).encode())
+        section_id, new = self._lookup(section_command, h.digest())
+        if not new:
+            return section_id
+
+        n_fibers = fibers.shape[0]
+        self.raw(section_command, [(section_id, name, n_fibers, *fields)])
+        self._enter(fiber_command)
+        # Rows are formatted per row and written one block at a time, so the
+        # text of a large mesh is never held in memory at once
+        row_format = "   %d, %d" + ", %.10g" * fibers.shape[1] + "\n"
+        numbers = np.arange(1, n_fibers + 1)
+        for start in range(0, n_fibers, FIBER_BLOCK):
+            block = fibers[start:start + FIBER_BLOCK]
+            self._fh.write("".join(
+                row_format % (section_id, number, *row)
+                for number, row in zip(numbers[start:start + FIBER_BLOCK], block.tolist())
+            ))
+        self.written[fiber_command] = self.written.get(fiber_command, 0) + n_fibers
+        return section_id
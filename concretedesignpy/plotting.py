@@ -0,0 +1,215 @@
+# SPDX-License-Identifier: MIT
+"""
+plotting.py
+-----------
+Matplotlib plots for the calculation modules:
+- plot_beam_rebar            : section outline, stirrup and bar layout
+- plot_pm_points_with_curve  : P–M interaction diagram through its key points
+- plot_confined_strength     : Mander confined strength chart
+- plot_backbone_curve        : FRP-confined column backbone curve
+
+Kept apart from the calculation modules so that importing those needs only
+NumPy; this module (and matplotlib) is loaded on first use, e.g. through
+``concretedesignpy.plotting`` or the old names such as
+``geometry.plot_beam_rebar``.
+
+This code is open-source and licensed under the MIT License.
+"""
+
+import numpy as np
+import matplotlib.pyplot as plt
+
+from concretedesignpy.stress_strain.manders import (
+    compute_confined_strength_ratio,
+    solver,
+)
+
+
+# =============================================================================
+# Function: plot_beam_rebar
+# =============================================================================
+def plot_beam_rebar(width, height, section_corners, stirrup_corners, rebar_coords, show_labels=True):
+    """
+    Plot the beam cross-section with the rebar layout.
+
+    Parameters:
+        width           : Section width [mm]
+        height          : Section height [mm]
+        section_corners : List of 4 points for the outer rectangle (unconfined section)
+        stirrup_corners : List of 4 points for the stirrup center-line rectangle (confined section)
+        rebar_coords    : List of (x, y) coordinates for each main rebar
+        show_labels     : If True, labels are added to the plot
+    """
+    fig, ax = plt.subplots(figsize=(5, 6))
+
+    # --- 1) Plot the outer rectangle (unconfined section) ---
+    x_vals = [p[0] for p in section_corners] + [section_corners[0][0]]
+    y_vals = [p[1] for p in section_corners] + [section_corners[0][1]]
+    ax.plot(x_vals, y_vals, 'k-', linewidth=2, label="Unconfined Section")
+
+    # --- 2) Plot the stirrup center-line rectangle ---
+    sx_vals = [p[0] for p in stirrup_corners] + [stirrup_corners[0][0]]
+    sy_vals = [p[1] for p in stirrup_corners] + [stirrup_corners[0][1]]
+    ax.plot(sx_vals, sy_vals, 'b--', linewidth=1.5, label="Stirrup (Center-Line)")
+
+    # --- 3) Plot the rebar points ---
+    rx = [p[0] for p in rebar_coords]
+    ry = [p[1] for p in rebar_coords]
+    ax.scatter(rx, ry, s=60, c='red', marker='o', label="Main Bars")
+
+    # --- 4) Add labels if required ---
+    if show_labels:
+        for i, pt in enumerate(section_corners, start=1):
+            ax.text(pt[0], pt[1], f"C{i}", color='blue', fontsize=9, ha='left', va='bottom')
+        for i, pt in enumerate(stirrup_corners, start=1):
+            ax.text(pt[0], pt[1], f"S{i}", color='green', fontsize=9, ha='left', va='bottom')
+        for i, (xr, yr) in enumerate(rebar_coords, start=1):
+            ax.text(xr, yr, f"R{i}", color='red', fontsize=8, ha='left', va='bottom')
+
+    # --- 5) Final plot formatting ---
+    ax.set_aspect('equal', adjustable='box')
+    ax.set_xlim(-10, width + 10)
+    ax.set_ylim(-10, height + 10)
+    ax.set_xlabel("X-axis (mm)")
+    ax.set_ylabel("Y-axis (mm)")
+    ax.set_title("Cross-Section with Rebar Layout")
+    ax.legend()
+    ax.grid(True)
+
+    plt.show()
+
+
+# =============================================================================
+# Function: plot_pm_points_with_curve
+# =============================================================================
+def plot_pm_points_with_curve(po, pt, mB, pB, mA, pA, mL, pL, fcprime, asbar, fy):
+    """
+    The five points are:
+      1) Pure Tension: (0, -Pt) [from Cell 1]
+      2) Below-Balanced: (M_bb, P_bb) [from Cell 2]
+      3) Balanced: (M_bal, P_bal) [from Cell 2]
+      4) Above-Balanced: (M_ab, P_ab) [from Cell 2]
+      5) Pure Compression: (0, +Po) [from Cell 1]
+    
+    The curve is obtained by interpolating these points with a parametric spline.
+    """
+    # Convert units
+    Po_kN = po / 1e3        # Pure compression, positive
+    Pt_kN = -(pt / 1e3)      # Pure tension, negative
+    mB_kNm = mB / 1e6
+    pB_kN  = pB / 1e3
+    mA_kNm = mA / 1e6
+    pA_kN  = pA / 1e3
+    mL_kNm = mL / 1e6
+    pL_kN  = pL / 1e3
+    
+    # Define the key points (in a parametric t-scale)
+    t_vals = np.array([0, 0.25, 0.5, 0.75, 1])
+    M_points = np.array([0, mL_kNm, mB_kNm, mA_kNm, 0])
+    P_points = np.array([Pt_kN, pL_kN, pB_kN, pA_kN, Po_kN])
+
+    # Create a fine parameter for smooth interpolation
+    from scipy.interpolate import make_interp_spline
+    t_fine = np.linspace(0, 1, 300)
+    spline_M = make_interp_spline(t_vals, M_points, k=3)
+    spline_P = make_interp_spline(t_vals, P_points, k=3)
+    M_fine = spline_M(t_fine)
+    P_fine = spline_P(t_fine)
+    
+    # Plotting
+    plt.figure(figsize=(7,7))
+    plt.plot(M_fine, P_fine, lw=2)
+    
+    # Plot the five key points
+    plt.plot(0, Pt_kN, 'bo', ms=8, label="Pure Tension (Pt)")
+    plt.text(5, Pt_kN - 100, f"(0.0, {Pt_kN:.1f})", color='blue')
+
+    plt.plot(mL_kNm, pL_kN, 'cs', ms=8, label="Below-Balanced")
+    plt.text(mL_kNm + 20, pL_kN, f"({mL_kNm:.1f}, {pL_kN:.1f})", color='c')
+
+    plt.plot(mB_kNm, pB_kN, 'ks', ms=8, label="Balanced")
+    plt.text(mB_kNm + 20, pB_kN, f"({mB_kNm:.1f}, {pB_kN:.1f})", color='black')
+
+    plt.plot(mA_kNm, pA_kN, 'ys', ms=8, label="Above-Balanced")
+    plt.text(mA_kNm + 20, pA_kN, f"({mA_kNm:.1f}, {pA_kN:.1f})", color='goldenrod')
+
+    plt.plot(0, Po_kN, 'ro', ms=8, label="Pure Compression (Po)")
+    plt.text(5, Po_kN + 100, f"(0.0, {Po_kN:.1f})", color='red')
+
+    # Axes, labels, legend
+    plt.axhline(0, color='k', ls='--', lw=0.8)
+    plt.axvline(0, color='k', ls='--', lw=0.8)
+    plt.xlabel("Moment, M (kN·m)")
+    plt.ylabel("Axial Load, P (kN)")
+    plt.title("P–M Interaction Diagram")
+    plt.grid(True)
+    plt.legend(loc='best')
+
+    # Cross Section Information
+    text_str = (
+        "Cross-section properties:\n"
+        f"f'c = {fcprime} MPa\n"
+        f"As  = {asbar} mm^2\n"
+        f"fy  = {fy} MPa"
+    )
+
+    plt.text(0.5, 0.5, text_str,
+             fontsize=10, ha='center', va='center',
+             transform=plt.gca().transAxes,
+             bbox=dict(facecolor='white', alpha=0.7, boxstyle="round"))
+
+    plt.show()
+
+
+# =============================================================================
+# Function: plot_confined_strength
+# =============================================================================
+def plot_confined_strength() -> None:
+    """Generates a plot of confined strength ratio vs. confinement stress ratio.
+
+    This function compares various scenarios by varying:
+      - fl1/fl2 from 0 to 0.2
+      - f'l2/f'co from 0 to 0.3
+
+    It also draws a reference curve where fl1 = fl2 (i.e., the original Mander 
+    model ratio).
+    """
+    ratio_values = np.arange(0, 0.31, 0.01)
+
+    # Compute solver-based data
+    value0, value1, value2 = solver(np.array([[0.0], [0.1], [0.2]]), ratio_values)
+
+    # Compute the original Mander's approach for fl1=fl2
+    value_fl1_eq_fl2 = compute_confined_strength_ratio(ratio_values)
+
+    plt.figure(figsize=(8, 6))
+    plt.plot(value0, -ratio_values, label="fl1/fl2 = 0.0")
+    plt.plot(value1, -ratio_values, label="fl1/fl2 = 0.1")
+    plt.plot(value2, -ratio_values, label="fl1/fl2 = 0.2")
+    plt.plot(value_fl1_eq_fl2, -ratio_values, label="fl1 = fl2", linestyle="dashed")
+
+    plt.xlabel(r"Confined Strength Ratio, $f'_{cc}/f'_{co}$")
+    plt.ylabel(r"Largest Confining Stress Ratio, $f'_{l2}/f'_{co}$")
+    plt.title("Confined Strength Determination from Lateral Confining Stresses")
+    plt.legend()
+    plt.grid(True)
+    plt.show()
+
+
+# =============================================================================
+# Function: plot_backbone_curve
+# =============================================================================
+def plot_backbone_curve(theta_values, v_values):
+    """
+    Plots the backbone curve.
+    """
+    plt.figure(figsize=(8,6))
+    plt.plot(theta_values, v_values, marker='o', linestyle='-', color='b', label="Backbone Curve (Python)")
+    plt.axhline(0, color='black', linewidth=0.8)
+    plt.axvline(0, color='black', linewidth=0.8)
+    plt.xlabel(r'$\theta$ (radians)')
+    plt.ylabel(r'$V$ (kN)')  # Labeled in kip
+    plt.title('Backbone Curve (Matching Mathcad)')
+    plt.legend()
+    plt.grid(True)
+    plt.show()
@@ -0,0 +1,228 @@
+# SPDX-License-Identifier: MIT
+"""
+profiling.py
+------------
+Opt-in instrumentation for the calculation hot paths.
+
+Records, per instrumented function, the number of calls, the cumulative wall
+time and (for solvers returning an "evaluations" count) the number of force
+evaluations, then prints a summary table.
+
+Enable it for a whole run with an environment variable:
+
+    CONCRETEDESIGNPY_PROFILE=1 python design_project.py
+
+or for a block of code:
+
+    from concretedesignpy import profiling
+
+    with profiling.profile():
+        run_design()
+
+When profiling is off nothing is wrapped: the module-level functions are the
+original objects, and the nested solver closures pay one flag check per call
+of their enclosing function.
+
+Times are inclusive (a solver's time contains its nested calls). Calls made in
+worker processes (e.g. `interaction_surface` with max_workers > 1) are not
+recorded.
+
+This code is open-source and licensed under the MIT License.
+"""
+
+import atexit
+import functools
+import importlib
+import os
+import sys
+import time
+from contextlib import contextmanager
+
+ENV_VAR = "CONCRETEDESIGNPY_PROFILE"
+
+# (module, function) pairs wrapped by enable(). Every loaded concretedesignpy
+# module holding a reference to one of these (e.g. via `from ... import`) is
+# patched as well.
+TARGETS = (
+    ("concretedesignpy.beam.moment_capacity", "process_rebar_data"),
+    ("concretedesignpy.beam.moment_capacity", "calculate_rebar_forces"),
+    ("concretedesignpy.beam.moment_capacity", "calculate_rebar_forces_batch"),
+    ("concretedesignpy.section.geometry", "points_on_pm_diagram"),
+    ("concretedesignpy.section.geometry", "compute_pm_curve"),
+    ("concretedesignpy.stress_strain.manders", "compute_confined_strength"),
+    ("concretedesignpy.stress_strain.manders", "compute_peak_strain"),
+    ("concretedesignpy.stress_strain.manders", "compute_mander_stress"),
+    ("concretedesignpy.stress_strain.manders", "compute_unconfined_stress"),
+    ("concretedesignpy.stress_strain.manders", "mander_curves"),
+    ("concretedesignpy.stress_strain.manders", "compute_confined_strength_ratio"),
+    ("concretedesignpy.stress_strain.manders", "compute_equation_A"),
+    ("concretedesignpy.stress_strain.manders", "compute_equation_B"),
+    ("concretedesignpy.stress_strain.manders", "compute_confined_strength_factor"),
+    ("concretedesignpy.stress_strain.manders", "solver"),
+    ("concretedesignpy.provision", "calculate_strength_reduction_factor"),
+    ("concretedesignpy.provision", "steel_yield_strain"),
+    ("concretedesignpy.provision", "calculate_beta_one"),
+)
+
+_enabled = False
+_stats = {}
+_originals = {}
+_atexit_registered = False
+
+
+def is_enabled():
+    """Return True while instrumentation is active."""
+    return _enabled
+
+
+def _record(name, elapsed, evaluations=0):
+    entry = _stats.get(name)
+    if entry is None:
+        _stats[name] = [1, elapsed, evaluations]
+    else:
+        entry[0] += 1
+        entry[1] += elapsed
+        entry[2] += evaluations
+
+
+def _instrument(name, fn):
+    @functools.wraps(fn)
+    def wrapper(*args, **kwargs):
+        start = time.perf_counter()
+        try:
+            result = fn(*args, **kwargs)
+        finally:
+            elapsed = time.perf_counter() - start
+        evaluations = result.get("evaluations") if isinstance(result, dict) else None
+        _record(name, elapsed, evaluations if isinstance(evaluations, int) else 0)
+        return result
+
+    wrapper._profiled_name = name
+    return wrapper
+
+
+def wrap(name, fn):
+    """
+    Instrument a nested function (e.g. a solver closure) under `name`.
+
+    Called once when the closure is created; returns `fn` unchanged when
+    profiling is off.
+    """
+    if not _enabled:
+        return fn
+    return _instrument(name, fn)
+
+
+def _patch_loaded_modules(replacements):
+    """Swap every module-level reference in the package per `replacements` (id -> obj)."""
+    for module_name, module in list(sys.modules.items()):
+        if module is None or not module_name.startswith("concretedesignpy"):
+            continue
+        namespace = vars(module)
+        for attr, value in list(namespace.items()):
+            new = replacements.get(id(value))
+            if new is not None:
+                namespace[attr] = new
+
+
+def enable(report_at_exit=False):
+    """
+    Turn instrumentation on, importing and wrapping every function in TARGETS.
+
+    Parameters:
+    report_at_exit (bool): Print the summary table when the interpreter exits.
+    """
+    global _enabled, _atexit_registered
+    if report_at_exit and not _atexit_registered:
+        atexit.register(print_summary)
+        _atexit_registered = True
+    if _enabled:
+        return
+
+    replacements = {}
+    for module_name, attr in TARGETS:
+        module = importlib.import_module(module_name)
+        fn = getattr(module, attr)
+        wrapper = _instrument(f"{module_name.rsplit('.', 1)[-1]}.{attr}", fn)
+        _originals[id(wrapper)] = fn
+        replacements[id(fn)] = wrapper
+    _patch_loaded_modules(replacements)
+    _enabled = True
+
+
+def disable():
+    """Turn instrumentation off and restore the original functions. Stats are kept."""
+    global _enabled
+    if not _enabled:
+        return
+    replacements = {}
+    for module_name, attr in TARGETS:
+        wrapper = getattr(sys.modules[module_name], attr)
+        original = _originals.pop(id(wrapper), None)
+        if original is not None:
+            replacements[id(wrapper)] = original
+    _patch_loaded_modules(replacements)
+    _enabled = False
+
+
+def reset():
+    """Clear all recorded stats."""
+    _stats.clear()
+
+
+def stats():
+    """
+    Return the recorded stats.
+
+    Returns:
+    dict: name -> {"calls": int, "seconds": float, "evaluations": int}
+    """
+    return {
+        name: {"calls": calls, "seconds": seconds, "evaluations": evaluations}
+        for name, (calls, seconds, evaluations) in _stats.items()
+    }
+
+
+def summary():
+    """Return the stats as a text table, sorted by cumulative time."""
+    rows = sorted(_stats.items(), key=lambda item: item[1][1], reverse=True)
+    header = f"{'function':<64} {'calls':>10} {'total s':>10} {'per call us':>12} {'evals':>10}"
+    lines = [header, "-" * len(header)]
+    for name, (calls, seconds, evaluations) in rows:
+        lines.append(
+            f"{name:<64} {calls:>10d} {seconds:>10.4f} "
+            f"{seconds / calls * 1e6:>12.2f} {evaluations or '':>10}"
+        )
+    return "\n".join(lines)
+
+
+def print_summary(file=None):
+    """Print the summary table (to stderr by default) if anything was recorded."""
+    if _stats:
+        print(summary(), file=file or sys.stderr)
+
+
+@contextmanager
+def profile(report=True, file=None):
+    """
+    Instrument the enclosed block.
+
+    Parameters:
+    report (bool): Print the summary table on exit.
+    file: Stream for the summary (default: stderr).
+
+    Yields:
+    The `stats` function, to read the results inside or after the block.
+    """
+    outer = _enabled
+    enable()
+    try:
+        yield stats
+    finally:
+        if not outer:
+            disable()
+            if report:
+                print_summary(file)
+
+if os.environ.get(ENV_VAR, "").strip().lower() not in ("", "0", "false", "no"):
+    enable(report_at_exit=True)
@@ -35,6 +35,60 @@ Disclaimer:
   (ACI, NSCP, etc.). The authors assume no responsibility for use or misuse of this code.
 """
 
+import numbers
+
+import numpy as np
+
+from concretedesignpy.report import DeferredReport
+
+def _offending(mask):
+    """Format the indices where `mask` is True for an error message."""
+    if mask.ndim <= 1:
+        idx = np.flatnonzero(mask).tolist()
+    else:
+        idx = [tuple(i) for i in np.argwhere(mask).tolist()]
+    shown = ", ".join(str(i) for i in idx[:10])
+    more = f" (+{len(idx) - 10} more)" if len(idx) > 10 else ""
+    return f"[{shown}]{more}"
+
+
+def _strength_reduction_factor_array(actual_epsilon, epsilon_ty, section_type):
+    """Vectorized branch of `calculate_strength_reduction_factor`."""
+    try:
+        eps, eps_ty, sec = np.broadcast_arrays(
+            np.asarray(actual_epsilon, dtype=float),
+            np.asarray(epsilon_ty, dtype=float),
+            np.asarray(section_type, dtype=object),
+        )
+    except (TypeError, ValueError) as exc:
+        raise ValueError(
+            "actual_epsilon, epsilon_ty and section_type must be numeric / "
+            "string arrays of broadcastable shapes."
+        ) from exc
+
+    spiral = sec == "spiral"
+    errors = []
+    bad = ~(spiral | (sec == "others"))
+    if bad.any():
+        errors.append(f"section_type must be 'spiral' or 'others' at indices {_offending(bad)}")
+    bad = ~(eps >= 0)
+    if bad.any():
+        errors.append(f"actual_epsilon is negative or NaN at indices {_offending(bad)}")
+    bad = ~(eps_ty > 0)
+    if bad.any():
+        errors.append(f"epsilon_ty (yield strain) is not positive at indices {_offending(bad)}")
+    if errors:
+        raise ValueError("; ".join(errors) + ".")
+
+    phi_c = np.where(spiral, 0.75, 0.65)
+    slope = np.where(spiral, 0.15, 0.25)
+    return np.select(
+        [eps <= eps_ty, eps < eps_ty + 0.003],
+        [phi_c, phi_c + slope * (eps - eps_ty) / 0.003],
+        default=0.90,
+    )
+
+
 def calculate_strength_reduction_factor(
     actual_epsilon: float,
     epsilon_ty: float,
@@ -45,29 +99,37 @@ def calculate_strength_reduction_factor(
 
     Parameters:
     -----------
-    actual_epsilon : float
+    actual_epsilon : float or array_like
         Actual (computed) tensile strain in the reinforcement.
-    epsilon_ty     : float
+    epsilon_ty     : float or array_like
         Tensile strain at steel yielding = fy / Es.
-    section_type   : str
+    section_type   : str or array_like of str
         Type of section. Must be either 'spiral' (for a spirally reinforced column)
         or 'others' (for tied columns or beams).
 
     Returns:
     --------
-    phi : float
-        Strength reduction factor.
+    phi : float or ndarray
+        Strength reduction factor. If any argument is an array (or list), the
+        arguments are broadcast together and an ndarray of ϕ is returned.
 
     Raises:
     -------
     ValueError
         If actual_epsilon or epsilon_ty are not numbers, if section_type is invalid,
-        or if inputs are out of expected ranges.
+        or if inputs are out of expected ranges. For array input, all offending
+        indices are reported in a single error.
     """
 
-    if not isinstance(actual_epsilon, (int, float)):
+    if any(
+        isinstance(arg, (np.ndarray, list, tuple))
+        for arg in (actual_epsilon, epsilon_ty, section_type)
+    ):
+        return _strength_reduction_factor_array(actual_epsilon, epsilon_ty, section_type)
+
+    if not isinstance(actual_epsilon, numbers.Real):
         raise ValueError("actual_epsilon must be a numerical type (int or float).")
-    if not isinstance(epsilon_ty, (int, float)):
+    if not isinstance(epsilon_ty, numbers.Real):
         raise ValueError("epsilon_ty must be a numerical type (int or float).")
     if section_type not in ["spiral", "others"]:
         raise ValueError("section_type must be either 'spiral' or 'others'.")
@@ -102,7 +164,11 @@ def calculate_strength_reduction_factor(
     return phi
 
 
-def steel_yield_strain(fy: float, es: float) -> dict:
+def _yield_strain_report(fy, es, epsilon_s):
+    return f"Yield steel strain, ε_s = fy / Es = {fy:.6f} / {es:.6f} = {epsilon_s:.6f}"
+
+
+def steel_yield_strain(fy: float, es: float, report: bool = True) -> dict:
     """
     Calculate and report the steel yield strain.
 
@@ -112,13 +178,16 @@ def steel_yield_strain(fy: float, es: float) -> dict:
         Steel yield strength (MPa or psi).
     es : float
         Modulus of elasticity of steel (MPa or psi).
+    report : bool, optional
+        If True (default), 'report' is formatted immediately. If False, it is
+        a DeferredReport that is only formatted when converted to str.
 
     Returns:
     --------
     result : dict
         A dictionary with:
           - 'value': the yield strain value (float)
-          - 'report': a formatted string describing the calculation
+          - 'report': a formatted string (or DeferredReport) describing the calculation
 
     Raises:
     -------
@@ -135,13 +204,24 @@ def steel_yield_strain(fy: float, es: float) -> dict:
         raise ValueError("es (modulus of elasticity) must be positive.")
 
     epsilon_s = fy / es
-    return {
-        "value": epsilon_s,
-        "report": f"Yield steel strain, ε_s = fy / Es = {fy:.6f} / {es:.6f} = {epsilon_s:.6f}"
-    }
+    if report:
+        rep = _yield_strain_report(fy, es, epsilon_s)
+    else:
+        rep = DeferredReport(_yield_strain_report, fy, es, epsilon_s)
+    return {"value": epsilon_s, "report": rep}
 
 
-def calculate_beta_one(fc: float) -> dict:
+def _beta_one_report(fc, beta_one):
+    if 28 < fc < 55:
+        return (
+            f"beta_1 = 0.85 - (0.05 * (fc - 28)) / 7\n"
+            f"       = 0.85 - (0.05 * ({fc:.2f} - 28)) / 7\n"
+            f"       = {beta_one:.2f}"
+        )
+    return f"beta_1 = {beta_one:.2f}"
+
+
+def calculate_beta_one(fc: float, report: bool = True) -> dict:
     """
     Calculate the concrete beta_1 factor for compression block depth calculation.
 
@@ -162,13 +242,16 @@ def calculate_beta_one(fc: float) -> dict:
     -----------
     fc : float
         Concrete compressive strength in MPa. Must be >= 17 MPa.
+    report : bool, optional
+        If True (default), 'report' is formatted immediately. If False, it is
+        a DeferredReport that is only formatted when converted to str.
 
     Returns:
     --------
     result : dict
         A dictionary with:
           - 'value': the calculated beta_1 value (float)
-          - 'report': a formatted string describing the calculation.
+          - 'report': a formatted string (or DeferredReport) describing the calculation.
 
     Raises:
     -------
@@ -182,23 +265,20 @@ def calculate_beta_one(fc: float) -> dict:
 
     if 17 <= fc <= 28:
         beta_one = 0.85
-        rep = "beta_1 = 0.85"
     elif 28 < fc < 55:
         beta_one = 0.85 - ((0.05 * (fc - 28)) / 7.0)
-        rep = (
-            f"beta_1 = 0.85 - (0.05 * (fc - 28)) / 7\n"
-            f"       = 0.85 - (0.05 * ({fc:.2f} - 28)) / 7\n"
-            f"       = {beta_one:.2f}"
-        )
     else:  # fc >= 55
         beta_one = 0.65
-        rep = "beta_1 = 0.65"
 
     # Additional safety checks or provisions (if needed):
     # For NSCP 2015, typically identical approach is used as ACI 318 for normal strength concrete.
     # High-strength concretes might have additional modifications or limitations in certain codes.
     # Always consult code if fc > 55 MPa regarding confinement, deflection checks, etc.
 
+    if report:
+        rep = _beta_one_report(fc, beta_one)
+    else:
+        rep = DeferredReport(_beta_one_report, fc, beta_one)
     return {"value": beta_one, "report": rep}
 
 
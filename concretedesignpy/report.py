@@ -0,0 +1,79 @@
+# SPDX-License-Identifier: MIT
+"""
+report.py
+---------
+Deferred rendering of human-readable calculation reports.
+
+Functions that return {"value": ..., "report": ...} can hand back a
+`DeferredReport` instead of a formatted string. It keeps the renderer and its
+arguments and formats the text only when it is first converted to str, so
+batch runs that only read "value" never pay for string formatting.
+`render_reports` joins the reports of many members into one calc report.
+
+This code is open-source and licensed under the MIT License.
+"""
+
+
+class DeferredReport:
+    """
+    A report string rendered on first use.
+
+    Args:
+        render (callable): Function returning the report text.
+        *args: Arguments passed to `render`.
+    """
+
+    __slots__ = ("_render", "_args", "_text")
+
+    def __init__(self, render, *args):
+        self._render = render
+        self._args = args
+        self._text = None
+
+    def __str__(self):
+        if self._text is None:
+            self._text = self._render(*self._args)
+            self._render = self._args = None
+        return self._text
+
+    def __format__(self, format_spec):
+        return format(str(self), format_spec)
+
+    def __eq__(self, other):
+        if isinstance(other, (str, DeferredReport)):
+            return str(self) == str(other)
+        return NotImplemented
+
+    def __hash__(self):
+        return hash(str(self))
+
+    def __repr__(self):
+        state = "rendered" if self._text is not None else "pending"
+        return f"<DeferredReport {state}>"
+
+
+def render_reports(results, titles=None):
+    """
+    Render the reports of many results into a single calc report.
+
+    Args:
+        results (iterable): Result dicts with a "report" entry (str or
+            DeferredReport), or the reports themselves.
+        titles (iterable, optional): One heading per result, e.g. member
+            labels. Defaults to "Item 1", "Item 2", ...
+
+    Returns:
+        str: The combined report, one section per result.
+    """
+    results = list(results)
+    titles = list(titles) if titles is not None else [
+        f"Item {i}" for i in range(1, len(results) + 1)
+    ]
+    if len(titles) != len(results):
+        raise ValueError("titles must have one entry per result.")
+
+    sections = []
+    for title, result in zip(titles, results):
+        body = result["report"] if isinstance(result, dict) else result
+        sections.append(f"{title}\n{'-' * len(str(title))}\n{body}")
+    return "\n\n".join(sections)
@@ -0,0 +1,254 @@
+# SPDX-License-Identifier: MIT
+"""
+runner.py
+---------
+Project-wide member checks on a process pool.
+
+A member is a plain dict:
+
+    {
+        "id": "B-12",                 # any label, returned with the result
+        "type": "beam" or "column",
+        "b": 300.0, "h": 600.0,       # section [mm]
+        "fc": 28.0, "fy": 420.0,      # materials [MPa]; optional "es", "ecu"
+        "rebar": [{"d": 60, "diam": 16, "num": 2}, ...],  # process_rebar_data format
+        "mu": 250e6,                  # demands: Mu [N·mm], optional "vu" [N], "pu" [N]
+        "stirrup": {"av": 157.0, "spacing": 150.0, "fyt": 280.0},  # beams, optional
+    }
+
+Beams get a flexure check (`calculate_rebar_forces_batch`, phi from the
+strength reduction factor) and, when "vu" and "stirrup" are given, a shear
+check (`calculate_vc` / `calculate_vs`). Columns get a P–M check: phi * Mn
+at Pu is read from the phi-reduced curve of `compute_pm_curve` (pure tension
+to pure compression), and Pu may not exceed 0.80 * phi * Po (tied columns).
+
+Members are split into chunks; a worker handles a whole chunk, building the
+material objects once per chunk and solving all beams of the chunk in one
+batch. Results are yielded in input order as chunks complete, and an error in
+one member is reported in its own result without stopping the run.
+
+This code is open-source and licensed under the MIT License.
+"""
+
+import itertools
+import os
+import traceback
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+
+from concretedesignpy.beam.moment_capacity import (
+    calculate_rebar_forces_batch,
+    pack_rebar_layers,
+    process_rebar_data,
+)
+from concretedesignpy.beam.shear_capacity import calculate_vc, calculate_vs
+from concretedesignpy.provision import calculate_strength_reduction_factor
+from concretedesignpy.section.geometry import calculate_po, compute_pm_curve
+from concretedesignpy.section.material import Concrete, Steel
+
+MEMBER_TYPES = ("beam", "column")
+
+
+def _materials(member, cache):
+    """Concrete and Steel for a member, shared within a chunk."""
+    key = (member["fc"], member.get("ecu", 0.003), member["fy"], member.get("es", 200000.0))
+    if key not in cache:
+        cache[key] = (Concrete(key[0], ecu=key[1]), Steel(key[2], es=key[3]))
+    return cache[key]
+
+
+def _prepare(member, cache):
+    """Validate a member and compute its rebar areas."""
+    if member.get("type") not in MEMBER_TYPES:
+        raise ValueError(f"type must be one of {MEMBER_TYPES}.")
+    if member["b"] <= 0 or member["h"] <= 0:
+        raise ValueError("Section dimensions b and h must be positive.")
+    bars = process_rebar_data(member["rebar"], report=False)["value"]
+    if any(bar["d"] <= 0 or bar["d"] >= member["h"] for bar in bars):
+        raise ValueError("Rebar depths must lie within the section height.")
+    concrete, steel = _materials(member, cache)
+    return bars, concrete, steel
+
+
+def _flexure_batch(members, bar_lists, materials):
+    """Flexure checks for a list of beams in one batch solve."""
+    depths, areas = pack_rebar_layers(bar_lists)
+    concrete = [m[0] for m in materials]
+    steel = [m[1] for m in materials]
+    result = calculate_rebar_forces_batch(
+        depths, areas,
+        [m["h"] for m in members], [m["b"] for m in members],
+        [c.fc for c in concrete], [s.fy for s in steel], [s.es for s in steel],
+        [c.ecu for c in concrete], [c.beta_one for c in concrete],
+    )
+    eps_t = np.maximum(np.nan_to_num(result["eps_t"], nan=0.0), 0.0)
+    phi = calculate_strength_reduction_factor(eps_t, [s.eps_y for s in steel], "others")
+    checks = []
+    for i, member in enumerate(members):
+        if not result["converged"][i]:
+            checks.append({"ok": False, "error": "no neutral axis found"})
+            continue
+        phi_mn = float(phi[i] * result["moment"][i])
+        mu = abs(member.get("mu", 0.0))
+        checks.append({
+            "ok": phi_mn >= mu,
+            "phi_mn": phi_mn,
+            "phi": float(phi[i]),
+            "neutral_axis": float(result["neutral_axis"][i]),
+            "eps_t": float(result["eps_t"][i]),
+            "utilization": mu / phi_mn if phi_mn > 0 else np.inf,
+        })
+    return checks
+
+
+def _shear_check(member, bars):
+    stirrup = member["stirrup"]
+    d = max(bar["d"] for bar in bars)
+    vc = float(calculate_vc(member["fc"], member["b"], d))
+    vs = float(calculate_vs(stirrup["av"], stirrup.get("fyt", member["fy"]), d,
+                            stirrup["spacing"]))
+    phi_vn = 0.75 * (vc + vs)
+    vu = abs(member["vu"])
+    return {"ok": phi_vn >= vu, "phi_vn": phi_vn, "vc": vc, "vs": vs,
+            "utilization": vu / phi_vn}
+
+
+def _column_check(member, bars, concrete, steel):
+    as_list = [bar["as"] for bar in bars]
+    d_list = [bar["d"] for bar in bars]
+    curve = compute_pm_curve(concrete.fc, steel.fy, member["b"], member["h"],
+                             concrete.beta_one, steel.es, as_list, d_list)
+    po = calculate_po(concrete.fc, steel.fy, member["b"], member["h"], as_list)
+    phi_pn_max = 0.80 * 0.65 * po
+    phi_p = curve["phi"] * curve["P"]
+    phi_m = curve["phi"] * curve["M"]
+
+    # phi*Mn at Pu on the uncapped curve (Pt to Po), the largest where the
+    # curve crosses Pu more than once; the cap only limits Pu itself
+    pu = member.get("pu", 0.0)
+    mu = abs(member.get("mu", 0.0))
+    p0, p1, m0, m1 = phi_p[:-1], phi_p[1:], phi_m[:-1], phi_m[1:]
+    crosses = (np.minimum(p0, p1) <= pu) & (pu <= np.maximum(p0, p1))
+    phi_mn = 0.0
+    if pu <= phi_pn_max and crosses.any():
+        p0, p1, m0, m1 = p0[crosses], p1[crosses], m0[crosses], m1[crosses]
+        flat = p1 == p0
+        t = np.where(flat, 0.0, (pu - p0) / np.where(flat, 1.0, p1 - p0))
+        m_at_pu = np.where(flat, np.maximum(m0, m1), m0 + t * (m1 - m0))
+        phi_mn = max(float(m_at_pu.max()), 0.0)
+    return {
+        "ok": phi_mn > 0 and mu <= phi_mn,
+        "phi_mn": phi_mn,
+        "phi_pn_max": float(phi_pn_max),
+        "utilization": mu / phi_mn if phi_mn > 0 else np.inf,
+    }
+
+
+def _error(exc):
+    return "".join(traceback.format_exception_only(type(exc), exc)).strip()
+
+
+def _run_chunk(chunk):
+    """Check a chunk of (index, member) pairs; never raises for a bad member."""
+    cache = {}
+    results = {}
+    beams = []
+    for index, member in chunk:
+        label = member.get("id", index) if isinstance(member, dict) else index
+        results[index] = {"index": index, "id": label, "ok": True, "error": None, "checks": {}}
+        try:
+            bars, concrete, steel = _prepare(member, cache)
+            if member["type"] == "beam":
+                beams.append((index, member, bars, (concrete, steel)))
+                if "vu" in member and "stirrup" in member:
+                    results[index]["checks"]["shear"] = _shear_check(member, bars)
+            else:
+                results[index]["checks"]["pm"] = _column_check(member, bars, concrete, steel)
+        except Exception as exc:  # isolate the member, keep the chunk going
+            results[index].update(ok=False, error=_error(exc))
+
+    # All beams of the chunk in one solve; on failure, retry one by one
+    groups = [beams] if beams else []
+    while groups:
+        group = groups.pop()
+        try:
+            _, group_members, bar_lists, materials = zip(*group)
+            checks = _flexure_batch(group_members, bar_lists, materials)
+        except Exception as exc:
+            if len(group) == 1:
+                results[group[0][0]].update(ok=False, error=_error(exc))
+            else:
+                groups.extend([item] for item in group)
+            continue
+        for (index, *_), check in zip(group, checks):
+            results[index]["checks"]["flexure"] = check
+
+    out = []
+    for index, _ in chunk:
+        result = results[index]
+        result["passed"] = result["ok"] and all(c.get("ok") for c in result["checks"].values())
+        out.append(result)
+    return out
+
+
+def check_member(member):
+    """
+    Run the checks for a single member in-process.
+
+    Returns:
+    dict: {
+        "index": 0, "id": member id,
+        "ok": False if the member could not be checked (see "error"),
+        "error": str or None,
+        "checks": {"flexure" | "shear" | "pm": {"ok", "utilization", ...}},
+        "passed": True if ok and every check passes
+    }
+    """
+    return _run_chunk([(0, member)])[0]
+
+
+def run_members(members, max_workers=None, chunk_size=64):
+    """
+    Check many members in parallel, yielding results in input order.
+
+    Parameters:
+    members (iterable): Member dicts (see module docstring); consumed lazily,
+        one chunk at a time per worker.
+    max_workers (int): Worker processes; 1 runs in-process, None uses os.cpu_count().
+    chunk_size (int): Members per task. Default 64.
+
+    Yields:
+    dict: One result per member, as returned by `check_member`, with "index"
+    the member's position in `members`.
+    """
+    if chunk_size < 1:
+        raise ValueError("chunk_size must be at least 1.")
+
+    def chunks():
+        chunk = []
+        for item in enumerate(members):
+            chunk.append(item)
+            if len(chunk) == chunk_size:
+                yield chunk
+                chunk = []
+        if chunk:
+            yield chunk
+
+    workers = max_workers if max_workers is not None else (os.cpu_count() or 1)
+    if workers <= 1:
+        for chunk in chunks():
+            yield from _run_chunk(chunk)
+        return
+
+    # Keep a bounded window of chunks in flight so huge member lists stream
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        source = chunks()
+        pending = [pool.submit(_run_chunk, chunk)
+                   for chunk in itertools.islice(source, 2 * workers)]
+        while pending:
+            results = pending.pop(0).result()
+            chunk = next(source, None)
+            if chunk is not None:
+                pending.append(pool.submit(_run_chunk, chunk))
+            yield from results
@@ -0,0 +1,240 @@
+# SPDX-License-Identifier: MIT
+"""
+biaxial.py
+----------
+Biaxial P-Mx-My interaction surface of rectangular RC columns.
+
+The neutral axis is rotated through a set of angles and, for each angle,
+swept through a range of depths. The Whitney block is integrated exactly
+over the gross section (the rectangle clipped by the block edge), and the
+bars are placed at the steel fibers of `build_fiber_mesh`. Every angle is
+evaluated as one vectorized (n_depths x n_bars) pass. Angles can be
+distributed over a ProcessPoolExecutor for very fine sweeps; by default they
+run in-process, since the default 36 x 60 sweep takes about 10 ms, less than
+starting a pool.
+
+The steel layer convention follows `compute_pm_curve`: strain =
+0.003 * (c - depth) / c, fs clamped to +/- fy, displaced concrete deducted
+for bars inside the stress block (`calculate_steel_layer_forces`).
+
+This code is open-source and licensed under the MIT License.
+"""
+
+import os
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+
+from concretedesignpy.general import area_diam
+from concretedesignpy.section.fiber import STEEL, build_fiber_mesh
+from concretedesignpy.section.geometry import calculate_steel_layer_forces
+
+
+class InteractionSurface:
+    """
+    Triangulated P-Mx-My interaction surface.
+
+    Attributes:
+        P, Mx, My : vertex coordinates [N, N·mm, N·mm]; compression positive,
+                    Mx about the horizontal axis, My about the vertical axis
+        triangles : (n_triangles, 3) vertex indices
+        angles    : neutral axis angles used [rad]
+        n_depths  : number of neutral axis depths per angle
+    """
+
+    __slots__ = ("P", "Mx", "My", "triangles", "angles", "n_depths")
+
+    def __init__(self, P, Mx, My, triangles, angles, n_depths):
+        self.P = P
+        self.Mx = Mx
+        self.My = My
+        self.triangles = triangles
+        self.angles = angles
+        self.n_depths = n_depths
+
+    @property
+    def vertices(self):
+        """(n_vertices, 3) array of (Mx, My, P)."""
+        return np.column_stack((self.Mx, self.My, self.P))
+
+    def __repr__(self):
+        return (f"InteractionSurface({self.P.size} vertices, "
+                f"{self.triangles.shape[0]} triangles)")
+
+
+def _block_integrals(corners, normal, a):
+    """
+    Area and first moments of the part of a convex polygon inside the block.
+
+    Green's theorem over the polygon edges clipped to the block, taken about
+    a point on the block edge so the closing chord contributes nothing.
+
+    Parameters:
+        corners : (n_corners, 2) counter-clockwise polygon vertices (u, v)
+        normal  : unit vector (nu, nv) pointing towards the compression side
+        a       : (n_a,) block depths below the extreme compression vertex
+
+    Returns:
+        (area, Qu, Qv), each (n_a,); Qu = ∫u dA, Qv = ∫v dA
+    """
+    proj = corners @ normal
+    top = proj.max()
+    depth = top - proj
+    a = a[:, None]
+    d_i, d_j = depth, np.roll(depth, -1)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        t = np.clip((a - d_i) / (d_j - d_i), 0.0, 1.0)
+    in_i, in_j = d_i < a, d_j < a
+    t_start = np.where(in_i, 0.0, np.where(in_j, t, 0.0))
+    t_end = np.where(in_j, 1.0, np.where(in_i, t, 0.0))
+
+    p_i = corners
+    edge = np.roll(corners, -1, axis=0) - corners
+    ref = (top - a) * np.asarray(normal)   # (n_a, 2), on the block edge
+    start = p_i + t_start[..., None] * edge - ref[:, None, :]
+    end = p_i + t_end[..., None] * edge - ref[:, None, :]
+    cross = start[..., 0] * end[..., 1] - end[..., 0] * start[..., 1]
+    area = cross.sum(axis=1) / 2.0
+    qu = ((start[..., 0] + end[..., 0]) * cross).sum(axis=1) / 6.0
+    qv = ((start[..., 1] + end[..., 1]) * cross).sum(axis=1) / 6.0
+    return area, qu + ref[:, 0] * area, qv + ref[:, 1] * area
+
+
+def _surface_for_angles(angles, u_s, v_s, a_s, corners,
+                        fc, fy, es, beta_one, n_depths):
+    """
+    P, Mx, My for a chunk of angles. Returns three (n_angles, n_depths) arrays.
+    """
+    shape = (angles.size, n_depths)
+    P = np.empty(shape)
+    Mx = np.empty(shape)
+    My = np.empty(shape)
+
+    for k, theta in enumerate(angles):
+        # Unit vector pointing towards the compression side
+        nu, nv = np.cos(theta), np.sin(theta)
+        proj = corners[:, 0] * nu + corners[:, 1] * nv
+        top = proj.max()
+        extent = top - proj.min()
+
+        depth_s = top - (u_s * nu + v_s * nv)
+
+        eps_y = fy / es
+        c_max = max(extent / beta_one, 0.003 * depth_s.max() / max(0.003 - eps_y, 1e-4))
+        c = np.geomspace(0.01 * extent, c_max, n_depths)[:, None]
+        a_block = np.minimum(beta_one * c, extent)
+
+        # Concrete: Whitney block integrated over the gross section
+        area, qu, qv = _block_integrals(corners, (nu, nv), a_block[:, 0])
+        p_conc = 0.85 * fc * area
+        mx_conc = 0.85 * fc * qv
+        my_conc = 0.85 * fc * qu
+
+        # Steel, net of the concrete displaced inside the block
+        fs = np.clip(es * 0.003 * (c - depth_s) / c, -fy, fy)
+        f_s = calculate_steel_layer_forces(a_s, fs, depth_s, a_block, fc)
+
+        P[k] = p_conc + f_s.sum(axis=1)
+        Mx[k] = mx_conc + f_s @ v_s
+        My[k] = my_conc + f_s @ u_s
+
+    return P, Mx, My
+
+
+def _triangulate(n_angles, n_depths):
+    """Triangles of a closed (angle x depth) grid with two pole vertices."""
+    i = np.arange(n_angles)[:, None]
+    j = np.arange(n_depths - 1)[None, :]
+    i_next = (i + 1) % n_angles
+    v00 = i * n_depths + j
+    v10 = i_next * n_depths + j
+    v01 = v00 + 1
+    v11 = v10 + 1
+    side = np.concatenate((
+        np.stack((v00, v10, v11), axis=-1).reshape(-1, 3),
+        np.stack((v00, v11, v01), axis=-1).reshape(-1, 3),
+    ))
+
+    tension_pole = n_angles * n_depths
+    compression_pole = tension_pole + 1
+    ring = np.arange(n_angles)
+    first = ring * n_depths
+    last = first + n_depths - 1
+    caps = np.concatenate((
+        np.column_stack((np.full(n_angles, tension_pole),
+                         (ring + 1) % n_angles * n_depths, first)),
+        np.column_stack((np.full(n_angles, compression_pole),
+                         last, (ring + 1) % n_angles * n_depths + n_depths - 1)),
+    ))
+    return np.concatenate((side, caps))
+
+
+def interaction_surface(width, height, cover, ds, db, nx, ny, fc, fy, es,
+                        beta_one, n_angles=36, n_depths=60, max_workers=1):
+    """
+    Generate the biaxial P-Mx-My interaction surface of a rectangular column.
+
+    Parameters:
+        width, height : Section dimensions [mm]
+        cover         : Concrete cover (to stirrup outer face) [mm]
+        ds            : Diameter of stirrups [mm]
+        db            : Diameter of main bars [mm]
+        nx, ny        : Number of bars along top/bottom and left/right
+        fc            : Concrete compressive strength [MPa]
+        fy            : Steel yield strength [MPa]
+        es            : Steel modulus of elasticity [MPa]
+        beta_one      : Whitney stress block factor
+        n_angles      : Number of neutral axis angles over 360 degrees
+        n_depths      : Number of neutral axis depths per angle
+        max_workers   : Worker processes for the angle sweep. Default 1
+                        computes in-process; a pool only pays off for sweeps of
+                        several hundred angles x depths (None uses
+                        os.cpu_count()). Callers using a pool under the spawn
+                        start method need an `if __name__ == "__main__"` guard.
+
+    Returns:
+        InteractionSurface
+    """
+    if n_angles < 3 or n_depths < 2:
+        raise ValueError("n_angles must be >= 3 and n_depths >= 2.")
+
+    # Bar positions from the steel fibers of the mesh
+    mesh = build_fiber_mesh(width, height, cover, ds, db, nx, ny)
+    steel = mesh["material"] == STEEL
+    u_s = mesh["x"][steel] - width / 2.0
+    v_s = mesh["y"][steel] - height / 2.0
+    a_s = np.full(u_s.size, area_diam(db))
+    corners = np.array([
+        [-width / 2.0, -height / 2.0],
+        [width / 2.0, -height / 2.0],
+        [width / 2.0, height / 2.0],
+        [-width / 2.0, height / 2.0],
+    ])
+
+    angles = np.linspace(0.0, 2.0 * np.pi, n_angles, endpoint=False)
+    args = (u_s, v_s, a_s, corners, fc, fy, es, beta_one, n_depths)
+
+    workers = max_workers if max_workers is not None else (os.cpu_count() or 1)
+    workers = max(1, min(workers, n_angles))
+    if workers == 1:
+        P, Mx, My = _surface_for_angles(angles, *args)
+    else:
+        chunks = np.array_split(angles, workers)
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            futures = [pool.submit(_surface_for_angles, chunk, *args) for chunk in chunks]
+            parts = [f.result() for f in futures]
+        P, Mx, My = (np.concatenate(col) for col in zip(*parts))
+
+    # Pure tension and pure compression poles close the surface
+    as_total = a_s.sum()
+    pt = -fy * as_total
+    po = 0.85 * fc * (width * height - as_total) + fy * as_total
+
+    return InteractionSurface(
+        P=np.concatenate((P.ravel(), [pt, po])),
+        Mx=np.concatenate((Mx.ravel(), [0.0, 0.0])),
+        My=np.concatenate((My.ravel(), [0.0, 0.0])),
+        triangles=_triangulate(n_angles, n_depths),
+        angles=angles,
+        n_depths=n_depths,
+    )
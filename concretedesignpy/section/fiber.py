@@ -0,0 +1,127 @@
+# SPDX-License-Identifier: MIT
+"""
+fiber.py
+--------
+Fiber discretization of rectangular reinforced concrete sections.
+
+The section is split into unconfined cover concrete, confined core concrete
+(inside the stirrup centre-line, as in Mander's model) and one steel fiber per
+main bar, using the layout from `generate_rebar_layout`. Fibers are stored
+as contiguous NumPy arrays so that fiber-based analyses (moment-curvature,
+pushover) can evaluate stresses for the whole section in one call.
+
+This code is open-source and licensed under the MIT License.
+"""
+
+from functools import lru_cache
+
+import numpy as np
+
+from concretedesignpy.section.geometry import generate_rebar_layout
+
+# Material ids stored in the "material" array
+COVER = 0
+CORE = 1
+STEEL = 2
+
+
+def _edges(length, offset, n_cover, n_core):
+    """Fiber edges along one axis: cover strip, core, cover strip."""
+    return np.concatenate((
+        np.linspace(0.0, offset, n_cover + 1),
+        np.linspace(offset, length - offset, n_core + 1)[1:],
+        np.linspace(length - offset, length, n_cover + 1)[1:],
+    ))
+
+
+@lru_cache(maxsize=256)
+def _build_fiber_mesh(width, height, cover, ds, db, nx, ny,
+                      n_fibers_x, n_fibers_y, n_cover_fibers):
+    # --- 1) Concrete grid, aligned with the stirrup centre-line ---
+    offset = cover + 0.5 * ds
+    x_edges = _edges(width, offset, n_cover_fibers, n_fibers_x)
+    y_edges = _edges(height, offset, n_cover_fibers, n_fibers_y)
+
+    x_mid = 0.5 * (x_edges[:-1] + x_edges[1:])
+    y_mid = 0.5 * (y_edges[:-1] + y_edges[1:])
+    x_c, y_c = np.meshgrid(x_mid, y_mid)
+    area_c = np.outer(np.diff(y_edges), np.diff(x_edges))
+
+    in_core_x = (x_mid > offset) & (x_mid < width - offset)
+    in_core_y = (y_mid > offset) & (y_mid < height - offset)
+    material_c = np.where(np.outer(in_core_y, in_core_x), CORE, COVER)
+
+    # --- 2) Steel fibers, one per main bar ---
+    layout = generate_rebar_layout(width, height, cover, ds, db, nx, ny)
+    bars = layout["coords"]
+    n_bars = bars.shape[0]
+
+    # --- 3) Contiguous fiber arrays ---
+    x = np.concatenate((x_c.ravel(), bars[:, 0]))
+    y = np.concatenate((y_c.ravel(), bars[:, 1]))
+    area = np.concatenate((area_c.ravel(), layout["area"]))
+    material = np.concatenate((
+        material_c.ravel().astype(np.int8), np.full(n_bars, STEEL, dtype=np.int8)
+    ))
+    for arr in (x, y, area, material):
+        arr.flags.writeable = False
+
+    return {
+        "x": x,
+        "y": y,
+        "area": area,
+        "material": material,
+        "width": width,
+        "height": height,
+        "core_bounds": (offset, width - offset, offset, height - offset),
+        "n_concrete": x_c.size,
+        "n_steel": n_bars,
+    }
+
+
+def build_fiber_mesh(width, height, cover, ds, db, nx, ny,
+                     n_fibers_x=20, n_fibers_y=40, n_cover_fibers=2):
+    """
+    Build (or fetch from cache) the fiber mesh of a rectangular RC section.
+
+    Parameters:
+        width          : Section width  [mm]
+        height         : Section height [mm]
+        cover          : Concrete cover (to stirrup outer face) [mm]
+        ds             : Diameter of stirrups   [mm]
+        db             : Diameter of main bars  [mm]
+        nx             : Number of bars along top & bottom
+        ny             : Number of bars along left & right
+        n_fibers_x     : Number of core fibers across the width
+        n_fibers_y     : Number of core fibers over the height
+        n_cover_fibers : Number of fibers across each cover strip
+
+    Returns:
+        dict: {
+            'x', 'y'      : fiber centroid coordinates [mm] (origin at the
+                            bottom-left corner, as in compute_rebar_coordinates),
+            'area'        : fiber areas [mm²],
+            'material'    : fiber material ids (COVER, CORE or STEEL),
+            'width', 'height',
+            'core_bounds' : (x_min, x_max, y_min, y_max) of the confined core,
+            'n_concrete'  : number of concrete fibers (stored first),
+            'n_steel'     : number of steel fibers (stored last)
+        }
+
+    Notes:
+    - Meshes are cached on the section parameters; the arrays are shared
+      between calls and are therefore read-only.
+    - Concrete fiber areas are gross areas (not reduced for the bars).
+    """
+    if width <= 0 or height <= 0:
+        raise ValueError("Section width and height must be positive.")
+    if 2 * (cover + 0.5 * ds) >= min(width, height):
+        raise ValueError("Cover and stirrup leave no confined core.")
+    if min(n_fibers_x, n_fibers_y, n_cover_fibers) < 1:
+        raise ValueError("Fiber counts must be at least 1.")
+
+    mesh = _build_fiber_mesh(
+        float(width), float(height), float(cover), float(ds), float(db),
+        int(nx), int(ny), int(n_fibers_x), int(n_fibers_y), int(n_cover_fibers)
+    )
+    return dict(mesh)
@@ -1,4 +1,116 @@
-import matplotlib.pyplot as plt
+import numpy as np
+
+from concretedesignpy import profiling
+from concretedesignpy.provision import calculate_strength_reduction_factor
+
+_PLOTTING = ("plot_beam_rebar", "plot_pm_points_with_curve")
+
+
+def __getattr__(name):
+    # Plotting moved to concretedesignpy.plotting; imported only when used.
+    if name in _PLOTTING:
+        from concretedesignpy import plotting
+        return getattr(plotting, name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+# =============================================================================
+# Function: generate_rebar_layout
+# =============================================================================
+def _local_index(counts):
+    """0..count-1 for every group of a flat array laid out by `counts`."""
+    starts = np.cumsum(counts) - counts
+    return np.arange(counts.sum()) - np.repeat(starts, counts)
+
+
+def _spaced(t_index, n, lo, hi):
+    """Evenly spaced positions lo..hi (exact endpoints); the midpoint when n == 1."""
+    t = np.where(n > 1, t_index / np.maximum(n - 1, 1), 0.5)
+    return (1.0 - t) * lo + t * hi
+
+
+def generate_rebar_layout(width, height, cover, ds, db, nx, ny):
+    """
+    Compute perimeter rebar layouts for one or many rectangular sections at once.
+
+    All parameters may be scalars or 1-D arrays (one entry per section) and are
+    broadcast against each other, so every section can have its own size, bar
+    diameter and nx / ny. The bars of all sections are stored in one flat
+    array; section k owns rows offsets[k]:offsets[k + 1].
+
+    Parameters:
+        width    : Section width  [mm]
+        height   : Section height [mm]
+        cover    : Concrete cover (to stirrup outer face) [mm]
+        ds       : Diameter of stirrups   [mm]
+        db       : Diameter of main bars  [mm]
+        nx       : Number of bars along top & bottom (>= 1)
+        ny       : Number of bars along left & right (>= 1)
+
+    Returns:
+        dict: {
+            'coords'   : (n_bars, 2) array of (x, y) bar centres, sorted by (y, x)
+                         within each section,
+            'diameter' : (n_bars,) bar diameters [mm],
+            'area'     : (n_bars,) bar areas [mm²],
+            'section'  : (n_bars,) index of the section owning each bar,
+            'offsets'  : (n_sections + 1,) start of each section in the flat arrays
+        }
+
+    Notes:
+    - Corner bars are shared by a face with nx bars and a face with ny bars.
+      When both nx and ny are at least 2, the left/right faces skip their end
+      positions instead of comparing coordinates, so corners appear exactly once.
+    """
+    width, height, cover, ds, db, nx, ny = np.broadcast_arrays(
+        *(np.atleast_1d(np.asarray(v)) for v in (width, height, cover, ds, db, nx, ny))
+    )
+    if width.ndim != 1:
+        raise ValueError("Section parameters must be scalars or 1-D arrays.")
+    if not (np.issubdtype(nx.dtype, np.integer) and np.issubdtype(ny.dtype, np.integer)):
+        raise ValueError("nx and ny must be integers.")
+    if np.any(nx < 1) or np.any(ny < 1):
+        raise ValueError("nx and ny must be at least 1.")
+    if np.any(db <= 0):
+        raise ValueError("Bar diameter db must be positive.")
+
+    width = width.astype(float)
+    height = height.astype(float)
+    rebar_offset = cover + ds + 0.5 * db
+    x_left, x_right = rebar_offset, width - rebar_offset
+    y_bot, y_top = rebar_offset, height - rebar_offset
+    n_sections = width.size
+    sections = np.arange(n_sections)
+
+    # Top & bottom faces: nx bars each, corners included
+    i = _local_index(nx)
+    sec_h = np.repeat(sections, nx)
+    x_h = _spaced(i, nx[sec_h], x_left[sec_h], x_right[sec_h])
+
+    # Left & right faces: skip the corners already placed on top & bottom
+    trim = (nx >= 2) & (ny >= 2)
+    n_side = np.where(trim, ny - 2, ny)
+    j = _local_index(n_side)
+    sec_v = np.repeat(sections, n_side)
+    y_v = _spaced(j + trim[sec_v], ny[sec_v], y_bot[sec_v], y_top[sec_v])
+
+    x = np.concatenate((x_h, x_h, x_left[sec_v], x_right[sec_v]))
+    y = np.concatenate((y_bot[sec_h], y_top[sec_h], y_v, y_v))
+    section = np.concatenate((sec_h, sec_h, sec_v, sec_v))
+
+    order = np.lexsort((x, y, section))
+    section = section[order]
+    diameter = db.astype(float)[section]
+    counts = np.bincount(section, minlength=n_sections)
+
+    return {
+        "coords": np.column_stack((x[order], y[order])),
+        "diameter": diameter,
+        "area": (np.pi / 4.0) * diameter ** 2,
+        "section": section,
+        "offsets": np.concatenate(([0], np.cumsum(counts))),
+    }
+
 
 # =============================================================================
 # Function: compute_rebar_coordinates
@@ -20,8 +132,11 @@ def compute_rebar_coordinates(width, height, cover, ds, db, nx, ny):
         dict: {
             'section_corners': 4 points (x, y) for the OUTER rectangle (unconfined section),
             'stirrup_corners': 4 points (x, y) for the STIRRUP CENTER-LINE rectangle,
-            'rebar_coords':    (x, y) locations for each main rebar
+            'rebar_coords':    (x, y) locations for each main rebar, sorted by (y, x)
         }
+
+    Corner bars are counted once by position index, not by comparing floats.
+    See `generate_rebar_layout` for array output and many sections at once.
     """
     # --- 1) Outer rectangle corners (unconfined section) ---
     section_corners = [
@@ -49,32 +164,27 @@ def compute_rebar_coordinates(width, height, cover, ds, db, nx, ny):
     y_bot   = rebar_offset
     y_top   = height - rebar_offset
 
-    # --- 4) Compute rebar coordinates ---
-    rebar_coords = []
-
-    # Horizontal bars (top & bottom)
+    # --- 4) Compute rebar coordinates, as (y, x) so that sorting gives (y, x) order ---
     if nx == 1:
         x_positions = [(x_left + x_right) / 2.0]
     else:
-        dx = (x_right - x_left) / (nx - 1)
-        x_positions = [x_left + i * dx for i in range(nx)]
-    for x_pos in x_positions:
-        rebar_coords.append((x_pos, y_bot))  # bottom bar
-        rebar_coords.append((x_pos, y_top))  # top bar
-
-    # Vertical bars (left & right)
+        x_positions = [(1.0 - t) * x_left + t * x_right
+                       for t in (i / (nx - 1) for i in range(nx))]
     if ny == 1:
         y_positions = [(y_bot + y_top) / 2.0]
     else:
-        dy = (y_top - y_bot) / (ny - 1)
-        y_positions = [y_bot + i * dy for i in range(ny)]
-    for y_pos in y_positions:
-        rebar_coords.append((x_left,  y_pos))  # left bar
-        rebar_coords.append((x_right, y_pos))  # right bar
-
-    # Remove duplicates (corner bars appear in both sets)
-    rebar_coords = list(set(rebar_coords))
-    rebar_coords.sort(key=lambda pt: (pt[1], pt[0]))
+        y_positions = [(1.0 - t) * y_bot + t * y_top
+                       for t in (j / (ny - 1) for j in range(ny))]
+        if nx > 1:
+            # Corner bars are already placed on the top & bottom faces
+            y_positions = y_positions[1:-1]
+
+    yx = [(y_bot, x_pos) for x_pos in x_positions]
+    yx += [(y_top, x_pos) for x_pos in x_positions]
+    yx += [(y_pos, x_left) for y_pos in y_positions]
+    yx += [(y_pos, x_right) for y_pos in y_positions]
+    yx.sort()
+    rebar_coords = [(x_pos, y_pos) for (y_pos, x_pos) in yx]
 
     return {
         "section_corners": section_corners,
@@ -83,61 +193,6 @@ def compute_rebar_coordinates(width, height, cover, ds, db, nx, ny):
     }
 
 
-# =============================================================================
-# Function: plot_beam_rebar
-# =============================================================================
-def plot_beam_rebar(width, height, section_corners, stirrup_corners, rebar_coords, show_labels=True):
-    """
-    Plot the beam cross-section with the rebar layout.
-
-    Parameters:
-        width           : Section width [mm]
-        height          : Section height [mm]
-        section_corners : List of 4 points for the outer rectangle (unconfined section)
-        stirrup_corners : List of 4 points for the stirrup center-line rectangle (confined section)
-        rebar_coords    : List of (x, y) coordinates for each main rebar
-        show_labels     : If True, labels are added to the plot
-    """
-    fig, ax = plt.subplots(figsize=(5, 6))
-
-    # --- 1) Plot the outer rectangle (unconfined section) ---
-    x_vals = [p[0] for p in section_corners] + [section_corners[0][0]]
-    y_vals = [p[1] for p in section_corners] + [section_corners[0][1]]
-    ax.plot(x_vals, y_vals, 'k-', linewidth=2, label="Unconfined Section")
-
-    # --- 2) Plot the stirrup center-line rectangle ---
-    sx_vals = [p[0] for p in stirrup_corners] + [stirrup_corners[0][0]]
-    sy_vals = [p[1] for p in stirrup_corners] + [stirrup_corners[0][1]]
-    ax.plot(sx_vals, sy_vals, 'b--', linewidth=1.5, label="Stirrup (Center-Line)")
-
-    # --- 3) Plot the rebar points ---
-    rx = [p[0] for p in rebar_coords]
-    ry = [p[1] for p in rebar_coords]
-    ax.scatter(rx, ry, s=60, c='red', marker='o', label="Main Bars")
-
-    # --- 4) Add labels if required ---
-    if show_labels:
-        for i, pt in enumerate(section_corners, start=1):
-            ax.text(pt[0], pt[1], f"C{i}", color='blue', fontsize=9, ha='left', va='bottom')
-        for i, pt in enumerate(stirrup_corners, start=1):
-            ax.text(pt[0], pt[1], f"S{i}", color='green', fontsize=9, ha='left', va='bottom')
-        for i, (xr, yr) in enumerate(rebar_coords, start=1):
-            ax.text(xr, yr, f"R{i}", color='red', fontsize=8, ha='left', va='bottom')
-
-    # --- 5) Final plot formatting ---
-    ax.set_aspect('equal', adjustable='box')
-    ax.set_xlim(-10, width + 10)
-    ax.set_ylim(-10, height + 10)
-    ax.set_xlabel("X-axis (mm)")
-    ax.set_ylabel("Y-axis (mm)")
-    ax.set_title("Cross-Section with Rebar Layout")
-    ax.legend()
-    ax.grid(True)
-
-    plt.show()
-
-
-
 def compute_section_properties_rect(width, height):
     """
     Compute basic section properties for a rectangular cross-section.
@@ -248,67 +303,9 @@ if __name__ == "__main__":
     #     print(f"  R{i} = {coord}")
 
     # # Plot the cross-section with the rebar layout
+    # from concretedesignpy.plotting import plot_beam_rebar
     # plot_beam_rebar(width, height, section_corners, stirrup_corners, rebar_coords, show_labels=True)
 
-import numpy as np
-import matplotlib.pyplot as plt
-
-
-def calculate_po(fc, fy, width, height, asteel):
-    """
-    Calculate the axial compression load (Po) for a reinforced concrete column.
-    
-    Parameters:
-    fc : float : Compressive strength of concrete (MPa)
-    fy : float : Yield strength of steel (MPa)
-    width : float : Width of the column (mm)
-    height : float : Height of the column (mm)
-    asteel : list : List of steel reinforcement areas (mm^2)
-    
-    Returns:
-    P0 : float : Axial compression load (N)
-    """
-    # Calculate concrete contribution
-    cc = 0.85 * fc * width * height
-    
-    # Calculate steel contributions
-    cs_total = sum(as_index * (fy - 0.85 * fc) for as_index in asteel)
-    
-    # Total axial compression load
-    value = cc + cs_total
-    
-    return value
-
-def calculate_pt(fy, asteel):
-    """
-    Calculate the axial tensile load (Pt) for a reinforced concrete column.
-    
-    Parameters:
-    fy : float : Yield strength of steel (MPa)
-    asteel : list : List of steel reinforcement areas (mm^2)
-    
-    Returns:
-    Pt : float : Axial tensile load (N)
-    """
-    # Calculate tensile contributions
-    pt = sum(as_index * fy for as_index in asteel)
-    
-    return pt
-
-# Example usage
-fc_prime = 30  # MPa
-fy = 420  # MPa
-b = 600  # mm
-h = 600  # mm
-As_list = [2580, 1290, 1290, 2580]  # mm^2
-
-po = calculate_po(fc_prime, fy, b, h, As_list)
-pt = calculate_pt(fy,As_list)
-print(po)
-print(pt)
-
-rebar_data = [[2580,1290,1290,2580],[75,200,400,525]] ## [[steel area],[depth from top]] 600x600mm rectangular
-
 def compute_balanced_point(rebar_data, depth, epsilon_y):
     """
     Compute the balanced neutral axis depth (C) and strain values (ε_si) for a given set of rebar data.
@@ -334,6 +331,7 @@ def compute_balanced_point(rebar_data, depth, epsilon_y):
     return neutral_axis, epsilon_si
 
 if __name__ == "__main__":
+    rebar_data = [[2580,1290,1290,2580],[75,200,400,525]] ## [[steel area],[depth from top]] 600x600mm rectangular
     d = 600  # Total depth of section in mm
     epsilon_y = 525 / 200000  # Assuming Young's modulus of steel = 200000 MPa and yield stress = 525 MPa
 
@@ -458,10 +456,6 @@ if __name__ == "__main__":
 # =============================================================================
 # Function: plot_interaction_diagram
 # =============================================================================
-import math
-import numpy as np
-import matplotlib.pyplot as plt
-from scipy.interpolate import make_interp_spline
 
 # -----------------------------
 # Pure Compression and Tension
@@ -590,6 +584,8 @@ def points_on_pm_diagram(fcprime, fy, b, h, betafactor, epsgamma, Es, as_list, d
 
         return (c_value, p_val, m_val, phi_val, f_s_i_list)
 
+    compute_pm = profiling.wrap("geometry.points_on_pm_diagram.compute_pm", compute_pm)
+
     # Compute for each special point
     cB, pB, mB, phiB, fB = compute_pm(c_bal,  force_last_layer_tension=True)
     cA, pA, mA, phiA, fA = compute_pm(c_above)
@@ -601,85 +597,133 @@ def points_on_pm_diagram(fcprime, fy, b, h, betafactor, epsgamma, Es, as_list, d
         "below":    {"c": cL, "P": pL, "M": mL, "phi": phiL, "fs_list": fL},
     }
 
-# -----------------------------
-# Plotting the Diagram
-# -----------------------------
-def plot_pm_points_with_curve(po, pt, mB, pB, mA, pA, mL, pL, fcprime, asbar, fy):
+def calculate_steel_layer_forces(as_arr, fs, depth, a_block, fcprime):
     """
-    The five points are:
-      1) Pure Tension: (0, -Pt) [from Cell 1]
-      2) Below-Balanced: (M_bb, P_bb) [from Cell 2]
-      3) Balanced: (M_bal, P_bal) [from Cell 2]
-      4) Above-Balanced: (M_ab, P_ab) [from Cell 2]
-      5) Pure Compression: (0, +Po) [from Cell 1]
-    
-    The curve is obtained by interpolating these points with a parametric spline.
+    Steel layer forces net of the concrete displaced by the bars.
+
+    Layers inside the Whitney stress block (depth < a) carry
+    As * (fs - 0.85 f'c), the others As * fs. Works element-wise on
+    broadcast arrays; shared by `compute_pm_curve` and
+    `biaxial.interaction_surface`.
+
+    Parameters:
+    as_arr  : array : Steel area of each layer (mm^2)
+    fs      : array : Steel stress of each layer, compression positive (MPa)
+    depth   : array : Depth of each layer from the extreme compression fiber (mm)
+    a_block : array : Depth of the stress block (mm)
+    fcprime : float : Compressive strength of concrete (MPa)
+
+    Returns:
+    array : Layer forces, compression positive (N)
     """
-    # Convert units
-    Po_kN = po / 1e3        # Pure compression, positive
-    Pt_kN = -(pt / 1e3)      # Pure tension, negative
-    mB_kNm = mB / 1e6
-    pB_kN  = pB / 1e3
-    mA_kNm = mA / 1e6
-    pA_kN  = pA / 1e3
-    mL_kNm = mL / 1e6
-    pL_kN  = pL / 1e3
-    
-    # Define the key points (in a parametric t-scale)
-    t_vals = np.array([0, 0.25, 0.5, 0.75, 1])
-    M_points = np.array([0, mL_kNm, mB_kNm, mA_kNm, 0])
-    P_points = np.array([Pt_kN, pL_kN, pB_kN, pA_kN, Po_kN])
-
-    # Create a fine parameter for smooth interpolation
-    t_fine = np.linspace(0, 1, 300)
-    spline_M = make_interp_spline(t_vals, M_points, k=3)
-    spline_P = make_interp_spline(t_vals, P_points, k=3)
-    M_fine = spline_M(t_fine)
-    P_fine = spline_P(t_fine)
-    
-    # Plotting
-    plt.figure(figsize=(7,7))
-    plt.plot(M_fine, P_fine, lw=2)
-    
-    # Plot the five key points
-    plt.plot(0, Pt_kN, 'bo', ms=8, label="Pure Tension (Pt)")
-    plt.text(5, Pt_kN - 100, f"(0.0, {Pt_kN:.1f})", color='blue')
-
-    plt.plot(mL_kNm, pL_kN, 'cs', ms=8, label="Below-Balanced")
-    plt.text(mL_kNm + 20, pL_kN, f"({mL_kNm:.1f}, {pL_kN:.1f})", color='c')
-
-    plt.plot(mB_kNm, pB_kN, 'ks', ms=8, label="Balanced")
-    plt.text(mB_kNm + 20, pB_kN, f"({mB_kNm:.1f}, {pB_kN:.1f})", color='black')
-
-    plt.plot(mA_kNm, pA_kN, 'ys', ms=8, label="Above-Balanced")
-    plt.text(mA_kNm + 20, pA_kN, f"({mA_kNm:.1f}, {pA_kN:.1f})", color='goldenrod')
-
-    plt.plot(0, Po_kN, 'ro', ms=8, label="Pure Compression (Po)")
-    plt.text(5, Po_kN + 100, f"(0.0, {Po_kN:.1f})", color='red')
-
-    # Axes, labels, legend
-    plt.axhline(0, color='k', ls='--', lw=0.8)
-    plt.axvline(0, color='k', ls='--', lw=0.8)
-    plt.xlabel("Moment, M (kN·m)")
-    plt.ylabel("Axial Load, P (kN)")
-    plt.title("P–M Interaction Diagram")
-    plt.grid(True)
-    plt.legend(loc='best')
-
-    # Cross Section Information
-    text_str = (
-        "Cross-section properties:\n"
-        f"f'c = {fcprime} MPa\n"
-        f"As  = {asbar} mm^2\n"
-        f"fy  = {fy} MPa"
-    )
+    return as_arr * (fs - 0.85 * fcprime * (depth < a_block))
+
+
+def compute_pm_curve(fcprime, fy, b, h, betafactor, Es, as_list, d_list,
+                     c_values=None, n_points=500, section_type="others"):
+    """
+    Computes the full P–M interaction curve by sweeping the neutral axis depth.
+
+    Every neutral axis depth is evaluated in a single NumPy pass: the steel
+    strains are built as an (n_c x n_layers) matrix and reduced along the
+    layer axis. Layers follow `points_on_pm_diagram` (strain =
+    0.003 * (c - d_i) / c, fs clamped to +/- fy, moments about mid-height);
+    the displaced concrete is deducted with `calculate_steel_layer_forces`,
+    for layers inside the stress block (d_i < a). P therefore drops by
+    0.85 f'c As_i where the block reaches a layer.
+
+    Parameters:
+    fcprime    : float : Compressive strength of concrete (MPa)
+    fy         : float : Yield strength of steel (MPa)
+    b          : float : Width of the section (mm)
+    h          : float : Total depth of the section (mm)
+    betafactor : float : Whitney stress block factor beta_1
+    Es         : float : Modulus of elasticity of steel (MPa)
+    as_list    : list  : Steel area of each layer (mm^2)
+    d_list     : list  : Depth of each layer from the top fiber (mm)
+    c_values   : array : Neutral axis depths to evaluate (mm). If None, a
+                         geometric sweep of `n_points` depths is used, running
+                         from 0.01*h to the depth at which the block covers
+                         the section and all steel has yielded in compression,
+                         closed by the pure tension point (Pt, c = 0) first
+                         and the pure compression point (Po, c = inf) last.
+    n_points   : int   : Number of depths for the default sweep.
+    section_type : str : 'others' (tied) or 'spiral', for phi.
 
-    plt.text(0.5, 0.5, text_str,
-             fontsize=10, ha='center', va='center',
-             transform=plt.gca().transAxes,
-             bbox=dict(facecolor='white', alpha=0.7, boxstyle="round"))
+    Returns:
+    dict : {
+        "c"     : (n_c,) neutral axis depths (mm),
+        "P"     : (n_c,) axial load, compression positive (N),
+        "M"     : (n_c,) moment about mid-height (N·mm),
+        "curvature" : (n_c,) curvature 0.003 / c (1/mm),
+        "eps_s" : (n_c, n_layers) steel strains, compression positive,
+        "fs"    : (n_c, n_layers) steel stresses (MPa),
+        "eps_t" : (n_c,) net tensile strain of the extreme tension layer
+                  (tension positive),
+        "phi"   : (n_c,) strength reduction factor from eps_t
+                  (`calculate_strength_reduction_factor`)
+    }
+    At the closing points the strains are the limits: -inf (Pt) and 0.003 (Po).
+
+    Notes:
+    - The stress block depth a = betafactor * c is capped at h, so the sweep
+      can run past c = h / betafactor without exceeding Po.
+    """
+    as_arr = np.asarray(as_list, dtype=float)
+    d_arr = np.asarray(d_list, dtype=float)
+    if as_arr.shape != d_arr.shape or as_arr.ndim != 1:
+        raise ValueError("as_list and d_list must be 1-D and of equal length.")
+    if b <= 0 or h <= 0:
+        raise ValueError("Section dimensions b and h must be positive.")
+
+    if c_values is None:
+        eps_y = fy / Es
+        if eps_y < 0.003:
+            c_yield = 0.003 * d_arr.max() / (0.003 - eps_y)
+        else:
+            c_yield = 10.0 * h
+        c_max = max(h / betafactor, c_yield)
+        c_arr = np.concatenate(([0.0], np.geomspace(0.01 * h, c_max, n_points), [np.inf]))
+    else:
+        c_arr = np.asarray(c_values, dtype=float).ravel()
+        if np.any(c_arr <= 0):
+            raise ValueError("All neutral axis depths in c_values must be positive.")
+
+    c_col = c_arr[:, None]
+
+    # 1) Concrete block (a capped at the section depth)
+    a_block = np.minimum(betafactor * c_arr, h)
+    cc = 0.85 * fcprime * b * a_block
 
-    plt.show()
+    # 2) Steel strains and stresses, (n_c x n_layers); c = 0 and c = inf give
+    #    the pure tension and pure compression limits
+    with np.errstate(divide="ignore", invalid="ignore"):
+        eps_s = np.where(np.isinf(c_col), 0.003, 0.003 * (c_col - d_arr) / c_col)
+        eps_s = np.where(c_col == 0.0, -np.inf, eps_s)
+        curvature = 0.003 / c_arr
+    fs = np.clip(Es * eps_s, -fy, fy)
+
+    # 3) Layer forces net of the displaced concrete inside the block
+    f_layer = calculate_steel_layer_forces(as_arr, fs, d_arr, a_block[:, None], fcprime)
+
+    # 4) Axial load and moment about mid-height
+    p_val = cc + f_layer.sum(axis=1)
+    m_val = cc * ((h / 2.0) - a_block / 2.0) + f_layer @ ((h / 2.0) - d_arr)
+
+    # 5) Extreme tension strain and strength reduction factor
+    eps_t = -eps_s[:, np.argmax(d_arr)]
+    phi = calculate_strength_reduction_factor(np.maximum(eps_t, 0.0), fy / Es, section_type)
+
+    return {
+        "c": c_arr,
+        "P": p_val,
+        "M": m_val,
+        "curvature": curvature,
+        "eps_s": eps_s,
+        "fs": fs,
+        "eps_t": eps_t,
+        "phi": phi,
+    }
 
 if __name__ == "__main__":
     # Section Properties and Material Data
@@ -731,4 +775,5 @@ if __name__ == "__main__":
         print(f"  f_s_i list = {out['fs_list']}\n")
     
     # Plot the P–M interaction diagram (Cell 3)
+    from concretedesignpy.plotting import plot_pm_points_with_curve
     plot_pm_points_with_curve(po, pt, mB, pB, mA, pA, mL, pL, fcprime, asbar, fy)
\ No newline at end of file
@@ -0,0 +1,161 @@
+# SPDX-License-Identifier: MIT
+"""
+material.py
+-----------
+Immutable material objects for concrete, reinforcing steel and FRP.
+
+Derived constants (beta_1, Ec, fr, yield strain, environmental reduction
+factor, design rupture values) are computed and validated once, when the
+object is created. Objects are interned: creating the same grade twice
+returns the same instance, so hot loops can look materials up per member
+without recomputing anything.
+
+    >>> Concrete(28) is Concrete(28.0)
+    True
+
+This code is open-source and licensed under the MIT License.
+"""
+
+import math
+from functools import lru_cache
+
+from concretedesignpy.crfp.constants import eRF
+from concretedesignpy.provision import calculate_beta_one, steel_yield_strain
+
+
+class _Material:
+    """Base class: slots-only, read-only after construction, picklable."""
+
+    __slots__ = ()
+    _fields = ()
+
+    def __setattr__(self, name, value):
+        raise AttributeError(f"{type(self).__name__} objects are immutable.")
+
+    def __delattr__(self, name):
+        raise AttributeError(f"{type(self).__name__} objects are immutable.")
+
+    def _init(self, **values):
+        for name, value in values.items():
+            object.__setattr__(self, name, value)
+
+    def __reduce__(self):
+        return (type(self), tuple(getattr(self, name) for name in self._fields))
+
+    def __repr__(self):
+        args = ", ".join(f"{name}={getattr(self, name)!r}" for name in self._fields)
+        return f"{type(self).__name__}({args})"
+
+
+class Concrete(_Material):
+    """
+    Normal-weight or lightweight concrete.
+
+    Parameters:
+        fc  : Specified compressive strength f'c [MPa] (>= 17 MPa)
+        ecu : Ultimate concrete strain. Default 0.003
+        lam : Lightweight modification factor lambda. Default 1.0
+
+    Derived attributes:
+        beta_one : Whitney stress block factor (NSCP 2015 / ACI 318)
+        ec       : Modulus of elasticity, 4700 * sqrt(f'c) [MPa]
+        fr       : Modulus of rupture, 0.62 * lambda * sqrt(f'c) [MPa]
+    """
+
+    __slots__ = ("fc", "ecu", "lam", "beta_one", "ec", "fr")
+    _fields = ("fc", "ecu", "lam")
+
+    def __new__(cls, fc, ecu=0.003, lam=1.0):
+        return _concrete(float(fc), float(ecu), float(lam))
+
+
+class Steel(_Material):
+    """
+    Reinforcing steel.
+
+    Parameters:
+        fy : Yield strength [MPa]
+        es : Modulus of elasticity [MPa]. Default 200,000
+
+    Derived attributes:
+        eps_y : Yield strain fy / Es
+    """
+
+    __slots__ = ("fy", "es", "eps_y")
+    _fields = ("fy", "es")
+
+    def __new__(cls, fy, es=200000.0):
+        return _steel(float(fy), float(es))
+
+
+class FRP(_Material):
+    """
+    Externally bonded FRP system (ACI 440.2R).
+
+    Parameters:
+        ffu_star   : Manufacturer's ultimate tensile strength [MPa]
+        efu_star   : Manufacturer's rupture strain
+        ef         : Tensile modulus of elasticity [MPa]
+        tf         : Nominal thickness of one ply [mm]
+        exposure   : 'interior', 'exterior' or 'aggressive'
+        fiber_type : 'carbon', 'glass' or 'aramid'
+
+    Derived attributes:
+        ce  : Environmental reduction factor (`eRF`)
+        ffu : Design ultimate tensile strength, ce * ffu_star [MPa]
+        efu : Design rupture strain, ce * efu_star
+    """
+
+    __slots__ = ("ffu_star", "efu_star", "ef", "tf", "exposure", "fiber_type",
+                 "ce", "ffu", "efu")
+    _fields = ("ffu_star", "efu_star", "ef", "tf", "exposure", "fiber_type")
+
+    def __new__(cls, ffu_star, efu_star, ef, tf, exposure="interior",
+                fiber_type="carbon"):
+        return _frp(float(ffu_star), float(efu_star), float(ef), float(tf),
+                    exposure, fiber_type)
+
+
+@lru_cache(maxsize=1024)
+def _concrete(fc, ecu, lam):
+    if ecu <= 0:
+        raise ValueError("ecu must be positive.")
+    if lam <= 0:
+        raise ValueError("lam must be positive.")
+    obj = object.__new__(Concrete)
+    obj._init(
+        fc=fc,
+        ecu=ecu,
+        lam=lam,
+        beta_one=calculate_beta_one(fc, report=False)["value"],
+        ec=4700.0 * math.sqrt(fc),
+        fr=0.62 * lam * math.sqrt(fc),
+    )
+    return obj
+
+
+@lru_cache(maxsize=1024)
+def _steel(fy, es):
+    obj = object.__new__(Steel)
+    obj._init(fy=fy, es=es, eps_y=steel_yield_strain(fy, es, report=False)["value"])
+    return obj
+
+
+@lru_cache(maxsize=1024)
+def _frp(ffu_star, efu_star, ef, tf, exposure, fiber_type):
+    if min(ffu_star, efu_star, ef, tf) <= 0:
+        raise ValueError("FRP strength, strain, modulus and thickness must be positive.")
+    ce = eRF(exposure, fiber_type)
+    obj = object.__new__(FRP)
+    obj._init(
+        ffu_star=ffu_star,
+        efu_star=efu_star,
+        ef=ef,
+        tf=tf,
+        exposure=exposure,
+        fiber_type=fiber_type,
+        ce=ce,
+        ffu=ce * ffu_star,
+        efu=ce * efu_star,
+    )
+    return obj
@@ -0,0 +1,187 @@
+# SPDX-License-Identifier: MIT
+"""
+moment_curvature.py
+-------------------
+Fiber-based moment-curvature analysis of rectangular RC sections.
+
+For every curvature in a schedule, the neutral axis depth is solved for axial
+equilibrium with a safeguarded secant iteration that is warm-started from the
+previous step, and the fiber stresses are evaluated for the whole mesh in one
+NumPy call:
+- cover concrete : unconfined Mander curve with the linear spalling branch
+                   from 2 * eco down to zero stress at esp,
+- core concrete  : confined Mander curve (f'cc from `compute_confined_strength`),
+- steel          : elastic-perfectly plastic.
+
+Sign convention: compression positive, bending compresses the top fiber,
+moments are taken about mid-height.
+
+This code is open-source and licensed under the MIT License.
+"""
+
+import numpy as np
+
+from concretedesignpy.section.fiber import COVER, CORE, STEEL
+from concretedesignpy.stress_strain.manders import (
+    compute_confined_strength,
+    compute_mander_stress,
+    compute_peak_strain,
+    compute_unconfined_stress,
+)
+
+
+def _fiber_stresses(strain, material, fpco, eco, esp, fpcc, ecc, ec, fy, es):
+    """Stress in every fiber for a strain vector (compression positive)."""
+    stress = np.empty_like(strain)
+
+    cover = material == COVER
+    stress[cover] = compute_unconfined_stress(strain[cover], fpco, eco, ec, esp)
+
+    core = material == CORE
+    stress[core] = compute_mander_stress(strain[core], fpcc, ecc, ec)
+
+    steel = material == STEEL
+    stress[steel] = np.clip(es * strain[steel], -fy, fy)
+    return stress
+
+
+def moment_curvature(mesh, fpco, fy, es, fpl, curvatures, axial_load=0.0,
+                     eco=0.002, esp=0.005, ecu=None, esu=None,
+                     tol=1e-6, max_iterations=50):
+    """
+    Compute the moment-curvature response of a fiber section.
+
+    Parameters:
+        mesh           : Fiber mesh from `build_fiber_mesh`
+        fpco           : Unconfined concrete strength f'co [MPa]
+        fy             : Steel yield strength [MPa]
+        es             : Steel modulus of elasticity [MPa]
+        fpl            : Effective lateral confining stress on the core [MPa]
+        curvatures     : Increasing curvature schedule [1/mm]
+        axial_load     : Axial load, compression positive [N]
+        eco            : Strain at peak unconfined stress
+        esp            : Spalling strain of the cover concrete
+        ecu            : Ultimate core concrete strain; the analysis stops at
+                         the first step exceeding it (None = no limit)
+        esu            : Ultimate steel tensile strain; stops likewise
+        tol            : Equilibrium tolerance as a fraction of f'co * Ag
+        max_iterations : Iteration cap per curvature step
+
+    Returns:
+        dict: {
+            'curvature'    : curvatures analysed [1/mm],
+            'moment'       : moments about mid-height [N·mm],
+            'neutral_axis' : neutral axis depth from the top fiber [mm],
+            'iterations'   : equilibrium iterations per step,
+            'converged'    : bool per step,
+            'termination'  : why the analysis ended: 'completed' (every
+                             curvature analysed), 'ecu' or 'esu' (strain
+                             limit reached; that step is not included) or
+                             'no_bracket' (no neutral axis found; the failed
+                             step is the last entry, with converged False
+                             and NaN moment and neutral axis)
+        }
+
+    Notes:
+    - The first step is started from c = h/2; each following step starts from
+      the previous neutral axis, so typically only a few secant iterations
+      are needed per step.
+    """
+    curvatures = np.asarray(curvatures, dtype=float).ravel()
+    if np.any(curvatures <= 0):
+        raise ValueError("Curvatures must be positive.")
+
+    height = mesh["height"]
+    y_top = height - mesh["y"]     # fiber depth from the top fiber
+    lever = mesh["y"] - height / 2.0
+    area = mesh["area"]
+    material = mesh["material"]
+
+    ec = 5000.0 * np.sqrt(fpco)
+    fpcc = compute_confined_strength(fpco, fpl)
+    ecc = compute_peak_strain(fpco, fpcc, eco)
+    tol_force = tol * fpco * mesh["width"] * height
+    is_core = material == CORE
+    is_steel = material == STEEL
+
+    def fiber_response(phi, c):
+        strain = phi * (c - y_top)
+        stress = _fiber_stresses(strain, material, fpco, eco, esp,
+                                 fpcc, ecc, ec, fy, es)
+        force = stress * area
+        return force.sum() - axial_load, force, strain
+
+    n_steps = curvatures.size
+    moment = np.full(n_steps, np.nan)
+    neutral_axis = np.full(n_steps, np.nan)
+    iterations = np.zeros(n_steps, dtype=int)
+    converged = np.zeros(n_steps, dtype=bool)
+
+    c_prev = height / 2.0
+    n_done = 0
+    termination = "completed"
+    for k, phi in enumerate(curvatures):
+        # --- 1) Bracket the root, stepping out from the warm start; the
+        #        search gives up once c overflows (e.g. N above capacity) ---
+        c_a = c_prev
+        r_a, force, strain = fiber_response(phi, c_a)
+        step = 1.05 if r_a < 0 else 1.0 / 1.05
+        c_b = c_a * step
+        n_iter = 2
+        with np.errstate(over="ignore", invalid="ignore"):
+            r_b = fiber_response(phi, c_b)[0]
+            while ((r_b < 0) == (r_a < 0) and np.isfinite(r_b)
+                   and n_iter < max_iterations):
+                c_a, r_a = c_b, r_b
+                step *= step
+                c_b = c_a * step
+                r_b = fiber_response(phi, c_b)[0]
+                n_iter += 1
+        if (r_b < 0) == (r_a < 0) or not np.isfinite(r_b):
+            iterations[k] = n_iter
+            n_done = k + 1
+            termination = "no_bracket"
+            break
+        lo, hi = (c_a, c_b) if r_a < 0 else (c_b, c_a)
+
+        # --- 2) Safeguarded secant iteration inside [lo, hi] ---
+        c_new = c_b
+        ok = False
+        while n_iter < max_iterations:
+            if r_b != r_a:
+                c_new = c_b - r_b * (c_b - c_a) / (r_b - r_a)
+            if not (lo < c_new < hi):
+                c_new = 0.5 * (lo + hi)
+            r_new, force, strain = fiber_response(phi, c_new)
+            n_iter += 1
+            if abs(r_new) <= tol_force or (hi - lo) <= 1e-9 * height:
+                ok = True
+                break
+            if r_new < 0:
+                lo = c_new
+            else:
+                hi = c_new
+            c_a, r_a, c_b, r_b = c_b, r_b, c_new, r_new
+
+        # --- 3) Record the step, stop at the strain limits ---
+        if ecu is not None and strain[is_core].max(initial=0.0) > ecu:
+            termination = "ecu"
+            break
+        if esu is not None and -strain[is_steel].min(initial=0.0) > esu:
+            termination = "esu"
+            break
+        moment[k] = force @ lever
+        neutral_axis[k] = c_new
+        iterations[k] = n_iter
+        converged[k] = ok
+        c_prev = c_new
+        n_done = k + 1
+
+    return {
+        "curvature": curvatures[:n_done],
+        "moment": moment[:n_done],
+        "neutral_axis": neutral_axis[:n_done],
+        "iterations": iterations[:n_done],
+        "converged": converged[:n_done],
+        "termination": termination,
+    }
@@ -0,0 +1,313 @@
+# SPDX-License-Identifier: MIT
+"""
+properties.py
+-------------
+Section properties of arbitrary polygonal sections with holes (T, L, I,
+hollow core walls, ...), for one or many sections at once.
+
+A shape is a dict {"outer": (n, 2) vertices, "holes": [(m, 2) vertices, ...]}
+with x horizontal and y vertical; vertex order (clockwise or counter-
+clockwise) does not matter. Builders for the common shapes place the origin
+at the bottom-left of the bounding box, as in `compute_section_properties_rect`.
+
+Shapes are packed into one flat vertex array (`pack_polygons`) and all area
+integrals are evaluated with vectorized shoelace sums over every edge of every
+ring of every section, then summed per section with np.bincount.
+
+Transformed sections add the bars as (n - 1) * As point areas, n = Es / Ec,
+at their centres (the displaced concrete is deducted); the bars' own
+inertias are neglected.
+
+This code is open-source and licensed under the MIT License.
+"""
+
+import numpy as np
+
+
+# =============================================================================
+# Shape builders
+# =============================================================================
+def polygon(outer, holes=()):
+    """
+    Build a shape from an outer boundary and optional holes.
+
+    Parameters:
+        outer : (n, 2) vertices of the outer boundary [mm]
+        holes : Sequence of (m, 2) vertex arrays, one per hole [mm]
+
+    Returns:
+        dict: {"outer": (n, 2) array, "holes": list of (m, 2) arrays}
+    """
+    rings = [np.asarray(outer, dtype=float)] + [np.asarray(h, dtype=float) for h in holes]
+    for ring in rings:
+        if ring.ndim != 2 or ring.shape[1] != 2 or ring.shape[0] < 3:
+            raise ValueError("Each ring needs at least 3 (x, y) vertices.")
+    return {"outer": rings[0], "holes": rings[1:]}
+
+
+def rectangle(width, height):
+    """Solid rectangle, width x height [mm]."""
+    return polygon([(0.0, 0.0), (width, 0.0), (width, height), (0.0, height)])
+
+
+def t_section(bf, tf, bw, h):
+    """
+    T-section with the flange on top and the web centred below it.
+
+    Parameters:
+        bf : Flange width [mm]
+        tf : Flange thickness [mm]
+        bw : Web width [mm]
+        h  : Total height [mm]
+    """
+    if not (0 < bw <= bf and 0 < tf < h):
+        raise ValueError("Need 0 < bw <= bf and 0 < tf < h.")
+    x0 = 0.5 * (bf - bw)
+    x1 = x0 + bw
+    return polygon([
+        (x0, 0.0), (x1, 0.0), (x1, h - tf), (bf, h - tf),
+        (bf, h), (0.0, h), (0.0, h - tf), (x0, h - tf),
+    ])
+
+
+def l_section(b, h, tw, tf):
+    """
+    L-section with the vertical leg on the left and the horizontal leg at the bottom.
+
+    Parameters:
+        b  : Total width (horizontal leg length) [mm]
+        h  : Total height (vertical leg length) [mm]
+        tw : Thickness of the vertical leg [mm]
+        tf : Thickness of the horizontal leg [mm]
+    """
+    if not (0 < tw < b and 0 < tf < h):
+        raise ValueError("Need 0 < tw < b and 0 < tf < h.")
+    return polygon([(0.0, 0.0), (b, 0.0), (b, tf), (tw, tf), (tw, h), (0.0, h)])
+
+
+def i_section(bf, tf, bw, h, bf_bottom=None, tf_bottom=None):
+    """
+    I-section (or unequal-flange I) with the web centred on the flanges.
+
+    Parameters:
+        bf        : Top flange width [mm]
+        tf        : Top flange thickness [mm]
+        bw        : Web width [mm]
+        h         : Total height [mm]
+        bf_bottom : Bottom flange width (default: bf) [mm]
+        tf_bottom : Bottom flange thickness (default: tf) [mm]
+    """
+    bf_bottom = bf if bf_bottom is None else bf_bottom
+    tf_bottom = tf if tf_bottom is None else tf_bottom
+    if not (0 < bw <= min(bf, bf_bottom) and tf > 0 and tf_bottom > 0 and tf + tf_bottom < h):
+        raise ValueError("Need 0 < bw <= flange widths and tf + tf_bottom < h.")
+    width = max(bf, bf_bottom)
+    xc = 0.5 * width
+    xt0, xt1 = xc - 0.5 * bf, xc + 0.5 * bf
+    xb0, xb1 = xc - 0.5 * bf_bottom, xc + 0.5 * bf_bottom
+    xw0, xw1 = xc - 0.5 * bw, xc + 0.5 * bw
+    return polygon([
+        (xb0, 0.0), (xb1, 0.0), (xb1, tf_bottom), (xw1, tf_bottom),
+        (xw1, h - tf), (xt1, h - tf), (xt1, h), (xt0, h),
+        (xt0, h - tf), (xw0, h - tf), (xw0, tf_bottom), (xb0, tf_bottom),
+    ])
+
+
+def hollow_rectangle(width, height, t, t_y=None):
+    """
+    Rectangular box (e.g. a core wall) with a centred rectangular opening.
+
+    Parameters:
+        width  : Outer width [mm]
+        height : Outer height [mm]
+        t      : Thickness of the left and right walls [mm]
+        t_y    : Thickness of the top and bottom walls (default: t) [mm]
+    """
+    t_y = t if t_y is None else t_y
+    if not (0 < 2 * t < width and 0 < 2 * t_y < height):
+        raise ValueError("Wall thicknesses must leave an opening.")
+    outer = rectangle(width, height)["outer"]
+    hole = [(t, t_y), (width - t, t_y), (width - t, height - t_y), (t, height - t_y)]
+    return polygon(outer, [hole])
+
+
+# =============================================================================
+# Packing
+# =============================================================================
+def pack_polygons(shapes):
+    """
+    Pack shapes into flat arrays for the batched integrals.
+
+    Parameters:
+        shapes : Sequence of shape dicts (see `polygon`)
+
+    Returns:
+        dict: {
+            "vertices"       : (n_vertices, 2) all ring vertices, section by section,
+            "ring_offsets"   : (n_rings + 1,) start of each ring in vertices,
+            "ring_section"   : (n_rings,) section index of each ring,
+            "hole"           : (n_rings,) True for holes,
+            "section_offsets": (n_sections + 1,) start of each section in vertices
+        }
+    """
+    rings, ring_section, hole = [], [], []
+    for k, shape in enumerate(shapes):
+        rings.append(shape["outer"])
+        ring_section.append(k)
+        hole.append(False)
+        for h in shape["holes"]:
+            rings.append(h)
+            ring_section.append(k)
+            hole.append(True)
+    if not rings:
+        raise ValueError("No shapes to pack.")
+
+    ring_sizes = np.array([r.shape[0] for r in rings])
+    ring_section = np.array(ring_section)
+    section_sizes = np.bincount(ring_section, weights=ring_sizes).astype(int)
+    return {
+        "vertices": np.concatenate(rings),
+        "ring_offsets": np.concatenate(([0], np.cumsum(ring_sizes))),
+        "ring_section": ring_section,
+        "hole": np.array(hole),
+        "section_offsets": np.concatenate(([0], np.cumsum(section_sizes))),
+    }
+
+
+# =============================================================================
+# Section properties
+# =============================================================================
+def section_properties(shapes, rebar_coords=None, rebar_area=None,
+                       rebar_section=None, modular_ratio=None):
+    """
+    Compute gross or transformed section properties of polygonal sections.
+
+    Parameters:
+        shapes        : A shape dict, a sequence of shape dicts, or the output
+                        of `pack_polygons`
+        rebar_coords  : (n_bars, 2) bar centres for a transformed section [mm]
+        rebar_area    : (n_bars,) bar areas [mm²]
+        rebar_section : (n_bars,) section index of each bar (default: all in
+                        section 0); `generate_rebar_layout` returns these three
+        modular_ratio : Es / Ec, scalar or per section; required with rebar
+
+    Returns:
+        dict: {
+            "area"            : A,
+            "centroid"        : {"x", "y"},
+            "first_moment"    : {"x": Qx about y = 0, "y": Qy about x = 0},
+            "moment_inertia"  : {"x", "y", "xy"} about the centroidal axes,
+            "principal"       : {"major", "minor", "angle"}; angle [rad] of the
+                                major axis from the x axis, counter-clockwise,
+            "radius_gyration" : {"x", "y"},
+            "section_modulus" : {"x_top", "x_bottom", "y_left", "y_right"}
+        }
+        Values are floats for a single shape dict, otherwise arrays with one
+        entry per section.
+
+    Notes:
+    - Shoelace integrals over each edge (x_i, y_i) -> (x_j, y_j), c = x_i y_j - x_j y_i:
+        A   = 1/2  Σ c
+        Qx  = 1/6  Σ (y_i + y_j) c
+        Ixx = 1/12 Σ (y_i² + y_i y_j + y_j²) c
+        Ixy = 1/24 Σ (x_i y_j + 2 x_i y_i + 2 x_j y_j + x_j y_i) c
+      Each ring is normalised by the sign of its own area, so holes are
+      subtracted whatever their vertex order.
+    - Section moduli use the extreme fibers of the concrete outline.
+    """
+    single = isinstance(shapes, dict) and "outer" in shapes
+    if single:
+        packed = pack_polygons([shapes])
+    elif isinstance(shapes, dict):
+        packed = shapes
+    else:
+        packed = pack_polygons(shapes)
+
+    v = packed["vertices"]
+    ring_offsets = packed["ring_offsets"]
+    n_sections = packed["section_offsets"].size - 1
+
+    # --- 1) Edge terms for every ring (next vertex wraps within the ring) ---
+    ring_sizes = np.diff(ring_offsets)
+    ring_id = np.repeat(np.arange(ring_sizes.size), ring_sizes)
+    nxt = np.arange(v.shape[0]) + 1
+    nxt[ring_offsets[1:] - 1] = ring_offsets[:-1]
+
+    xi, yi = v[:, 0], v[:, 1]
+    xj, yj = xi[nxt], yi[nxt]
+    c = xi * yj - xj * yi
+    terms = np.stack((
+        c / 2.0,
+        (yi + yj) * c / 6.0,
+        (xi + xj) * c / 6.0,
+        (yi * yi + yi * yj + yj * yj) * c / 12.0,
+        (xi * xi + xi * xj + xj * xj) * c / 12.0,
+        (xi * yj + 2.0 * xi * yi + 2.0 * xj * yj + xj * yi) * c / 24.0,
+    ))
+
+    # --- 2) Per ring, oriented outer + / hole -, then per section ---
+    n_rings = ring_sizes.size
+    per_ring = np.stack([np.bincount(ring_id, weights=t, minlength=n_rings) for t in terms])
+    sign = np.sign(per_ring[0]) * np.where(packed["hole"], -1.0, 1.0)
+    per_ring *= sign
+    section_of_ring = packed["ring_section"]
+    area, qx, qy, ixx, iyy, ixy = (
+        np.bincount(section_of_ring, weights=t, minlength=n_sections) for t in per_ring
+    )
+
+    # --- 3) Transformed section: (n - 1) * As at each bar ---
+    if rebar_coords is not None:
+        if rebar_area is None or modular_ratio is None:
+            raise ValueError("rebar_area and modular_ratio are required with rebar_coords.")
+        bars = np.asarray(rebar_coords, dtype=float).reshape(-1, 2)
+        sec = (np.zeros(bars.shape[0], dtype=int) if rebar_section is None
+               else np.asarray(rebar_section))
+        n_ratio = np.broadcast_to(np.asarray(modular_ratio, dtype=float), (n_sections,))
+        a_t = (n_ratio[sec] - 1.0) * np.broadcast_to(rebar_area, sec.shape)
+        bx, by = bars[:, 0], bars[:, 1]
+        area = area + np.bincount(sec, weights=a_t, minlength=n_sections)
+        qx = qx + np.bincount(sec, weights=a_t * by, minlength=n_sections)
+        qy = qy + np.bincount(sec, weights=a_t * bx, minlength=n_sections)
+        ixx = ixx + np.bincount(sec, weights=a_t * by * by, minlength=n_sections)
+        iyy = iyy + np.bincount(sec, weights=a_t * bx * bx, minlength=n_sections)
+        ixy = ixy + np.bincount(sec, weights=a_t * bx * by, minlength=n_sections)
+
+    if np.any(area <= 0):
+        raise ValueError("Every section must have a positive net area.")
+
+    # --- 4) Centroidal and principal values ---
+    x_bar = qy / area
+    y_bar = qx / area
+    ix = ixx - area * y_bar ** 2
+    iy = iyy - area * x_bar ** 2
+    ixy_c = ixy - area * x_bar * y_bar
+
+    mean = 0.5 * (ix + iy)
+    radius = np.hypot(0.5 * (ix - iy), ixy_c)
+    angle = 0.5 * np.arctan2(-2.0 * ixy_c, ix - iy)
+
+    # --- 5) Extreme fibers per section ---
+    starts = packed["section_offsets"][:-1]
+    y_max = np.maximum.reduceat(yi, starts)
+    y_min = np.minimum.reduceat(yi, starts)
+    x_max = np.maximum.reduceat(xi, starts)
+    x_min = np.minimum.reduceat(xi, starts)
+
+    def out(a):
+        return float(a[0]) if single else a
+
+    return {
+        "area": out(area),
+        "centroid": {"x": out(x_bar), "y": out(y_bar)},
+        "first_moment": {"x": out(qx), "y": out(qy)},
+        "moment_inertia": {"x": out(ix), "y": out(iy), "xy": out(ixy_c)},
+        "principal": {"major": out(mean + radius), "minor": out(mean - radius),
+                      "angle": out(angle)},
+        "radius_gyration": {"x": out(np.sqrt(ix / area)), "y": out(np.sqrt(iy / area))},
+        "section_modulus": {
+            "x_top": out(ix / (y_max - y_bar)),
+            "x_bottom": out(ix / (y_bar - y_min)),
+            "y_left": out(iy / (x_bar - x_min)),
+            "y_right": out(iy / (x_max - x_bar)),
+        },
+    }
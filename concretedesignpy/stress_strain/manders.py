@@ -0,0 +1,368 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+MIT License
+
+Copyright (c) 2025 Albert Pamonag
+
+Permission is hereby granted, free of charge, to any person obtaining a copy
+of this software and associated documentation files (the "Software"), to deal
+in the Software without restriction, including without limitation the rights 
+to use, copy, modify, merge, publish, distribute, sublicense, and/or sell 
+copies of the Software, and to permit persons to whom the Software is 
+furnished to do so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in 
+all copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR 
+IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY, 
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE 
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER 
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM, 
+OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN 
+THE SOFTWARE.
+
+-------------------------------------------------------------------------------
+This module provides functions to compute the confined concrete strength and 
+its associated factors following (primarily) Mander's model.
+"""
+
+from functools import lru_cache
+
+import numpy as np
+
+_PLOTTING = ("plot_confined_strength",)
+
+
+def __getattr__(name):
+    if name in _PLOTTING:
+        from concretedesignpy import plotting
+        return getattr(plotting, name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def compute_confined_strength(fpco: float, fpl: float) -> float:
+    """Computes confined concrete strength using Mander's model.
+
+    This function calculates the maximum confined compressive strength of 
+    concrete (f'cc) given the unconfined compressive strength (f'co) and the 
+    effective lateral confining stress (fpl).
+
+    Args:
+        fpco (float): Unconfined concrete strength, f'co, in MPa.
+        fpl (float): Effective lateral confining stress, fpl, in MPa.
+
+    Returns:
+        float: Confined concrete strength, f'cc, in MPa.
+    """
+    A = 2.254 * np.sqrt(1.0 + ((7.92 * fpl) / fpco))
+    B = 2.0 * (fpl / fpco)
+    fpcc = fpco * (-1.254 + A - B)
+    return fpcc
+
+
+def compute_peak_strain(fpco: float, fpcc: float, eco: float = 0.002) -> float:
+    """Computes the strain at peak confined stress, epsilon_cc.
+
+    Args:
+        fpco (float): Unconfined concrete strength, f'co, in MPa.
+        fpcc (float): Confined concrete strength, f'cc, in MPa.
+        eco (float): Strain at peak unconfined stress. Defaults to 0.002.
+
+    Returns:
+        float: epsilon_cc = eco * [1 + 5 * (f'cc / f'co - 1)].
+    """
+    return eco * (1.0 + 5.0 * (fpcc / fpco - 1.0))
+
+
+def compute_mander_stress(strain, fpc: float, epc: float, ec: float):
+    """Computes concrete stress from Mander's stress-strain relation.
+
+    Works element-wise on arrays. Compression is positive; tensile strains
+    return zero stress.
+
+    Args:
+        strain (array_like): Concrete strain(s), compression positive.
+        fpc (float): Peak stress (f'cc for confined, f'co for unconfined), MPa.
+        epc (float): Strain at peak stress (epsilon_cc or epsilon_co).
+        ec (float): Tangent modulus of elasticity of concrete, MPa.
+
+    Returns:
+        ndarray: Concrete stress(es) in MPa.
+    """
+    strain = np.asarray(strain, dtype=float)
+    esec = fpc / epc
+    r = ec / (ec - esec)
+    x = np.maximum(strain, 0.0) / epc
+    return fpc * x * r / (r - 1.0 + x ** r)
+
+
+def compute_unconfined_stress(strain, fpco: float, eco: float, ec: float,
+                              esp: float = 0.005):
+    """Computes unconfined (cover) concrete stress including spalling.
+
+    Follows Mander's curve up to 2 * eco, then falls linearly to zero stress
+    at the spalling strain esp; beyond esp the cover carries no stress.
+
+    Args:
+        strain (array_like): Concrete strain(s), compression positive.
+        fpco (float): Unconfined concrete strength, f'co, in MPa.
+        eco (float): Strain at peak unconfined stress.
+        ec (float): Tangent modulus of elasticity of concrete, MPa.
+        esp (float): Spalling strain. Defaults to 0.005.
+
+    Returns:
+        ndarray: Concrete stress(es) in MPa.
+    """
+    strain = np.asarray(strain, dtype=float)
+    e2 = 2.0 * eco
+    if esp <= e2:
+        raise ValueError("Spalling strain esp must exceed 2 * eco.")
+    f2 = compute_mander_stress(e2, fpco, eco, ec)
+    spalling = f2 * (esp - strain) / (esp - e2)
+    stress = np.where(strain <= e2, compute_mander_stress(strain, fpco, eco, ec), spalling)
+    return np.where(strain > esp, 0.0, stress)
+
+
+def mander_curves(strain, fpco: float, confinement_ratio, eco: float = 0.002,
+                  esp: float = 0.005, ec: float = None) -> dict:
+    """Computes full Mander confined and unconfined stress-strain curves.
+
+    Evaluates every confinement level against every strain in one call, so
+    many tie configurations can be compared at once.
+
+    Args:
+        strain (array_like): Strains to evaluate, compression positive, shape (m,).
+        fpco (float): Unconfined concrete strength, f'co, in MPa.
+        confinement_ratio (array_like): Effective lateral confining stress
+            ratio(s) fl / f'co, shape (k,) or scalar.
+        eco (float): Strain at peak unconfined stress. Defaults to 0.002.
+        esp (float): Spalling strain of the unconfined curve. Defaults to 0.005.
+        ec (float): Tangent modulus, MPa. Defaults to 5000 * sqrt(f'co).
+
+    Returns:
+        dict: {
+            'strain'     : strains, shape (m,),
+            'confined'   : confined stresses [MPa], shape (k, m),
+            'unconfined' : unconfined stresses with spalling [MPa], shape (m,),
+            'fpcc'       : confined strengths f'cc [MPa], shape (k,),
+            'ecc'        : strains at peak confined stress, shape (k,),
+            'esec'       : secant moduli f'cc / ecc [MPa], shape (k,),
+            'r'          : Mander r = Ec / (Ec - Esec), shape (k,),
+            'ec'         : tangent modulus used [MPa]
+        }
+    """
+    if fpco <= 0:
+        raise ValueError("fpco must be positive.")
+    strain = np.asarray(strain, dtype=float).ravel()
+    ratio = np.atleast_1d(np.asarray(confinement_ratio, dtype=float)).ravel()
+    if np.any(ratio < 0):
+        raise ValueError("Confinement ratios must be non-negative.")
+    if ec is None:
+        ec = 5000.0 * np.sqrt(fpco)
+
+    fpcc = fpco * compute_confined_strength_ratio(ratio)
+    ecc = compute_peak_strain(fpco, fpcc, eco)
+    esec = fpcc / ecc
+    if ec <= max(esec.max(), fpco / eco):
+        raise ValueError("Tangent modulus ec must exceed the secant modulus.")
+
+    confined = compute_mander_stress(strain, fpcc[:, None], ecc[:, None], ec)
+    return {
+        "strain": strain,
+        "confined": confined,
+        "unconfined": compute_unconfined_stress(strain, fpco, eco, ec, esp),
+        "fpcc": fpcc,
+        "ecc": ecc,
+        "esec": esec,
+        "r": ec / (ec - esec),
+        "ec": ec,
+    }
+
+
+def compute_confined_strength_ratio(ratio: float) -> float:
+    """Computes the ratio of confined strength to unconfined strength.
+
+    This ratio is given by (f'cc / f'co) as a function of the lateral
+    confinement stress ratio (fpl / f'co).
+
+    Args:
+        ratio (float): Lateral confinement stress ratio (fpl / f'co).
+
+    Returns:
+        float: Confined strength ratio (f'cc / f'co).
+    """
+    A = 2.254 * np.sqrt(1.0 + 7.92 * ratio)
+    B = 2.0 * ratio
+    return -1.254 + A - B
+
+
+def compute_equation_A(r: float) -> float:
+    """Computes coefficient A based on a confinement stress ratio.
+
+    The expression is drawn from a modified approach to Mander's model, which 
+    accounts for varying lateral confinement stress ratios (fl1 / fl2).
+
+    Args:
+        r (float): The ratio fl1 / fl2 of lateral stresses.
+
+    Returns:
+        float: Coefficient A for subsequent use in calculating the
+            confined strength factor.
+    """
+    return 6.8886 - (0.6069 + (17.275 * r)) * np.exp(-4.989 * r)
+
+
+def compute_equation_B(A: float, r: float) -> float:
+    """Computes coefficient B based on coefficient A and confinement ratio.
+
+    Args:
+        A (float): Coefficient A from `compute_equation_A`.
+        r (float): The ratio fl1 / fl2 of lateral stresses.
+
+    Returns:
+        float: Coefficient B for subsequent use in calculating the
+            confined strength factor.
+    """
+    B2 = ((5.0 / A) * (0.9849 - 0.6306 * np.exp(-3.8939 * r))) - 0.1
+    return (4.5 / B2) - 5.0
+
+
+def compute_confined_strength_factor(A: float, B: float, bar_x: float) -> float:
+    """Computes the confined strength factor K.
+
+    K is a factor that modifies the unconfined strength f'co to reflect 
+    additional confinement. Typically K = (f'cc / f'co).
+
+    Args:
+        A (float): Coefficient A from `compute_equation_A`.
+        B (float): Coefficient B from `compute_equation_B`.
+        bar_x (float): Normalized confining stress (fl / f'co).
+
+    Returns:
+        float: Confined strength factor K = (f'cc / f'co).
+    """
+    return 1.0 + A * bar_x * (0.1 + (0.9 / (1.0 + B * bar_x)))
+
+
+def solver(r: float, xi: float) -> float:
+    """Computes the confined strength factor K for a given ratio r and xi.
+
+    This function combines the above intermediate computations to solve for 
+    the confined strength factor. It is the exact path: r and xi may also be
+    arrays (or lists), which are broadcast against each other.
+
+    Args:
+        r (float): Confinement stress ratio (fl1 / fl2).
+        xi (float): Normalized confinement stress (fl / f'co).
+
+    Returns:
+        float: The confined strength factor K, i.e., f'cc / f'co.
+    """
+    if isinstance(r, (list, tuple)):
+        r = np.asarray(r, dtype=float)
+    if isinstance(xi, (list, tuple)):
+        xi = np.asarray(xi, dtype=float)
+    A_val = compute_equation_A(r)
+    B_val = compute_equation_B(A_val, r)
+    k1 = A_val * (0.1 + 0.9 / (1.0 + B_val * xi))
+    return 1.0 + (k1 * xi)
+
+
+class KFactorTable:
+    """Precomputed table of the K factor coefficients with linear interpolation.
+
+    Only A and B depend on r (through the exponentials); xi enters K
+    algebraically. The table therefore stores A(r) and B(r) on an r grid,
+    interpolates them linearly and evaluates the xi part exactly, which is
+    cheaper than a 2-D (r, xi) lookup. Points with r outside the grid are
+    evaluated exactly with `solver`.
+
+    The table pays off for scalar calls inside loops (about twice as fast as
+    `solver`). For large arrays, NumPy's vectorized exp makes `solver` itself
+    the faster path; arrays are accepted here for consistency with the
+    scalar lookups.
+
+    Error bound: `error_bound` is the largest |table - solver| over the grid
+    cell midpoints in r (where linear interpolation error peaks) for xi up to
+    `xi_max`. For the default grid (r in [0, 1] with 2001 points,
+    xi_max = 0.3) it is about 3e-6, i.e. under 0.0003% of K.
+
+    Args:
+        r_max (float): Upper limit of fl1 / fl2. Defaults to 1.0.
+        xi_max (float): Largest fl / f'co covered by `error_bound`. Defaults to 0.3.
+        n_r (int): Grid points along r. Defaults to 2001.
+    """
+
+    __slots__ = ("r", "a", "b", "error_bound", "_r_list", "_a_list", "_b_list", "_dr")
+
+    def __init__(self, r_max=1.0, xi_max=0.3, n_r=2001):
+        if r_max <= 0 or xi_max <= 0:
+            raise ValueError("r_max and xi_max must be positive.")
+        if n_r < 2:
+            raise ValueError("The grid needs at least 2 points.")
+        self.r = np.linspace(0.0, r_max, n_r)
+        self.a = compute_equation_A(self.r)
+        self.b = compute_equation_B(self.a, self.r)
+        self._dr = r_max / (n_r - 1)
+        self._r_list = self.r.tolist()
+        self._a_list = self.a.tolist()
+        self._b_list = self.b.tolist()
+
+        r_mid = 0.5 * (self.r[1:] + self.r[:-1])
+        xi = np.linspace(0.0, xi_max, 31)[:, None]
+        self.error_bound = float(np.abs(self(r_mid, xi) - solver(r_mid, xi)).max())
+
+    def __call__(self, r, xi):
+        """Interpolated K for r and xi (scalars or broadcastable arrays)."""
+        if isinstance(r, (int, float)) and isinstance(xi, (int, float)):
+            if not 0.0 <= r <= self._r_list[-1]:
+                return float(solver(r, xi))
+            i = min(int(r / self._dr), len(self._r_list) - 2)
+            t = (r - self._r_list[i]) / self._dr
+            a = self._a_list[i] + t * (self._a_list[i + 1] - self._a_list[i])
+            b = self._b_list[i] + t * (self._b_list[i + 1] - self._b_list[i])
+            return 1.0 + a * xi * (0.1 + 0.9 / (1.0 + b * xi))
+
+        r = np.asarray(r, dtype=float)
+        xi = np.asarray(xi, dtype=float)
+        u = np.clip(r, 0.0, self.r[-1]) / self._dr
+        i = np.minimum(u.astype(np.intp), self.r.size - 2)
+        t = u - i
+        a = self.a[i] + t * (self.a[i + 1] - self.a[i])
+        b = self.b[i] + t * (self.b[i + 1] - self.b[i])
+        value = 1.0 + a * xi * (0.1 + 0.9 / (1.0 + b * xi))
+        outside = (r < 0) | (r > self.r[-1])
+        if np.any(outside):
+            value = np.where(outside, solver(r, xi), value)
+        return value
+
+
+@lru_cache(maxsize=8)
+def k_factor_table(r_max=1.0, xi_max=0.3, n_r=2001):
+    """Returns a cached `KFactorTable` for the given grid."""
+    return KFactorTable(r_max, xi_max, n_r)
+
+
+def main() -> None:
+    """Main entry point for executing the script.
+
+    Demonstrates how to use the functions defined above.
+    """
+    # Example usage for a single pair of fpco and fpl
+    fpco_example = 30.0  # MPa, unconfined strength
+    fpl_example = 3.0    # MPa, lateral confinement
+
+    fcc = compute_confined_strength(fpco_example, fpl_example)
+    print(f"Unconfined strength (f'co) = {fpco_example} MPa")
+    print(f"Effective lateral stress (fpl) = {fpl_example} MPa")
+    print(f"Confined strength (f'cc) = {fcc:.2f} MPa")
+
+    # Plot the relationship between confinement ratio and confined strength ratio
+    from concretedesignpy.plotting import plot_confined_strength
+    plot_confined_strength()
+
+
+if __name__ == "__main__":
+    main()
@@ -9,8 +9,11 @@ setup(
     url='https://github.com/albertp16/apec-py',
     packages=find_packages(),
     install_requires=[
-        'matplotlib'
+        'numpy'
     ],
+    extras_require={
+        'plot': ['matplotlib', 'scipy'],
+    },
     classifiers=[
         'Programming Language :: Python :: 3',
         'Operating System :: OS Independent',
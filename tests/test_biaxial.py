@@ -0,0 +1,54 @@
+import numpy as np
+import pytest
+
+from concretedesignpy.general import area_diam
+from concretedesignpy.section.biaxial import _block_integrals, interaction_surface
+from concretedesignpy.section.fiber import STEEL, build_fiber_mesh
+from concretedesignpy.section.geometry import compute_pm_curve
+
+ARGS = (400.0, 600.0, 40.0, 10.0, 20.0, 3, 4, 28.0, 420.0, 200000.0, 0.85)
+CORNERS = np.array([[-200.0, -300.0], [200.0, -300.0], [200.0, 300.0], [-200.0, 300.0]])
+
+
+@pytest.mark.parametrize("theta", [0.0, 0.4, np.pi / 2, 2.2, 3.9])
+def test_block_integrals_match_a_fine_grid(theta):
+    normal = np.array([np.cos(theta), np.sin(theta)])
+    u, v = np.meshgrid(np.linspace(-199.75, 199.75, 800), np.linspace(-299.75, 299.75, 1200))
+    proj = u * normal[0] + v * normal[1]
+    a = np.array([0.0, 80.0, 350.0, 1000.0])
+    area, qu, qv = _block_integrals(CORNERS, normal, a)
+    for k, a_k in enumerate(a):
+        inside = proj.max() + 0.25 * np.abs(normal).sum() - proj < a_k
+        cell = 0.25
+        assert area[k] == pytest.approx(inside.sum() * cell, rel=5e-3, abs=1.0)
+        assert qu[k] == pytest.approx((u * inside).sum() * cell, rel=5e-3, abs=1e3)
+        assert qv[k] == pytest.approx((v * inside).sum() * cell, rel=5e-3, abs=1e3)
+    assert area[-1] == pytest.approx(400.0 * 600.0)
+
+
+def test_uniaxial_slice_matches_pm_curve():
+    surface = interaction_surface(*ARGS, n_angles=4, n_depths=60)
+    P = surface.P[:-2].reshape(4, 60)[1]
+    Mx = surface.Mx[:-2].reshape(4, 60)[1]
+    My = surface.My[:-2].reshape(4, 60)[1]
+
+    mesh = build_fiber_mesh(*ARGS[:7])
+    depth = 600.0 - mesh["y"][mesh["material"] == STEEL]
+    layers, counts = np.unique(depth, return_counts=True)
+    c_max = max(600.0 / 0.85, 0.003 * layers.max() / (0.003 - 420.0 / 200000.0))
+    curve = compute_pm_curve(28.0, 420.0, 400.0, 600.0, 0.85, 200000.0,
+                             counts * area_diam(20.0), layers,
+                             c_values=np.geomspace(6.0, c_max, 60))
+    np.testing.assert_allclose(P, curve["P"], rtol=1e-9, atol=1e-3)
+    np.testing.assert_allclose(Mx, curve["M"], rtol=1e-9, atol=1e-3)
+    np.testing.assert_allclose(My, 0.0, atol=1e-3)
+
+
+def test_axial_load_steps_only_at_bars():
+    surface = interaction_surface(*ARGS, n_angles=12, n_depths=2000)
+    P = surface.P[:-2].reshape(12, 2000)
+    # Concrete is integrated exactly; only the displaced concrete at a bar
+    # row can lower P between neighbouring depths
+    worst_row = 4 * area_diam(20.0) * 0.85 * 28.0
+    assert np.diff(P, axis=1).min() >= -worst_row
+    assert surface.P[-1] == pytest.approx(P.max()) and surface.P[-2] < P.min()
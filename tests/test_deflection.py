@@ -0,0 +1,66 @@
+import numpy as np
+import pytest
+
+from concretedesignpy.beam.deflection import (
+    cracked_section_batch,
+    effective_inertia_batch,
+    long_term_factor,
+    modular_ratio,
+)
+
+DEPTHS = [[540.0]]
+AREAS = [[1500.0]]
+
+
+def test_single_layer_kd_by_hand():
+    b, n, d, a_s = 300.0, 8.0, 540.0, 1500.0
+    result = cracked_section_batch(DEPTHS, AREAS, b, n)
+    # b kd² / 2 = n As (d - kd)
+    kd = (-n * a_s + np.sqrt((n * a_s) ** 2 + 2.0 * b * n * a_s * d)) / b
+    assert result["kd"][0] == pytest.approx(kd)
+    assert result["icr"][0] == pytest.approx(b * kd ** 3 / 3.0 + n * a_s * (d - kd) ** 2)
+    assert not result["compression"].any()
+
+
+def test_compression_layer_uses_n_minus_one():
+    b, n = 300.0, 8.0
+    result = cracked_section_batch([[60.0, 540.0]], [[600.0, 1500.0]], b, n)
+    kd = result["kd"][0]
+    assert result["compression"].tolist() == [[True, False]]
+    moment = b * kd ** 2 / 2.0 + (n - 1.0) * 600.0 * (kd - 60.0) - n * 1500.0 * (540.0 - kd)
+    assert moment == pytest.approx(0.0, abs=1e-6 * b * kd ** 2)
+
+
+@pytest.mark.parametrize("method", ["branson", "bischoff"])
+def test_effective_inertia_limits(method):
+    base = effective_inertia_batch(DEPTHS, AREAS, 300.0, 600.0, 28.0, [1.0], method=method)
+    mcr, ig, icr = base["mcr"][0], base["ig"][0], base["icr"][0]
+    ma = np.array([[0.0, 0.5 * mcr, 2.0 * mcr, 1e4 * mcr]])
+    result = effective_inertia_batch(DEPTHS, AREAS, 300.0, 600.0, 28.0, ma, method=method)
+    ie = result["ie"][0]
+    assert ie[0] == ig and ie[1] == ig
+    assert icr < ie[2] < ig
+    assert ie[3] == pytest.approx(icr, rel=1e-6)
+    assert result["cracked"][0].tolist() == [False, False, True, True]
+    assert np.array_equal(result["cracked"], result["ie"] < result["ig"][:, None])
+
+
+def test_bischoff_cracked_flag_follows_ie():
+    base = effective_inertia_batch(DEPTHS, AREAS, 300.0, 600.0, 28.0, [1.0])
+    ma = base["mcr"][:, None] * np.array([[0.6, 0.8]])
+    result = effective_inertia_batch(DEPTHS, AREAS, 300.0, 600.0, 28.0, ma,
+                                     method="bischoff")
+    assert result["cracked"][0].tolist() == [False, True]
+    assert result["ie"][0, 0] == result["ig"][0] > result["ie"][0, 1]
+
+
+def test_long_term_factor_and_modular_ratio():
+    assert long_term_factor(3) == 1.0
+    assert long_term_factor(6) == 1.2
+    assert long_term_factor(9) == pytest.approx(1.3)
+    assert long_term_factor(60) == 2.0 and long_term_factor(120) == 2.0
+    np.testing.assert_allclose(long_term_factor([6, 12]), [1.2, 1.4])
+    with pytest.raises(ValueError):
+        long_term_factor(2)
+    assert modular_ratio(200000.0, 24870.0) == 9.0
+    assert modular_ratio(200000.0, 40000.0) == 6.0
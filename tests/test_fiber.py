@@ -0,0 +1,31 @@
+import numpy as np
+import pytest
+
+from concretedesignpy.section.fiber import CORE, COVER, STEEL, build_fiber_mesh
+
+
+def test_mesh_areas_and_bars():
+    mesh = build_fiber_mesh(300, 500, 40, 10, 20, 3, 2, n_fibers_x=10, n_fibers_y=20)
+    concrete = mesh["material"] != STEEL
+    assert mesh["area"][concrete].sum() == pytest.approx(300 * 500)
+    assert mesh["n_steel"] == 6 and mesh["n_concrete"] == concrete.sum()
+    np.testing.assert_allclose(mesh["area"][~concrete], np.pi / 4 * 20 ** 2)
+    assert set(np.unique(mesh["material"])) == {COVER, CORE, STEEL}
+
+    x_min, x_max, y_min, y_max = mesh["core_bounds"]
+    core = mesh["material"] == CORE
+    assert np.all((mesh["x"][core] > x_min) & (mesh["x"][core] < x_max))
+    assert np.all((mesh["y"][core] > y_min) & (mesh["y"][core] < y_max))
+
+
+def test_mesh_cached_and_read_only():
+    first = build_fiber_mesh(300, 500, 40, 10, 20, 3, 2)
+    second = build_fiber_mesh(300, 500, 40, 10, 20, 3, 2)
+    assert first["x"] is second["x"]
+    with pytest.raises(ValueError):
+        first["x"][0] = 0.0
+
+
+def test_invalid_core_rejected():
+    with pytest.raises(ValueError):
+        build_fiber_mesh(80, 500, 40, 10, 20, 2, 2)
@@ -0,0 +1,66 @@
+from concurrent.futures import ThreadPoolExecutor
+
+import numpy as np
+import pytest
+
+from concretedesignpy.crfp.flexure import frp_flexure, frp_flexure_batch
+from concretedesignpy.section.material import FRP
+
+CARBON = FRP(3790.0, 0.0167, 227527.0, 0.1651, exposure="interior")
+STIFF = FRP(2800.0, 0.012, 640000.0, 0.5, exposure="exterior")
+BEAM = dict(beam_width=305.0, beam_height=610.0, d=546.0, fc=34.5, fy=414.0)
+
+
+def _force_balance(result, b, as_, af, fc):
+    compression = result["alpha_one"] * fc * result["beta_one"] * b * result["c"]
+    tension = as_ * result["fs"] + af * result["ffe"]
+    return compression, tension
+
+
+def test_equilibrium_at_converged_neutral_axis():
+    result = frp_flexure(as_=1935.0, frp=CARBON, n_plies=3, wf=305.0, **BEAM)
+    af = 3 * CARBON.tf * 305.0
+    compression, tension = _force_balance(result, 305.0, 1935.0, af, 34.5)
+    assert compression == pytest.approx(tension, rel=1e-6)
+    assert result["eps_fe"] <= result["eps_fd"] + 1e-12
+    assert result["mn"] == pytest.approx(result["mns"] + 0.85 * result["mnf"])
+    assert result["phi_mn"] == pytest.approx(result["phi"] * result["mn"])
+
+
+def test_batch_broadcasts_products_and_plies():
+    plies = np.array([1, 2, 3, 4])
+    result = frp_flexure_batch(as_=1935.0, frp=[CARBON, STIFF], n_plies=plies[:, None],
+                               wf=305.0, **BEAM)
+    assert result["mn"].shape == (4, 2)
+    assert result["converged"].all()
+    assert np.all(np.diff(result["mnf"], axis=0) > 0)
+    single = frp_flexure(as_=1935.0, frp=STIFF, n_plies=3, wf=305.0, **BEAM)
+    assert result["mn"][2, 1] == pytest.approx(single["mn"], rel=1e-12)
+
+
+def test_threads_match_batch():
+    areas = np.linspace(800.0, 4000.0, 16)
+    batch = frp_flexure_batch(as_=areas, frp=CARBON, n_plies=2, wf=305.0, **BEAM)
+
+    def one(as_):
+        return frp_flexure(as_=as_, frp=CARBON, n_plies=2, wf=305.0, **BEAM)["mn"]
+
+    with ThreadPoolExecutor(max_workers=4) as pool:
+        threaded = list(pool.map(one, areas.tolist()))
+    np.testing.assert_allclose(threaded, batch["mn"], rtol=1e-12)
+
+
+def test_heavily_reinforced_converges():
+    result = frp_flexure_batch(as_=[6000.0, 9000.0], frp=STIFF, n_plies=6, wf=305.0, **BEAM)
+    assert result["converged"].all()
+    af = 6 * STIFF.tf * 305.0
+    compression, tension = _force_balance(result, 305.0, np.array([6000.0, 9000.0]), af, 34.5)
+    np.testing.assert_allclose(compression, tension, rtol=1e-6)
+    assert np.all(result["phi"] < 0.9)
+
+
+def test_scalar_wrapper_rejects_sequences():
+    with pytest.raises(ValueError):
+        frp_flexure(as_=1935.0, frp=[CARBON], n_plies=1, wf=305.0, **BEAM)
+    with pytest.raises(ValueError):
+        frp_flexure_batch(as_=1935.0, frp=[], n_plies=1, wf=305.0, **BEAM)
@@ -0,0 +1,55 @@
+import io
+
+import numpy as np
+import pytest
+
+from concretedesignpy.ingest import envelope, read_table_chunks
+
+
+def test_bool_column_parses_text():
+    source = io.StringIO("flag,value\nFalse,1.5\n0,2.5\ntrue,3.5\nYES,4\nno,5\n")
+    (batch,) = read_table_chunks(source, columns={"flag": "bool", "value": "float"})
+    assert batch["flag"].tolist() == [False, False, True, True, False]
+    np.testing.assert_allclose(batch["value"], [1.5, 2.5, 3.5, 4.0, 5.0])
+
+
+def test_bool_column_rejects_unknown_text():
+    source = io.StringIO("flag\nTrue\nmaybe\n")
+    with pytest.raises(ValueError, match="flag"):
+        list(read_table_chunks(source, columns={"flag": "bool"}))
+
+
+def test_jsonl_booleans_kept():
+    source = io.StringIO('{"flag": false}\n{"flag": true}\n\n{"flag": "0"}\n')
+    (batch,) = read_table_chunks(source, columns={"flag": "bool"}, format="jsonl")
+    assert batch["flag"].tolist() == [False, True, False]
+
+
+def test_blank_rows_counted_in_error_lines():
+    source = io.StringIO("a,b\n1,2\n\n\n3\n")
+    with pytest.raises(ValueError, match="and 5"):
+        list(read_table_chunks(source, columns={"a": "float", "b": "float"}))
+
+
+def test_chunks_rename_and_scale():
+    source = io.StringIO("Frame,M3\nkN-m units,\nB1,1\nB2,2\nB3,3\n")
+    batches = list(read_table_chunks(source, columns={"Frame": "str", "M3": "float"},
+                                     chunk_size=2, skip_after_header=1,
+                                     rename={"Frame": "member", "M3": "mu"},
+                                     scale={"mu": 1e6}))
+    assert [b["member"].tolist() for b in batches] == [["B1", "B2"], ["B3"]]
+    np.testing.assert_allclose(np.concatenate([b["mu"] for b in batches]), [1e6, 2e6, 3e6])
+
+
+def test_envelope_across_chunk_boundaries():
+    rng = np.random.default_rng(1)
+    keys = rng.choice(["B1", "B2", "B3", "B4"], size=200)
+    values = rng.normal(size=200)
+    rows = "".join(f"{k},{float(v)!r}\n" for k, v in zip(keys, values))
+    batches = read_table_chunks(io.StringIO("member,mu\n" + rows),
+                                columns={"member": "str", "mu": "float"}, chunk_size=7)
+    env = envelope(batches, "member", ["mu"])
+    assert env["member"].tolist() == ["B1", "B2", "B3", "B4"]
+    for key, value in zip(env["member"], env["mu"]):
+        group = values[keys == key]
+        assert value == group[np.argmax(np.abs(group))]
@@ -0,0 +1,76 @@
+import numpy as np
+import pytest
+
+from concretedesignpy.stress_strain.manders import (
+    compute_confined_strength_ratio,
+    compute_mander_stress,
+    compute_peak_strain,
+    k_factor_table,
+    mander_curves,
+    solver,
+)
+
+STRAIN = np.linspace(-0.001, 0.02, 400)
+
+
+def test_confined_rows_match_scalar_model():
+    ratios = [0.0, 0.05, 0.15]
+    curves = mander_curves(STRAIN, 28.0, ratios)
+    ec = 5000.0 * np.sqrt(28.0)
+    assert curves["confined"].shape == (3, STRAIN.size)
+    for row, ratio in zip(curves["confined"], ratios):
+        fpcc = 28.0 * compute_confined_strength_ratio(ratio)
+        ecc = compute_peak_strain(28.0, fpcc)
+        np.testing.assert_allclose(row, compute_mander_stress(STRAIN, fpcc, ecc, ec))
+    np.testing.assert_allclose(curves["fpcc"], 28.0 * compute_confined_strength_ratio(
+        np.array(ratios)))
+    assert curves["fpcc"][0] == pytest.approx(28.0)
+    # Peak of each confined curve at ecc, equal to f'cc
+    peak = compute_mander_stress(curves["ecc"], curves["fpcc"], curves["ecc"], ec)
+    np.testing.assert_allclose(peak, curves["fpcc"])
+
+
+def test_unconfined_spalls_and_ignores_tension():
+    curves = mander_curves(STRAIN, 28.0, 0.1, esp=0.005)
+    unconfined = curves["unconfined"]
+    assert np.all(unconfined[STRAIN > 0.005] == 0.0)
+    assert np.all(unconfined[STRAIN <= 0.0] == 0.0)
+    assert np.all(curves["confined"][:, STRAIN <= 0.0] == 0.0)
+    assert unconfined.max() == pytest.approx(28.0, rel=1e-3)
+
+
+def test_invalid_inputs_rejected():
+    with pytest.raises(ValueError):
+        mander_curves(STRAIN, 28.0, [-0.1])
+    with pytest.raises(ValueError):
+        mander_curves(STRAIN, 28.0, 0.1, esp=0.003)
+    with pytest.raises(ValueError):
+        mander_curves(STRAIN, 28.0, 0.1, ec=1000.0)
+
+
+def test_k_table_within_error_bound():
+    table = k_factor_table()
+    rng = np.random.default_rng(3)
+    r = rng.uniform(0.0, 1.0, 5000)
+    xi = rng.uniform(0.0, 0.3, 5000)
+    error = np.abs(table(r, xi) - solver(r, xi))
+    assert 0.0 < table.error_bound < 1e-5
+    assert error.max() <= table.error_bound * (1.0 + 1e-9)
+    np.testing.assert_allclose(table(table.r, 0.2), solver(table.r, 0.2), rtol=1e-12)
+
+
+def test_k_table_scalar_path_matches_array_path():
+    table = k_factor_table()
+    for r, xi in [(0.0, 0.1), (0.3217, 0.05), (1.0, 0.3), (0.99999, 0.25)]:
+        scalar = table(r, xi)
+        assert isinstance(scalar, float)
+        assert scalar == pytest.approx(float(table(np.array(r), np.array(xi))), rel=1e-14)
+
+
+def test_k_table_outside_grid_uses_solver():
+    table = k_factor_table()
+    assert table(1.5, 0.2) == solver(1.5, 0.2)
+    r = np.array([-0.2, 0.5, 1.4])
+    values = table(r, 0.2)
+    assert values[0] == solver(-0.2, 0.2) and values[2] == solver(1.4, 0.2)
+    assert k_factor_table() is table
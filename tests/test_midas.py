@@ -0,0 +1,74 @@
+import io
+
+import numpy as np
+import pytest
+
+from concretedesignpy.midas import (
+    MGTWriter,
+    fiber_table,
+    mander_concrete_data,
+    rebar_material_data,
+)
+from concretedesignpy.section.fiber import STEEL, build_fiber_mesh
+
+# Layout supplied by the caller; names here are test placeholders
+LAYOUT = {
+    "*MAT": ("Materials", "iMAT, NAME, KIND, VALUES"),
+    "*SEC": ("Sections", "iSEC, NAME, NFIBER"),
+}
+
+
+def _write(**mesh_args):
+    buf = io.StringIO()
+    with MGTWriter(buf, commands=LAYOUT) as mgt:
+        steel = mgt.define("*MAT", "Gr60", ("S", *rebar_material_data(414.0, 620.0)))
+        core = mgt.define("*MAT", "C28-core", ("C", *mander_concrete_data(28.0, fpl=2.1)))
+        cover = mgt.define("*MAT", "C28-cover", ("C", *mander_concrete_data(28.0)))
+        again = mgt.define("*MAT", "Gr60-copy", ("S", *rebar_material_data(414.0, 620.0)))
+        mesh = build_fiber_mesh(400, 600, 40, 10, 20, 3, 4, **mesh_args)
+        fibers = fiber_table(mesh, cover, core, steel)
+        first = mgt.fiber_section("*SEC", "*FIB", "1C1", fibers)
+        second = mgt.fiber_section("*SEC", "*FIB", "1C1-copy", fibers)
+    return buf.getvalue(), mgt, (steel, core, cover, again, first, second), mesh
+
+
+def test_material_values_match_notebook_units():
+    # rebarInelasMat: stresses MPa -> kPa, Es given in GPa -> kPa
+    assert rebar_material_data(414.0, 450.0, es=200000.0, multiplier=1.25) == (
+        414.0 * 1000.0 * 1.25, 450.0 * 1000.0 * 1.25, 200.0 * 1e6 * 1.25, 0.015, 0.12)
+    fco, eco, fcc, ecc, ecu, ec = mander_concrete_data(28.0)
+    assert fcc == fco == 28000.0 and ecc == eco
+    assert ec == pytest.approx(5000.0 * np.sqrt(28.0) * 1000.0)
+    with pytest.raises(ValueError):
+        rebar_material_data(414.0, 400.0)
+
+
+def test_definitions_share_ids_and_deduplicate():
+    text, mgt, (steel, core, cover, again, *_), _ = _write()
+    assert (steel, core, cover) == (1, 2, 3)
+    assert again == steel
+    assert mgt.written["*MAT"] == 3
+    assert "Gr60-copy" not in text
+    assert "\n*MAT    ; Materials\n; iMAT, NAME, KIND, VALUES\n" in text
+    assert text.count("\n*MAT") == 1
+
+
+def test_fiber_section_written_once():
+    text, mgt, (*_, first, second), mesh = _write(n_fibers_x=4, n_fibers_y=6)
+    assert first == second == 1
+    assert mgt.written["*SEC"] == 1
+    assert mgt.written["*FIB"] == mesh["x"].size
+    assert mgt.reused == 2
+
+    lines = text.splitlines()
+    start = lines.index("*FIB")
+    rows = lines[start + 1:start + 1 + mesh["x"].size]
+    fibers = np.array([[float(v) for v in row.split(",")] for row in rows])
+    np.testing.assert_array_equal(fibers[:, 1], np.arange(1, mesh["x"].size + 1))
+    np.testing.assert_allclose(fibers[:, 4].sum(), mesh["area"].sum() * 1e-6)
+    np.testing.assert_array_equal(fibers[mesh["material"] == STEEL, 5], 1.0)
+
+
+def test_commands_must_start_with_star():
+    with pytest.raises(ValueError):
+        MGTWriter(io.StringIO()).define("MAT", "x", (1.0,))
@@ -0,0 +1,64 @@
+import json
+
+import numpy as np
+import pytest
+
+from concretedesignpy.beam.moment_capacity import (
+    SolverTrace,
+    calculate_rebar_forces,
+    calculate_rebar_forces_batch,
+    pack_rebar_layers,
+)
+
+ARGS = dict(beam_height=600.0, beam_width=300.0, fc=28.0, fy=420.0,
+            es=200000.0, ecu=0.003, beta_one=0.85)
+REBAR = [{"d": 60.0, "as": 402.0}, {"d": 540.0, "as": 1520.0}]
+
+
+def test_full_trace_is_a_solver_trace():
+    result = calculate_rebar_forces(REBAR, **ARGS)
+    trace = result["iteration_data"]
+    assert isinstance(trace, SolverTrace) and len(trace) == result["evaluations"]
+    records = trace.to_records()
+    assert records == list(trace) and trace[-2:] == records[-2:]
+    json.dumps(records)
+    assert {"x", "fci_kN", "ratio"} <= set(trace[0])
+
+    columns = trace.as_arrays()
+    np.testing.assert_allclose(columns["x"], [row["x"] for row in records])
+    np.testing.assert_allclose(columns["fs_rebar"] / 1000.0,
+                               [row["fs_rebar_kN"] for row in records])
+    assert result["neutral_axis"] in columns["x"]
+
+
+@pytest.mark.parametrize("solver", ["linear", "bisection", "brent"])
+def test_summary_residual_at_returned_neutral_axis(solver):
+    result = calculate_rebar_forces(REBAR, solver=solver, trace="summary", **ARGS)
+    compression = result["fc_concrete"] + result["fc_rebar"]
+    assert result["iteration_data"]["residual"] == pytest.approx(
+        compression - result["fs_rebar"], abs=1e-6)
+
+
+def test_batch_matches_scalar():
+    rebar_lists = [
+        REBAR,
+        [{"d": 540.0, "as": 2000.0}],
+        [{"d": 50.0, "as": 600.0}, {"d": 480.0, "as": 1000.0}, {"d": 540.0, "as": 1000.0}],
+    ]
+    depths, areas = pack_rebar_layers(rebar_lists)
+    batch = calculate_rebar_forces_batch(depths, areas, tol=1e-6, **ARGS)
+    for i, bars in enumerate(rebar_lists):
+        scalar = calculate_rebar_forces(bars, solver="brent", tol=1e-6, trace="off", **ARGS)
+        assert batch["converged"][i]
+        assert batch["neutral_axis"][i] == pytest.approx(scalar["neutral_axis"], abs=1e-4)
+        assert batch["fs_rebar"][i] == pytest.approx(scalar["fs_rebar"], rel=1e-6)
+    np.testing.assert_allclose(
+        batch["fc_concrete"] + batch["fc_rebar"], batch["fs_rebar"], rtol=1e-5)
+
+
+@pytest.mark.parametrize("solver", ["linear", "bisection", "brent"])
+def test_iteration_cap_must_allow_one_step(solver):
+    with pytest.raises(ValueError):
+        calculate_rebar_forces(REBAR, solver=solver, max_outer_iterations=0, **ARGS)
+    result = calculate_rebar_forces(REBAR, solver=solver, max_outer_iterations=1, **ARGS)
+    assert result["evaluations"] >= 1
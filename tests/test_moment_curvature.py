@@ -0,0 +1,61 @@
+import numpy as np
+import pytest
+
+from concretedesignpy.beam.deflection import cracked_section_batch
+from concretedesignpy.section.fiber import CORE, STEEL, build_fiber_mesh
+from concretedesignpy.section.moment_curvature import moment_curvature
+
+
+def _mesh():
+    return build_fiber_mesh(300, 500, 40, 10, 20, 3, 2)
+
+
+def test_initial_stiffness_matches_cracked_section():
+    mesh = _mesh()
+    curvatures = np.geomspace(1e-7, 1e-4, 40)
+    result = moment_curvature(mesh, 28.0, 420.0, 200000.0, 0.0, curvatures)
+    assert result["converged"].all() and result["termination"] == "completed"
+
+    ec = 5000.0 * np.sqrt(28.0)
+    steel = mesh["material"] == STEEL
+    depth = mesh["height"] - mesh["y"][steel]
+    layers = np.unique(depth)
+    areas = np.array([mesh["area"][steel][depth == d].sum() for d in layers])
+    cracked = cracked_section_batch(layers[None], areas[None], 300.0, 200000.0 / ec)
+    assert result["moment"][0] / curvatures[0] == pytest.approx(ec * cracked["icr"][0], rel=0.01)
+    assert result["neutral_axis"][0] == pytest.approx(cracked["kd"][0], rel=0.02)
+
+
+def test_moment_rises_then_stops_at_ecu():
+    mesh = _mesh()
+    curvatures = np.linspace(1e-6, 1e-3, 200)
+    result = moment_curvature(mesh, 28.0, 420.0, 200000.0, 1.0, curvatures, ecu=0.01)
+    assert result["converged"].all()
+    assert result["moment"][1] > result["moment"][0] > 0
+    n_done = result["curvature"].size
+    assert 0 < n_done < curvatures.size and result["termination"] == "ecu"
+    # The first step dropped is the one whose core strain exceeds ecu
+    core = mesh["material"] == CORE
+    y_top = mesh["height"] - mesh["y"][core]
+    strain = result["curvature"][-1] * (result["neutral_axis"][-1] - y_top)
+    assert strain.max() <= 0.01
+
+
+def test_axial_load_raises_capacity():
+    curvatures = np.geomspace(1e-6, 2e-5, 20)
+    plain = moment_curvature(_mesh(), 28.0, 420.0, 200000.0, 1.0, curvatures)
+    loaded = moment_curvature(_mesh(), 28.0, 420.0, 200000.0, 1.0, curvatures,
+                              axial_load=500e3)
+    assert loaded["converged"].all()
+    assert np.all(loaded["neutral_axis"] > plain["neutral_axis"])
+
+
+def test_failed_bracket_is_reported():
+    # Axial load above the squash load: no neutral axis balances it
+    curvatures = np.geomspace(1e-6, 1e-4, 10)
+    result = moment_curvature(_mesh(), 28.0, 420.0, 200000.0, 1.0, curvatures,
+                              axial_load=1e8)
+    assert result["termination"] == "no_bracket"
+    assert result["curvature"].tolist() == [curvatures[0]]
+    assert not result["converged"][-1]
+    assert np.isnan(result["moment"][-1]) and np.isnan(result["neutral_axis"][-1])
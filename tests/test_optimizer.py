@@ -0,0 +1,55 @@
+import numpy as np
+import pytest
+
+from concretedesignpy.beam.moment_capacity import calculate_rebar_forces_batch
+from concretedesignpy.beam.optimizer import (
+    STEEL_DENSITY,
+    _candidate_grid,
+    optimize_beam_reinforcement,
+)
+from concretedesignpy.provision import calculate_strength_reduction_factor
+from concretedesignpy.section.material import Concrete
+
+
+def _brute_force(mu, b, heights, fc, fy, cover=40.0, ds=10.0, max_layers=2,
+                 diameters=(16.0, 20.0, 25.0, 32.0)):
+    """Cheapest feasible layout over every candidate, without any pruning."""
+    h, db, n, layers = _candidate_grid(b, np.atleast_1d(heights), np.array(diameters),
+                                       max_layers, cover, ds, 25.0, 20.0)
+    d_t = h - cover - ds - 0.5 * db
+    pitch = db + np.maximum(25.0, db)
+    k = np.arange(max_layers)
+    used = k[None, :] < layers[:, None]
+    depths = np.where(used, d_t[:, None] - k[None, :] * pitch[:, None], 0.0)
+    areas = np.where(used, (np.pi / 4.0 * db ** 2 * n)[:, None], 0.0)
+    result = calculate_rebar_forces_batch(depths, areas, h, b, fc, fy, 200000.0, 0.003,
+                                          Concrete(fc).beta_one)
+    eps_t = np.nan_to_num(result["eps_t"], nan=0.0)
+    phi = calculate_strength_reduction_factor(np.maximum(eps_t, 0.0), fy / 200000.0, "others")
+    d_centroid = (depths * areas).sum(axis=1) / areas.sum(axis=1)
+    as_min = max(0.25 * np.sqrt(fc), 1.4) / fy * b * d_centroid
+    ok = (result["converged"] & (eps_t >= 0.004) & (phi * result["moment"] >= mu)
+          & (areas.sum(axis=1) >= as_min)
+          & (depths[np.arange(h.size), layers - 1] > cover + ds + 0.5 * db))
+    cost = STEEL_DENSITY * areas.sum(axis=1) * 1000.0
+    return cost[ok].min() if ok.any() else None
+
+
+@pytest.mark.parametrize("height, mu", [
+    (600.0, 150e6), (600.0, 400e6), (600.0, 700e6),
+    (280.0, 60e6), (280.0, 110e6), (700.0, 50e6),
+])
+def test_matches_brute_force(height, mu):
+    # Shallow sections have inner layers below yield at c_max, where a bound
+    # taking every layer at fy would drop ductile layouts
+    diameters = (16.0, 20.0, 25.0, 32.0)
+    result = optimize_beam_reinforcement(mu, 300.0, height, 28.0, 420.0,
+                                         diameters=diameters)
+    expected = _brute_force(mu, 300.0, height, 28.0, 420.0, diameters=diameters)
+    if expected is None:
+        assert not result["ok"]
+    else:
+        assert result["ok"]
+        assert result["layout"]["cost"] == pytest.approx(expected)
+        assert result["layout"]["phi_mn"] >= mu
+        assert result["layout"]["eps_t"] >= 0.004
@@ -0,0 +1,51 @@
+import numpy as np
+
+from concretedesignpy.provision import calculate_strength_reduction_factor
+from concretedesignpy.section.geometry import (
+    calculate_po,
+    calculate_pt,
+    calculate_steel_layer_forces,
+    compute_pm_curve,
+)
+
+D_LIST = [75.0, 200.0, 400.0, 525.0]
+AS_LIST = [2580.0, 1290.0, 1290.0, 2580.0]
+
+
+def _curve(**kwargs):
+    return compute_pm_curve(30.0, 420.0, 600.0, 600.0, 0.85, 200000.0,
+                            AS_LIST, D_LIST, **kwargs)
+
+
+def test_curve_closed_at_pt_and_po():
+    curve = _curve()
+    assert curve["P"][0] == -calculate_pt(420.0, AS_LIST)
+    np.testing.assert_allclose(curve["P"][-1], calculate_po(30.0, 420.0, 600.0, 600.0, AS_LIST))
+    np.testing.assert_allclose(curve["M"][[0, -1]], 0.0, atol=1e-6)
+
+
+def test_displaced_concrete_switches_on_inside_block():
+    c = np.linspace(1.0, 1000.0, 20001)
+    curve = _curve(c_values=c)
+    # P only drops where the block a = 0.85 c reaches a layer, by 0.85 f'c As
+    steps = np.diff(curve["P"])
+    drops = np.flatnonzero(steps < -1e-6)
+    assert drops.size == len(D_LIST)
+    np.testing.assert_allclose(0.85 * c[drops + 1], D_LIST, atol=0.85 * (c[1] - c[0]))
+    assert np.all(steps[drops] >= -0.85 * 30.0 * np.array(AS_LIST))
+
+
+def test_layer_forces_helper():
+    fs = np.array([400.0, 100.0, -420.0])
+    forces = calculate_steel_layer_forces(np.array([100.0, 100.0, 100.0]), fs,
+                                          np.array([50.0, 150.0, 500.0]), 120.0, 30.0)
+    np.testing.assert_allclose(forces, [100.0 * (400.0 - 25.5), 100.0 * 100.0, -42000.0])
+
+
+def test_phi_is_strength_reduction_factor():
+    curve = _curve()
+    expected = calculate_strength_reduction_factor(
+        np.maximum(curve["eps_t"], 0.0), 420.0 / 200000.0, "others")
+    np.testing.assert_array_equal(curve["phi"], expected)
+    assert curve["phi"][0] == 0.9 and curve["phi"][-1] == 0.65
+    np.testing.assert_allclose(curve["curvature"][1:-1], 0.003 / curve["c"][1:-1])
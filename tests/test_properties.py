@@ -0,0 +1,79 @@
+import numpy as np
+import pytest
+
+from concretedesignpy.section.geometry import compute_section_properties_rect
+from concretedesignpy.section.properties import (
+    hollow_rectangle,
+    l_section,
+    rectangle,
+    section_properties,
+    t_section,
+)
+
+
+def test_rectangle_matches_closed_form():
+    props = section_properties(rectangle(300.0, 500.0))
+    rect = compute_section_properties_rect(300.0, 500.0)
+    assert props["area"] == pytest.approx(rect["area"])
+    assert props["first_moment"]["x"] == pytest.approx(rect["first_moment"]["x"])
+    assert props["first_moment"]["y"] == pytest.approx(rect["first_moment"]["y"])
+    assert props["moment_inertia"]["x"] == pytest.approx(rect["moment_interia"]["x"])
+    assert props["moment_inertia"]["y"] == pytest.approx(rect["moment_interia"]["y"])
+    assert props["moment_inertia"]["xy"] == pytest.approx(0.0, abs=1e-3)
+    assert props["section_modulus"]["x_top"] == pytest.approx(rect["section_modulus"]["x"])
+    assert props["section_modulus"]["y_left"] == pytest.approx(rect["section_modulus"]["y"])
+    assert props["radius_gyration"]["x"] == pytest.approx(rect["radius_gyration"]["x"])
+
+
+def test_hollow_rectangle_is_outer_minus_inner():
+    props = section_properties(hollow_rectangle(600.0, 800.0, 100.0, 150.0))
+    outer = compute_section_properties_rect(600.0, 800.0)
+    inner = compute_section_properties_rect(400.0, 500.0)
+    assert props["area"] == pytest.approx(outer["area"] - inner["area"])
+    assert props["moment_inertia"]["x"] == pytest.approx(
+        outer["moment_interia"]["x"] - inner["moment_interia"]["x"])
+    assert props["moment_inertia"]["y"] == pytest.approx(
+        outer["moment_interia"]["y"] - inner["moment_interia"]["y"])
+    assert props["centroid"]["x"] == pytest.approx(300.0)
+    assert props["centroid"]["y"] == pytest.approx(400.0)
+
+
+def test_t_section_by_hand():
+    # Flange 800 x 120 over a 300 x 480 web
+    props = section_properties(t_section(800.0, 120.0, 300.0, 600.0))
+    a_f, a_w = 800.0 * 120.0, 300.0 * 480.0
+    y_bar = (a_f * 540.0 + a_w * 240.0) / (a_f + a_w)
+    ix = (800.0 * 120.0 ** 3 / 12.0 + a_f * (540.0 - y_bar) ** 2
+          + 300.0 * 480.0 ** 3 / 12.0 + a_w * (240.0 - y_bar) ** 2)
+    assert props["area"] == pytest.approx(a_f + a_w)
+    assert props["centroid"]["y"] == pytest.approx(y_bar)
+    assert props["centroid"]["x"] == pytest.approx(400.0)
+    assert props["moment_inertia"]["x"] == pytest.approx(ix)
+    assert props["section_modulus"]["x_bottom"] == pytest.approx(ix / y_bar)
+
+
+def test_batch_matches_single_and_principal_axes():
+    shapes = [rectangle(300.0, 500.0), l_section(200.0, 300.0, 30.0, 40.0)]
+    batch = section_properties(shapes)
+    for i, shape in enumerate(shapes):
+        single = section_properties(shape)
+        assert batch["area"][i] == pytest.approx(single["area"])
+        assert batch["moment_inertia"]["xy"][i] == pytest.approx(
+            single["moment_inertia"]["xy"], abs=1e-3)
+    principal = batch["principal"]
+    inertia = batch["moment_inertia"]
+    np.testing.assert_allclose(principal["major"] + principal["minor"],
+                               inertia["x"] + inertia["y"])
+    assert batch["moment_inertia"]["xy"][1] != pytest.approx(0.0)
+
+
+def test_transformed_section_adds_bars():
+    bars = [(60.0, 60.0), (240.0, 60.0)]
+    props = section_properties(rectangle(300.0, 500.0), rebar_coords=bars,
+                               rebar_area=[500.0, 500.0], modular_ratio=8.0)
+    added = 7.0 * 1000.0
+    assert props["area"] == pytest.approx(150000.0 + added)
+    assert props["centroid"]["y"] == pytest.approx(
+        (150000.0 * 250.0 + added * 60.0) / (150000.0 + added))
+    with pytest.raises(ValueError):
+        section_properties(rectangle(300.0, 500.0), rebar_coords=bars)
@@ -0,0 +1,46 @@
+import numpy as np
+import pytest
+
+from concretedesignpy.runner import check_member, run_members
+from concretedesignpy.section.geometry import calculate_po, calculate_pt
+
+
+def _column(pu, mu=0.0):
+    return {"id": "C1", "type": "column", "b": 400.0, "h": 400.0, "fc": 28.0,
+            "fy": 420.0, "rebar": [{"d": 60, "diam": 25, "num": 3},
+                                   {"d": 340, "diam": 25, "num": 3}],
+            "pu": pu, "mu": mu}
+
+
+def _beam(mu, **extra):
+    return {"id": "B1", "type": "beam", "b": 300.0, "h": 600.0, "fc": 28.0,
+            "fy": 420.0, "rebar": [{"d": 540, "diam": 20, "num": 4}], "mu": mu, **extra}
+
+
+AS_COLUMN = [3 * np.pi / 4 * 25.0 ** 2] * 2
+
+
+def test_column_near_pure_tension_interpolates():
+    pt = calculate_pt(420.0, AS_COLUMN)
+    pm = check_member(_column(-0.9 * 0.95 * pt))["checks"]["pm"]
+    assert pm["phi_mn"] > 0
+    assert check_member(_column(-1.01 * 0.9 * pt))["checks"]["pm"]["phi_mn"] == 0.0
+
+
+def test_column_plateau_gives_largest_moment():
+    po = calculate_po(28.0, 420.0, 400.0, 400.0, AS_COLUMN)
+    cap = 0.80 * 0.65 * po
+    at_cap = check_member(_column(cap))["checks"]["pm"]
+    below = check_member(_column(0.95 * cap))["checks"]["pm"]
+    assert at_cap["phi_pn_max"] == pytest.approx(cap)
+    assert at_cap["phi_mn"] > 0 and below["phi_mn"] > at_cap["phi_mn"]
+    assert check_member(_column(1.01 * cap))["checks"]["pm"]["ok"] is False
+
+
+def test_run_members_ordered_with_isolated_errors():
+    members = [_beam(100e6), {"type": "slab"}, _column(500e3, 50e6), _beam(1e12)]
+    results = list(run_members(members, max_workers=1, chunk_size=2))
+    assert [r["index"] for r in results] == [0, 1, 2, 3]
+    assert results[0]["passed"] and results[2]["passed"]
+    assert not results[1]["ok"] and "type" in results[1]["error"]
+    assert results[3]["ok"] and not results[3]["passed"]
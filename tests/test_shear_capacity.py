@@ -0,0 +1,46 @@
+import numpy as np
+
+from concretedesignpy.beam.shear_capacity import check_hoops, design_stirrup_spacing
+
+
+def test_governing_rule_over_spacing_limits_only():
+    # First hoop badly placed, spacing governed by 6 * db = 96 mm
+    result = check_hoops(first_hoop_loc=[200.0, 40.0], depth=500.0, db=16.0, ds=10.0,
+                         hoop_spacing=[90.0, 120.0])
+    assert result["governing_rule"].tolist() == ["max_hoop_spacing", "max_hoop_spacing"]
+    np.testing.assert_allclose(result["governing_limit"], [96.0, 96.0])
+    np.testing.assert_allclose(result["utilisation"], [90.0 / 96.0, 120.0 / 96.0])
+    assert result["ok"].tolist() == [False, False]
+    assert result["first_hoop"]["ok"].tolist() == [False, True]
+
+
+def test_design_spacing_respects_section_limit_and_av_min():
+    b, d, fc, fyt = 300.0, 500.0, 28.0, 420.0
+    vc = np.sqrt(fc) / 6.0 * b * d
+    vs_max = 0.66 * np.sqrt(fc) * b * d
+    vu = np.array([0.75 * (vc + 0.5 * vs_max), 0.75 * (vc + 1.1 * vs_max)])
+    result = design_stirrup_spacing(b, d, fc, fyt, vu, av=[157.0], ds=[10.0], db=20.0)
+    assert result["section_ok"].tolist() == [True, False]
+    assert result["ok"].tolist() == [True, False]
+    assert np.isnan(result["spacing"][1])
+    assert result["phi_vn"][0] >= vu[0]
+
+    # Light shear above 0.5 phi Vc: Av,min = 50 mm² limits s to 200 mm, not d / 2
+    av_min_per_s = max(0.062 * np.sqrt(fc), 0.35) * b / fyt
+    light = design_stirrup_spacing(b, d, fc, fyt, 0.8 * 0.75 * vc, av=[50.0], ds=[10.0], db=20.0)
+    np.testing.assert_allclose(light["av_min_per_s"], av_min_per_s)
+    assert light["spacing"][0] == 200.0
+    none = design_stirrup_spacing(b, d, fc, fyt, 0.4 * 0.75 * vc, av=[50.0], ds=[10.0], db=20.0)
+    assert none["av_min_per_s"][0] == 0.0 and none["spacing"][0] == 250.0
+
+
+def test_spacing_limit_halved_for_high_vs():
+    # Vs needed ~390 kN > 0.33 sqrt(f'c) b d = 283 kN, so s <= d / 4 = 135 mm
+    b, d, fc, fyt = 300.0, 540.0, 28.0, 420.0
+    result = design_stirrup_spacing(b, d, fc, fyt, [400e3], [452.0], [12.0], 20.0)
+    assert result["spacing"][0] == 125.0
+    assert result["vs"][0] > 0.33 * np.sqrt(fc) * b * d
+    # Lighter shear with smaller stirrups: Vs stays below the threshold, d / 2 applies
+    light = design_stirrup_spacing(b, d, fc, fyt, [200e3], [157.0], [10.0], 20.0)
+    assert light["vs"][0] <= 0.33 * np.sqrt(fc) * b * d
+    assert light["spacing"][0] == 250.0